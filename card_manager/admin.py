@@ -1,10 +1,18 @@
 from django.contrib import admin
 from django.contrib.admin import ModelAdmin
 from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import OuterRef, QuerySet, Subquery
 from django.urls import reverse
 from django.utils.html import format_html
 
-from .models import Card, Deck, ShowCardDailyStat
+from .models import (
+    Card,
+    Deck,
+    DeckReviewRollup,
+    RollupPeriod,
+    ShowCardDailyStat,
+    UserReviewRollup,
+)
 
 
 @admin.register(Deck)
@@ -85,14 +93,17 @@ class CardAdmin(ModelAdmin):
 class ShowCardDailyStatAdmin(ModelAdmin):
     """Representation for daily card learning statistics.
 
-    Displays per-user daily counts, with filtering by user and date,
-    and search by username.
+    Displays per-user daily counts next to the day's reviews, with filtering by
+    user and date, and search by username. Reviews are read from the daily user
+    rollup, never from the review event log.
     """
 
     list_display = (
         "user",
         "date",
         "count",
+        "reviews",
+        "correct",
     )
     list_filter = (
         "user",
@@ -100,3 +111,55 @@ class ShowCardDailyStatAdmin(ModelAdmin):
     )
     search_fields = ("user__username",)
     date_hierarchy = "date"
+
+    def get_queryset(self, request) -> QuerySet:
+        rollup = UserReviewRollup.objects.filter(
+            user=OuterRef("user"), period=RollupPeriod.DAY, start=OuterRef("date")
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                reviews=Subquery(rollup.values("reviews")[:1]),
+                correct=Subquery(rollup.values("correct")[:1]),
+            )
+        )
+
+    @admin.display(description="reviews", ordering="reviews")
+    def reviews(self, obj: ShowCardDailyStat) -> int:
+        """Reviews answered by the user that day."""
+        return obj.reviews or 0
+
+    @admin.display(description="correct", ordering="correct")
+    def correct(self, obj: ShowCardDailyStat) -> int:
+        """Reviews answered with quality 3 or more that day."""
+        return obj.correct or 0
+
+
+class ReviewRollupAdmin(ModelAdmin):
+    """Read-only representation of review rollups, maintained by the review log."""
+
+    date_hierarchy = "start"
+    list_filter = ("period",)
+
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    def has_change_permission(self, request, obj=None) -> bool:
+        return False
+
+
+@admin.register(UserReviewRollup)
+class UserReviewRollupAdmin(ReviewRollupAdmin):
+    """Review totals per user and day, week or month."""
+
+    list_display = ("user", "period", "start", "reviews", "correct", "timed_reviews")
+    search_fields = ("user__username",)
+
+
+@admin.register(DeckReviewRollup)
+class DeckReviewRollupAdmin(ReviewRollupAdmin):
+    """Review totals per deck and day, week or month."""
+
+    list_display = ("deck", "period", "start", "reviews", "correct", "timed_reviews")
+    search_fields = ("deck__deck_name", "deck__user__username")
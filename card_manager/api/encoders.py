@@ -0,0 +1,68 @@
+"""
+Encoders for read-only list endpoints that work on `values()` rows.
+
+The list views used to load full model instances and run a ModelSerializer over
+every row. An encoder instead takes the dict rows of a `values()` queryset and
+converts only the fields that need it, through the same DRF field classes the
+serializers use, so the JSON stays identical to the serializer's.
+
+It provides:
+- `RowEncoder`: base encoder of `values()` rows.
+- `DeckRowEncoder`: rows of DeckSerializer.
+- `CardRowEncoder`: rows of CardSerializer.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, ClassVar, Iterable
+
+from django.db.models import QuerySet
+from rest_framework.fields import DateTimeField
+
+_DATETIME = DateTimeField().to_representation
+
+
+class RowEncoder:
+    """Encodes `values()` rows like a ModelSerializer with the same `fields`.
+
+    Attributes:
+        fields: Serialized fields, in output order.
+        converters: Field conversions; other values are emitted as they are.
+    """
+
+    fields: ClassVar[tuple[str, ...]] = ()
+    converters: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    @classmethod
+    def values(cls, queryset: QuerySet) -> QuerySet:
+        """Return `queryset` as rows holding exactly the encoded fields."""
+        return queryset.values(*cls.fields)
+
+    @classmethod
+    def encode_many(cls, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        converters = [
+            (field, converter)
+            for field, converter in cls.converters.items()
+            if field in cls.fields
+        ]
+        encoded = []
+        for row in rows:
+            for field, converter in converters:
+                value = row[field]
+                row[field] = None if value is None else converter(value)
+            encoded.append(row)
+        return encoded
+
+
+class DeckRowEncoder(RowEncoder):
+    """Same output as DeckSerializer."""
+
+    fields = ("id", "deck_name", "date_updated")
+    converters = {"date_updated": _DATETIME}
+
+
+class CardRowEncoder(RowEncoder):
+    """Same output as CardSerializer."""
+
+    fields = ("id", "word", "due_date")
+    converters = {"due_date": _DATETIME}
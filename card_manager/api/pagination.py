@@ -1,5 +1,16 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -17,3 +28,166 @@ class CustomPageNumberPagination(PageNumberPagination):
                 "results": data,
             }
         )
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination that seeks on an index instead of counting and offsetting.
+
+    Pages are read with `WHERE (key) > (last key) ORDER BY key LIMIT n`, so every
+    page costs the same however deep it is. The key must be unique; end it with
+    "id" (e.g. `("due_date", "id")`) and back it with an index over the filter
+    columns plus the key. A "-" prefix orders a key field descending.
+
+    Requested with `?pagination=cursor`; `cursor` then carries the position. No
+    COUNT(*) is run unless `?count=1` asks for one; the count is cached for
+    `count_ttl` seconds, so it is approximate while cards are being added.
+
+    Args:
+        ordering: Key fields, unique together.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    count_ttl = 60
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering: tuple[str, ...]) -> None:
+        self.ordering = ordering
+        self.count = None
+
+    @staticmethod
+    def requested(request) -> bool:
+        """Whether the client opted in to cursor pagination for this request."""
+        return request.query_params.get("pagination") == "cursor"
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        size = self._page_size(request)
+        position, reverse = self._decode_cursor(request)
+
+        if request.query_params.get("count") in ("1", "true"):
+            self.count = self._cached_count(queryset)
+
+        ordering = [self._invert(field) for field in self.ordering] if reverse else self.ordering
+        page_qs = queryset.order_by(*ordering)
+        if position is not None:
+            page_qs = page_qs.filter(self._seek(ordering, position))
+
+        rows = list(page_qs[: size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+        if reverse:
+            rows.reverse()
+
+        # going back from a cursor means there is a page after; going on means one before
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = has_more if reverse else position is not None
+        self.first_key = self._key(rows[0]) if rows else None
+        self.last_key = self._key(rows[-1]) if rows else None
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        content = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            content["count"] = self.count
+        return Response(content)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or self.last_key is None:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self._encode_cursor(self.last_key, False)
+        )
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if self.first_key is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self._encode_cursor(self.first_key, True)
+        )
+
+    def _page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def _seek(self, ordering: list[str] | tuple[str, ...], position: list[Any]) -> Q:
+        """Rows after `position` in `ordering`: (a, b) > (x, y) as a OR of prefixes.
+
+        The leading `a >= x` bound lets the database range-scan the index.
+        """
+        names = [field.lstrip("-") for field in ordering]
+        after = [f"{name}__{'lt' if field.startswith('-') else 'gt'}" for name, field in
+                 zip(names, ordering)]
+
+        condition = Q()
+        for index in range(len(ordering)):
+            equal = {name: value for name, value in zip(names[:index], position[:index])}
+            condition |= Q(**equal, **{after[index]: position[index]})
+
+        leading = f"{names[0]}__{'lte' if ordering[0].startswith('-') else 'gte'}"
+        return Q(**{leading: position[0]}) & condition
+
+    def _key(self, row) -> list[Any]:
+        names = [field.lstrip("-") for field in self.ordering]
+        if isinstance(row, dict):
+            return [row[name] for name in names]
+        return [getattr(row, name) for name in names]
+
+    def _encode_cursor(self, key: list[Any], reverse: bool) -> str:
+        values = [value.isoformat() if isinstance(value, (date, datetime)) else value
+                  for value in key]
+        data = json.dumps({"k": values, "r": reverse}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def _decode_cursor(self, request) -> tuple[list[Any] | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+            position, reverse = data["k"], bool(data["r"])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _cached_count(self, queryset: QuerySet) -> int:
+        query = str(queryset.order_by().query)
+        key = f"keyset_count:{hashlib.sha1(query.encode()).hexdigest()}"
+        return cache.get_or_set(key, queryset.count, self.count_ttl)
+
+    @staticmethod
+    def _invert(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class KeysetPaginationMixin:
+    """Let a list view serve keyset pages when the request opts in.
+
+    Requests without `?pagination=cursor` keep `pagination_class`, so clients can
+    move to cursors one call at a time.
+
+    Attributes:
+        keyset_ordering: Unique key the view's pages are seeked on.
+    """
+
+    keyset_ordering: tuple[str, ...] = ("id",)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and KeysetPagination.requested(self.request):
+            self._paginator = KeysetPagination(self.keyset_ordering)
+        return super().paginator
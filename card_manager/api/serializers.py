@@ -1,6 +1,22 @@
-from rest_framework.serializers import BooleanField, CharField, ModelSerializer, Serializer
-
-from card_manager.models import Card, Deck
+from rest_framework.serializers import (
+    BooleanField,
+    CharField,
+    ChoiceField,
+    DateTimeField,
+    FileField,
+    IntegerField,
+    ModelSerializer,
+    Serializer,
+    ValidationError,
+)
+
+from card_manager.models import Card, Deck, RollupPeriod
+from card_manager.services.forecast import DueForecast
+from card_manager.services.imports import WordListError, parse_word_list
+from card_manager.services.review_stats import ReviewStats
+from card_manager.services.study import NextCardStrategy
+
+MAX_IMPORT_FILE_SIZE = 256 * 1024
 
 
 class DeckSerializer(ModelSerializer):
@@ -40,6 +56,38 @@ class CardCreateSerializer(Serializer):
         return word
 
 
+class CardImportSerializer(Serializer):
+    """Validates a bulk import: pasted `words` text or an uploaded CSV/plain-text `file`.
+
+    `validated_data["words"]` holds the parsed, unique words.
+    """
+
+    deck_name = CharField()
+    words = CharField(required=False, trim_whitespace=False)
+    file = FileField(required=False, write_only=True)
+
+    def validate(self, attrs):
+        upload = attrs.pop("file", None)
+        if (upload is None) == ("words" not in attrs):
+            raise ValidationError("Provide either 'words' or 'file'.")
+
+        if upload is not None:
+            if upload.size > MAX_IMPORT_FILE_SIZE:
+                raise ValidationError(
+                    {"file": f"File is larger than {MAX_IMPORT_FILE_SIZE} bytes."}
+                )
+            try:
+                attrs["words"] = upload.read().decode("utf-8-sig")
+            except UnicodeDecodeError:
+                raise ValidationError({"file": "File must be UTF-8 text."})
+
+        try:
+            attrs["words"] = parse_word_list(attrs["words"])
+        except WordListError as e:
+            raise ValidationError({"words": str(e)})
+        return attrs
+
+
 class ShowCardSerializer(ModelSerializer):
 
     class Meta:
@@ -47,6 +95,60 @@ class ShowCardSerializer(ModelSerializer):
         fields = ["id", "word", "json_data"]
 
 
+class StudySessionCreateSerializer(Serializer):
+    """Validates a request to open a study session with a batch of due cards."""
+
+    deck_name = CharField()
+    size = IntegerField(min_value=1, max_value=100, default=20)
+    order = ChoiceField(
+        choices=[strategy.value for strategy in NextCardStrategy],
+        default=NextCardStrategy.RANDOM.value,
+    )
+
+
+class StudyAnswerSerializer(Serializer):
+    """A single answer given within a study session."""
+
+    card_id = IntegerField()
+    user_feedback = IntegerField(min_value=0, max_value=5)
+    latency_ms = IntegerField(min_value=0, required=False, allow_null=True)
+
+
+class StudyAnswersSerializer(Serializer):
+    """A batch of answers given within a study session."""
+
+    answers = StudyAnswerSerializer(many=True, allow_empty=False, max_length=100)
+
+
+class ReviewItemSerializer(Serializer):
+    """A single review answered offline."""
+
+    card_id = IntegerField()
+    quality = IntegerField(min_value=0, max_value=5)
+    answered_at = DateTimeField()
+
+
+class ReviewBatchSerializer(Serializer):
+    """An ordered upload of offline reviews."""
+
+    reviews = ReviewItemSerializer(many=True, allow_empty=False, max_length=1000)
+
+
+class ReviewStatsQuerySerializer(Serializer):
+    """Query parameters of a review statistics series."""
+
+    period = ChoiceField(choices=RollupPeriod.values, default=RollupPeriod.DAY)
+    deck = IntegerField(required=False)
+    points = IntegerField(min_value=1, max_value=ReviewStats.MAX_POINTS, default=30)
+
+
+class ForecastQuerySerializer(Serializer):
+    """Query parameters of a due-card forecast."""
+
+    days = IntegerField(min_value=1, max_value=DueForecast.MAX_DAYS, default=30)
+    deck = IntegerField(required=False)
+
+
 class CardUpdateSerializer(ModelSerializer):
 
     word = CharField(write_only=True, required=True)
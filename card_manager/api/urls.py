@@ -3,19 +3,35 @@ from django.urls import path
 from .views import (
     CardCreateView,
     CardDeleteView,
+    CardImportView,
     CardListByDeckView,
     CardUpdateView,
     DeckDeleteView,
     DeckListView,
+    ForecastAPIView,
+    ReviewBatchAPIView,
+    ReviewStatsAPIView,
     ShowCardAPIView,
+    StudySessionAnswersAPIView,
+    StudySessionAPIView,
 )
 
 urlpatterns = [
     path("decks/", DeckListView.as_view(), name="deck-list"),
     path("decks/<int:deck_id>/cards/", CardListByDeckView.as_view(), name="deck-cards"),
     path("create/", CardCreateView.as_view(), name="create-cards"),
+    path("import/", CardImportView.as_view(), name="import-cards"),
     path("cards/<int:pk>/", CardDeleteView.as_view(), name="delete-cards"),
     path("decks/<int:pk>/", DeckDeleteView.as_view(), name="delete-decks"),
     path("study/", ShowCardAPIView.as_view(), name="study-card"),
+    path("study/sessions/", StudySessionAPIView.as_view(), name="study-session"),
+    path(
+        "study/sessions/<str:session_id>/answers/",
+        StudySessionAnswersAPIView.as_view(),
+        name="study-session-answers",
+    ),
     path("cards-update/<int:pk>/", CardUpdateView.as_view(), name="card-update"),
+    path("reviews/batch/", ReviewBatchAPIView.as_view(), name="review-batch"),
+    path("stats/reviews/", ReviewStatsAPIView.as_view(), name="review-stats"),
+    path("stats/forecast/", ForecastAPIView.as_view(), name="due-forecast"),
 ]
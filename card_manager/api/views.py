@@ -1,28 +1,60 @@
+import uuid
+from collections import Counter
+
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.generics import CreateAPIView, DestroyAPIView, ListAPIView, UpdateAPIView
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from card_manager.models import Card, Deck
-from card_manager.services.card_dealer import show_card, sm2
+from card_manager.services.daily_stats import increment_daily_learning
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.forecast import DueForecast
+from card_manager.services.rendering import (
+    card_payload,
+    cards_payload,
+    json_bytes_response,
+    object_payload,
+)
+from card_manager.services.review_stats import ReviewStats
+from card_manager.services.reviews import (
+    CardNotFoundError,
+    CardReviewService,
+    ReviewConflictError,
+)
+from card_manager.services.study import (
+    DueCardSelector,
+    NextCardStrategy,
+    StudySessionBusyError,
+    StudySessionNotFoundError,
+    StudySessionService,
+)
 
-from .pagination import CustomPageNumberPagination
+from .encoders import CardRowEncoder, DeckRowEncoder
+from .pagination import CustomPageNumberPagination, KeysetPaginationMixin
 from .serializers import (
     CardCreateSerializer,
+    CardImportSerializer,
     CardSerializer,
     CardUpdateSerializer,
     DeckSerializer,
-    ShowCardSerializer,
+    ForecastQuerySerializer,
+    ReviewBatchSerializer,
+    ReviewStatsQuerySerializer,
+    StudyAnswersSerializer,
+    StudySessionCreateSerializer,
 )
 
 
-class DeckListView(ListAPIView):
+class DeckListView(KeysetPaginationMixin, ListAPIView):
     # add docstring
     serializer_class = DeckSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = CustomPageNumberPagination
+    keyset_ordering = ("-date_updated", "-id")
 
     def get_queryset(self):
         deck_queryset = Deck.objects.filter(user=self.request.user).order_by("-date_updated")
@@ -33,12 +65,18 @@ class DeckListView(ListAPIView):
 
         return deck_queryset
 
+    def list(self, request, *args, **kwargs):
+        # read-only fast path: values() rows instead of model instances, same JSON
+        page = self.paginate_queryset(DeckRowEncoder.values(self.get_queryset()))
+        return self.get_paginated_response(DeckRowEncoder.encode_many(page))
+
 
-class CardListByDeckView(ListAPIView):
+class CardListByDeckView(KeysetPaginationMixin, ListAPIView):
     # add docstring
     serializer_class = CardSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = CustomPageNumberPagination
+    keyset_ordering = ("due_date", "id")
 
     def get_queryset(self):
         deck_id = self.kwargs["deck_id"]
@@ -52,6 +90,11 @@ class CardListByDeckView(ListAPIView):
 
         return card_queryset
 
+    def list(self, request, *args, **kwargs):
+        # read-only fast path: values() rows instead of model instances, same JSON
+        page = self.paginate_queryset(CardRowEncoder.values(self.get_queryset()))
+        return self.get_paginated_response(CardRowEncoder.encode_many(page))
+
 
 class CardCreateView(CreateAPIView):
     # add docstring
@@ -87,6 +130,37 @@ class CardCreateView(CreateAPIView):
         )
 
 
+class CardImportView(APIView):
+    """Starts a bulk import of a word list into a deck.
+
+    Accepts pasted text as `words` or a CSV/plain-text upload as `file`. Cards are
+    created by one Celery job; progress is streamed over `ws/cards/`.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
+
+    def post(self, request):
+        serializer = CardImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        from card_manager.tasks import import_cards_task
+
+        import_id = uuid.uuid4().hex
+        words = serializer.validated_data["words"]
+        deck_name = serializer.validated_data["deck_name"]
+        import_cards_task.delay(import_id, words, deck_name, request.user.id)
+
+        return Response(
+            {
+                "message": f"Importing {len(words)} words into '{deck_name}'.",
+                "import_id": import_id,
+                "total": len(words),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
 class CardDeleteView(DestroyAPIView):
     # add docstring
     permission_classes = [IsAuthenticated]
@@ -98,6 +172,7 @@ class CardDeleteView(DestroyAPIView):
         card_id = kwargs.get("pk")
         card = get_object_or_404(Card, id=card_id, deck__user=request.user)
         card.delete()
+        DifficultyBuckets.apply(Counter({(card.deck_id, card.difficulty): -1}))
 
         return Response(
             {"message": "Card deleted successfully."}, status=status.HTTP_204_NO_CONTENT
@@ -129,9 +204,18 @@ class ShowCardAPIView(APIView):
     deck_name = "animals"
 
     def get(self, request):
-        result = show_card(self.deck_name, request.user)  # calls redundant module -- card_manager.py
+        try:
+            strategy = NextCardStrategy(request.GET.get("order", NextCardStrategy.RANDOM))
+        except ValueError:
+            return Response(
+                {"error": f"order must be one of {[s.value for s in NextCardStrategy]}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        increment_daily_learning(request.user)
+        result = DueCardSelector().next_card(self.deck_name, request.user, strategy)
 
-        if result == "No cards left for today":  # fragile string condition check
+        if result is None:
             return Response(
                 {
                     "message": f"Congratulations☺️ You've learned all cards in '{self.deck_name}' deck for today."
@@ -139,8 +223,8 @@ class ShowCardAPIView(APIView):
                 status=status.HTTP_200_OK,
             )
 
-        serializer = ShowCardSerializer(result)
-        return Response(serializer.data)
+        # same body as ShowCardSerializer(result).data, from the pre-rendered payload
+        return json_bytes_response(card_payload(result))
 
     def post(self, request):
         card_id = request.data.get("card_id")
@@ -152,13 +236,152 @@ class ShowCardAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:  # try/except block for controlling logic flow
+        latency_ms = request.data.get("latency_ms")
+        try:
             user_feedback = int(user_feedback)
-            sm2(card_id, user_feedback, request.user)
-        except Exception as e:  # too generic, unused e variable
+            latency_ms = max(int(latency_ms), 0) if latency_ms is not None else None
+            result = CardReviewService().submit_review(
+                card_id, user_feedback, request.user, latency_ms=latency_ms
+            )
+        except (TypeError, ValueError):
             return Response({"error": "Failed to update card."}, status=status.HTTP_400_BAD_REQUEST)
+        except CardNotFoundError as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except ReviewConflictError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+
+        return Response(
+            {"message": "Card updated successfully.", "due_date": result["due_date"]},
+            status=status.HTTP_200_OK,
+        )
+
+
+class StudySessionAPIView(APIView):
+    """Opens a study session and returns a batch of due cards up front.
+
+    The cards are served with their `json_data` so the client can study the whole
+    batch locally and send the answers back to `StudySessionAnswersAPIView`. Card
+    payloads are pre-rendered (see card_manager.services.rendering).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = StudySessionCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        session, cards = StudySessionService().start(
+            serializer.validated_data["deck_name"],
+            request.user,
+            serializer.validated_data["size"],
+            NextCardStrategy(serializer.validated_data["order"]),
+        )
+
+        if not cards:
+            return Response(
+                {"message": "No cards left for today.", "session_id": None, "cards": []},
+                status=status.HTTP_200_OK,
+            )
+
+        return json_bytes_response(
+            object_payload({"session_id": session.session_id}, {"cards": cards_payload(cards)}),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class StudySessionAnswersAPIView(APIView):
+    """Accepts a batch of answers for cards served in a study session."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, session_id):
+        serializer = StudyAnswersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        answers = [
+            (answer["card_id"], answer["user_feedback"])
+            for answer in serializer.validated_data["answers"]
+        ]
+        latencies = {
+            answer["card_id"]: answer["latency_ms"]
+            for answer in serializer.validated_data["answers"]
+            if answer.get("latency_ms") is not None
+        }
+
+        try:
+            session, results = StudySessionService().answer(
+                session_id, request.user, answers, latencies
+            )
+        except StudySessionNotFoundError as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except StudySessionBusyError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+
+        return Response(
+            {"results": results, "remaining": session.remaining}, status=status.HTTP_200_OK
+        )
+
+
+class ReviewBatchAPIView(APIView):
+    """Applies reviews recorded offline by mobile clients in one transaction.
+
+    Reviews are replayed per card in `answered_at` order. Uploading the same batch
+    again is safe: already applied reviews are reported as duplicates. Reviews that
+    were never applied and are older than the card's last review are reported as stale.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = ReviewBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reviews = [
+            (review["card_id"], review["quality"], review["answered_at"])
+            for review in serializer.validated_data["reviews"]
+        ]
+        results = CardReviewService().replay_reviews(request.user, reviews)
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class ReviewStatsAPIView(APIView):
+    """Per-day, week or month review statistics of the user or one of their decks.
+
+    Served from the review rollups (see card_manager.services.review_stats), so
+    the cost depends on the number of periods, not on the number of reviews.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = ReviewStatsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        series = ReviewStats().series(
+            request.user, query["period"], query.get("deck"), query["points"]
+        )
+        return Response({"period": query["period"], "results": series}, status=status.HTTP_200_OK)
+
+
+class ForecastAPIView(APIView):
+    """Cards coming due on each of the next days, for the user or one of their decks.
+
+    `counts[i]` is the number of cards due `i` days after `start`; cards already
+    overdue are reported separately. Computed with one grouped, indexed query
+    (see card_manager.services.forecast).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = ForecastQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
 
-        return Response({"message": "Card updated successfully."}, status=status.HTTP_200_OK)
+        forecast = DueForecast().forecast(request.user, query["days"], query.get("deck"))
+        return Response(forecast, status=status.HTTP_200_OK)
 
 
 class CardUpdateView(UpdateAPIView):
@@ -8,6 +8,8 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import AccessToken
 
+from card_manager.services.notifications import FrameCoalescer
+
 User = get_user_model()
 
 
@@ -28,6 +30,7 @@ class CardProgressConsumer(AsyncWebsocketConsumer):  # this class does too much.
         if user and user.is_authenticated:
             self.scope["user"] = user
             self.group_name = f"user_{user.id}"
+            self.frames = FrameCoalescer(self.send_frame)
 
             await self.channel_layer.group_add(
                 self.group_name,
@@ -57,6 +60,9 @@ class CardProgressConsumer(AsyncWebsocketConsumer):  # this class does too much.
 
     async def disconnect(self, close_code):
         print(f"🔌 Disconnected with code: {close_code}")  # logger
+        frames = getattr(self, "frames", None)
+        if frames:
+            frames.close()
         group = getattr(self, "group_name", None)
         if group:
             await self.channel_layer.group_discard(group, self.channel_name)
@@ -65,4 +71,11 @@ class CardProgressConsumer(AsyncWebsocketConsumer):  # this class does too much.
             print("⚠️ No group_name found — skipping group discard.")  # logger
 
     async def card_status(self, event):
-        await self.send(text_data=json.dumps(event["content"]))
+        await self.frames.add([event["content"]])
+
+    async def card_status_batch(self, event):
+        """Events coalesced by NotificationAggregator, sent on with this window's events."""
+        await self.frames.add(event["contents"])
+
+    async def send_frame(self, frame):
+        await self.send(text_data=json.dumps(frame))
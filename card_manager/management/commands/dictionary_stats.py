@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from card_manager.services.cache import WordDataCache
+from card_manager.services.ratelimit import RateLimitMetrics
+from card_manager.services.service import DictApiConfig
+
+
+class Command(BaseCommand):
+    """Print shared counters of dictionary lookups.
+
+    Use the rate limiter counters to size DICTIONARY_RATE_LIMIT: many `throttled`
+    answers mean the rate is above the provider's limit, a high `avg_delay_ms` or
+    any `rejected` callers mean it is too low for the load (or `max_wait` too short).
+    """
+
+    help = "Print word cache and rate limiter counters of dictionary lookups."
+
+    def handle(self, *args, **options):
+        provider = DictApiConfig.provider_name
+        sections = {
+            "word cache": WordDataCache(provider).stats(),
+            "rate limiter": RateLimitMetrics(provider).snapshot(),
+        }
+        for title, stats in sections.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{provider} {title}"))
+            for name, value in stats.items():
+                self.stdout.write(f"  {name}: {value:g}")
@@ -0,0 +1,51 @@
+import gzip
+import sys
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from card_manager.services.offline import OfflineDictionaryImporter
+
+
+class Command(BaseCommand):
+    """Import a dictionaryapi.dev JSON-lines dump into the offline dictionary.
+
+    The dump is streamed line by line (gzip-compressed files and stdin work too)
+    and replaces the current offline dictionary only once fully imported.
+    Restart workers afterwards to serve lookups from the new file.
+    """
+
+    help = "Import a dictionaryapi.dev JSON-lines dump into the offline dictionary."
+
+    def add_arguments(self, parser):
+        parser.add_argument("dump", help="JSON-lines dump (.jsonl or .jsonl.gz), '-' for stdin.")
+        parser.add_argument(
+            "--output",
+            default=getattr(settings, "OFFLINE_DICTIONARY_PATH", None),
+            help="SQLite file to write (default: OFFLINE_DICTIONARY_PATH).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if not options["output"]:
+            raise CommandError("Set OFFLINE_DICTIONARY_PATH or pass --output.")
+
+        dump = options["dump"]
+        if dump != "-" and not Path(dump).is_file():
+            raise CommandError(f"Dump not found: {dump}")
+
+        importer = OfflineDictionaryImporter(options["output"], options["batch_size"])
+        if dump == "-":
+            stats = importer.import_lines(sys.stdin)
+        else:
+            opener = gzip.open if dump.endswith(".gz") else open
+            with opener(dump, "rt", encoding="utf-8") as file:
+                stats = importer.import_lines(file)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats.entries} entries for {stats.words} words into "
+                f"{options['output']} ({stats.skipped_lines} lines skipped)."
+            )
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from card_manager.services.difficulty import DifficultyBuckets
+
+
+class Command(BaseCommand):
+    """Reclassify cards into difficulty buckets and recount them per deck.
+
+    Run after changing the CARD_DIFFICULTY setting or to repair deck counters. Decks
+    never counted before are rebuilt automatically on their first quiz.
+    """
+
+    help = "Reclassify cards into difficulty buckets and recount them per deck."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--deck", type=int, action="append", dest="deck_ids", help="Deck id (repeatable)."
+        )
+
+    def handle(self, *args, **options):
+        DifficultyBuckets().rebuild(options["deck_ids"])
+        self.stdout.write(self.style.SUCCESS("Difficulty buckets rebuilt."))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from card_manager.models import Card
+from card_manager.services.rendering import RENDER_VERSION
+
+
+class Command(BaseCommand):
+    """Pre-render payloads of cards created before rendering or with an older RENDER_VERSION.
+
+    Such cards are still served correctly (rendered per request) until this runs.
+    """
+
+    help = "Pre-render study/quiz payloads of cards with a missing or outdated render."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        rendered = 0
+        last_id = 0
+
+        while True:
+            cards = list(
+                Card.objects.filter(id__gt=last_id)
+                .exclude(render_version=RENDER_VERSION)
+                .only("id", "word", "json_data")
+                .order_by("id")[:batch_size]
+            )
+            if not cards:
+                break
+
+            for card in cards:
+                card.render()
+            Card.objects.bulk_update(cards, ["rendered", "render_version"])
+            rendered += len(cards)
+            last_id = cards[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} cards."))
@@ -3,6 +3,11 @@ from django.contrib.auth.models import User
 from django.db import models
 from django.utils import timezone
 
+from card_manager.services.rendering import RENDER_VERSION, render_card_fields
+
+# Fields a card's pre-rendered payload is built from
+RENDERED_FROM = frozenset({"word", "json_data"})
+
 
 class Deck(models.Model):
     user = models.ForeignKey(
@@ -11,16 +16,33 @@ class Deck(models.Model):
     deck_name = models.CharField(max_length=100)
     date_created = models.DateTimeField(auto_now_add=True)
     date_updated = models.DateTimeField(auto_now=True)
+    # per-difficulty card counts, maintained by card_manager.services.difficulty
+    hard_cards = models.IntegerField(default=0, editable=False)
+    medium_cards = models.IntegerField(default=0, editable=False)
+    easy_cards = models.IntegerField(default=0, editable=False)
+    # False until DifficultyBuckets.rebuild() classified the cards and counted them
+    buckets_counted = models.BooleanField(default=False, editable=False)
 
     class Meta:
         """This ensures the DB table is named exactly decks_deck"""
 
         db_table = "decks_deck"
+        indexes = [
+            models.Index(fields=["user", "date_updated", "id"], name="deck_user_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.deck_name}"
 
 
+class Difficulty(models.IntegerChoices):
+    """Difficulty bucket of a card, derived from its easiness factor."""
+
+    HARD = 0, "hard"
+    MEDIUM = 1, "medium"
+    EASY = 2, "easy"
+
+
 class Card(models.Model):
     deck = models.ForeignKey(Deck, on_delete=models.CASCADE, related_name="cards")
     json_data = models.JSONField()  # think if you really need to store json data as backup
@@ -30,15 +52,44 @@ class Card(models.Model):
     repetitions = models.FloatField(default=0.0)
     interval = models.FloatField(default=1)
     due_date = models.DateTimeField(default=timezone.now)
+    last_reviewed_at = models.DateTimeField(null=True, blank=True)
+    difficulty = models.PositiveSmallIntegerField(
+        choices=Difficulty.choices, default=Difficulty.HARD, editable=False
+    )
+    # pre-encoded "word" and "json_data" JSON members, see card_manager.services.rendering
+    rendered = models.BinaryField(default=b"", editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
 
     class Meta:
         """This ensures the DB table is named exactly cards_card"""
 
         db_table = "cards_card"
+        indexes = [
+            models.Index(fields=["deck", "due_date", "id"], name="card_deck_due_date_idx"),
+            models.Index(fields=["deck", "difficulty", "id"], name="card_deck_difficulty_idx"),
+        ]
 
     def __str__(self):
         return f"{self.json_data["word"]}"
 
+    def save(self, *args, **kwargs):
+        """Save the card, re-rendering its payload if `word` or `json_data` may have changed."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.render()
+        elif RENDERED_FROM & set(update_fields):
+            self.render()
+            kwargs["update_fields"] = {*update_fields, "rendered", "render_version"}
+        super().save(*args, **kwargs)
+
+    def render(self):
+        """Pre-render the payload served by study and quiz endpoints.
+
+        Called by `save`; call it before `bulk_create`/`bulk_update`, which skip `save`.
+        """
+        self.rendered = render_card_fields(self.word, self.json_data)
+        self.render_version = RENDER_VERSION
+
 
 class ShowCardDailyStat(models.Model):
     # when you will work on these models, go back to the admin.py and define ModelAdmin for this field
@@ -55,3 +106,80 @@ class ShowCardDailyStat(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.date}: {self.count} times"  # this is show in admin. Change.
+
+
+class ReviewEvent(models.Model):
+    """One answered review, appended in batches by card_manager.services.review_stats.
+
+    Never read for statistics; those come from the rollup tables.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    deck = models.ForeignKey(Deck, on_delete=models.CASCADE)
+    card = models.ForeignKey(Card, null=True, on_delete=models.SET_NULL)
+    quality = models.PositiveSmallIntegerField()
+    previous_interval = models.FloatField()
+    interval = models.FloatField()
+    ef = models.FloatField()
+    latency_ms = models.PositiveIntegerField(null=True, blank=True)
+    reviewed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "review_event"
+        indexes = [
+            models.Index(fields=["user", "reviewed_at"], name="review_event_user_idx"),
+        ]
+
+
+class RollupPeriod(models.TextChoices):
+    """Length of a review rollup bucket."""
+
+    DAY = "day", "day"
+    WEEK = "week", "week"  # starts on Monday
+    MONTH = "month", "month"
+
+
+class ReviewRollup(models.Model):
+    """Review totals of one period, kept up to date as review events are written."""
+
+    period = models.CharField(max_length=5, choices=RollupPeriod.choices)
+    start = models.DateField()
+    reviews = models.PositiveIntegerField(default=0)
+    correct = models.PositiveIntegerField(default=0)  # quality >= 3
+    quality_sum = models.PositiveIntegerField(default=0)
+    ef_sum = models.FloatField(default=0)
+    timed_reviews = models.PositiveIntegerField(default=0)  # reviews with a latency
+    latency_ms_sum = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class UserReviewRollup(ReviewRollup):
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "review_rollup_user"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period", "start"], name="review_rollup_user_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.period} {self.start}: {self.reviews} reviews"
+
+
+class DeckReviewRollup(ReviewRollup):
+    deck = models.ForeignKey(Deck, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "review_rollup_deck"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["deck", "period", "start"], name="review_rollup_deck_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.deck.deck_name} - {self.period} {self.start}: {self.reviews} reviews"
@@ -0,0 +1,246 @@
+"""
+Cache module for parsed dictionary word data.
+
+Thousands of users add the same common words, so parsed results are kept in the
+shared Django cache (Redis) and reused across Celery workers instead of calling
+the dictionary provider again. Misses are filled single-flight: when many
+workers ask for the same uncached word at once (a class adding the same word),
+one of them fetches it and the others wait for its result.
+
+It provides:
+- `WordDataCache`: read-through storage for `ParsedWordData`, keyed by provider and
+  normalized word, with a TTL, negative caching of unknown words, single-flight
+  filling and hit/miss/coalesced counters. Methods prefixed with `a` are the
+  variants for asyncio code.
+- `incr_counter` / `aincr_counter`: shared counters in the cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from django.core.cache import BaseCache, cache
+
+from card_manager.services.fetcher import WordNotFoundError
+from card_manager.services.services_types import ParsedWordData
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND = "__word_not_found__"
+STATS = ("hits", "misses", "coalesced")
+
+
+class WordDataCache:
+    """Shared cache of parsed word data for one provider.
+
+    Args:
+        provider: Name of the provider the data comes from, part of every key.
+        store: Django cache backend (default: the default cache).
+        ttl: Seconds a parsed word is kept.
+        negative_ttl: Seconds a "word not found" answer is kept.
+        lock_ttl: Seconds a fill lock is held at most; also how long callers wait for it.
+        poll_interval: Seconds between checks for the result of an in-flight fill.
+    """
+
+    KEY_PREFIX = "word_data"
+
+    def __init__(
+        self,
+        provider: str,
+        store: BaseCache | None = None,
+        ttl: int = 30 * 24 * 60 * 60,
+        negative_ttl: int = 24 * 60 * 60,
+        lock_ttl: int = 30,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self._provider = provider
+        self._store = store or cache
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._lock_ttl = lock_ttl
+        self._poll_interval = poll_interval
+
+    def get(self, word: str) -> ParsedWordData | None:
+        """Return cached data for `word` or None on a miss.
+
+        Raises:
+            WordNotFoundError: If the provider recently reported the word as unknown.
+        """
+        cached = self._store.get(self.key(word))
+        self._count("hits" if cached is not None else "misses")
+        return self._unwrap(word, cached)
+
+    def set(self, word: str, data: ParsedWordData) -> None:
+        self._store.set(self.key(word), data, self._ttl)
+
+    def set_not_found(self, word: str) -> None:
+        self._store.set(self.key(word), NOT_FOUND, self._negative_ttl)
+
+    async def aget(self, word: str) -> ParsedWordData | None:
+        """Async variant of `get`."""
+        cached = await self._store.aget(self.key(word))
+        await self._acount("hits" if cached is not None else "misses")
+        return self._unwrap(word, cached)
+
+    async def aset(self, word: str, data: ParsedWordData) -> None:
+        await self._store.aset(self.key(word), data, self._ttl)
+
+    async def aset_not_found(self, word: str) -> None:
+        await self._store.aset(self.key(word), NOT_FOUND, self._negative_ttl)
+
+    def fill(self, word: str, fetch: Callable[[str], ParsedWordData]) -> ParsedWordData:
+        """Fetch `word` once across workers and cache the outcome.
+
+        Concurrent callers for the same normalized word elect one leader with an
+        atomic `add` of a lock key in the shared store; the others poll until the
+        leader's result lands in the cache. A new leader checks the cache again
+        first, in case the previous leader finished right after the caller's miss.
+        If the leader fails without a cacheable outcome (e.g. the provider throttled
+        it), one waiting caller takes over, so retries are serialized instead of
+        stampeding the provider. After `lock_ttl` seconds without a result, a caller
+        fetches on its own.
+
+        Args:
+            word: Word to fetch.
+            fetch: Uncached lookup of a word.
+
+        Raises:
+            WordNotFoundError: If the provider does not know the word.
+            Any other error raised by `fetch`.
+        """
+        deadline = time.monotonic() + self._lock_ttl
+        while time.monotonic() < deadline:
+            token = uuid.uuid4().hex
+            if self._store.add(self._lock_key(word), token, self._lock_ttl):
+                try:
+                    # a previous leader may have stored the result and released the lock
+                    # between our cache miss and our `add`
+                    found = self._store.get_many([self.key(word)])
+                    if self.key(word) in found:
+                        self._count("coalesced")
+                        return self._unwrap(word, found[self.key(word)])
+                    return self._fetch_and_set(word, fetch)
+                finally:
+                    self._release(word, token)
+
+            while time.monotonic() < deadline:
+                time.sleep(self._poll_interval)
+                found = self._store.get_many([self.key(word), self._lock_key(word)])
+                if self.key(word) in found:
+                    self._count("coalesced")
+                    return self._unwrap(word, found[self.key(word)])
+                if self._lock_key(word) not in found:
+                    break  # leader gave up without a result: try to take over
+
+        logger.warning("Timed out waiting for an in-flight lookup of '%s'", word)
+        return self._fetch_and_set(word, fetch)
+
+    async def afill(
+        self, word: str, fetch: Callable[[str], Awaitable[ParsedWordData]]
+    ) -> ParsedWordData:
+        """Async variant of `fill`."""
+        deadline = time.monotonic() + self._lock_ttl
+        while time.monotonic() < deadline:
+            token = uuid.uuid4().hex
+            if await self._store.aadd(self._lock_key(word), token, self._lock_ttl):
+                try:
+                    found = await self._store.aget_many([self.key(word)])
+                    if self.key(word) in found:
+                        await self._acount("coalesced")
+                        return self._unwrap(word, found[self.key(word)])
+                    return await self._afetch_and_set(word, fetch)
+                finally:
+                    await self._arelease(word, token)
+
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self._poll_interval)
+                found = await self._store.aget_many([self.key(word), self._lock_key(word)])
+                if self.key(word) in found:
+                    await self._acount("coalesced")
+                    return self._unwrap(word, found[self.key(word)])
+                if self._lock_key(word) not in found:
+                    break  # leader gave up without a result: try to take over
+
+        logger.warning("Timed out waiting for an in-flight lookup of '%s'", word)
+        return await self._afetch_and_set(word, fetch)
+
+    def stats(self) -> dict[str, int]:
+        """Return shared hit, miss and coalesced counters of this provider's cache."""
+        counters = self._store.get_many([self._stat_key(name) for name in STATS])
+        return {name: counters.get(self._stat_key(name), 0) for name in STATS}
+
+    def key(self, word: str) -> str:
+        return f"{self.KEY_PREFIX}:{self._provider}:{self.normalize(word)}"
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        return " ".join(word.split()).lower()
+
+    def _lock_key(self, word: str) -> str:
+        return f"{self.KEY_PREFIX}_lock:{self._provider}:{self.normalize(word)}"
+
+    @staticmethod
+    def _unwrap(word: str, cached) -> ParsedWordData | None:
+        if cached == NOT_FOUND:
+            raise WordNotFoundError(f"Error 404 for word '{word}' (cached)")
+        return cached
+
+    def _fetch_and_set(self, word: str, fetch: Callable[[str], ParsedWordData]) -> ParsedWordData:
+        try:
+            data = fetch(word)
+        except WordNotFoundError:
+            self.set_not_found(word)
+            raise
+        self.set(word, data)
+        return data
+
+    async def _afetch_and_set(
+        self, word: str, fetch: Callable[[str], Awaitable[ParsedWordData]]
+    ) -> ParsedWordData:
+        try:
+            data = await fetch(word)
+        except WordNotFoundError:
+            await self.aset_not_found(word)
+            raise
+        await self.aset(word, data)
+        return data
+
+    def _release(self, word: str, token: str) -> None:
+        # get + delete is not atomic; the lock TTL bounds the damage of a race
+        if self._store.get(self._lock_key(word)) == token:
+            self._store.delete(self._lock_key(word))
+
+    async def _arelease(self, word: str, token: str) -> None:
+        if await self._store.aget(self._lock_key(word)) == token:
+            await self._store.adelete(self._lock_key(word))
+
+    def _stat_key(self, name: str) -> str:
+        return f"{self.KEY_PREFIX}_stats:{self._provider}:{name}"
+
+    def _count(self, name: str) -> None:
+        incr_counter(self._store, self._stat_key(name))
+
+    async def _acount(self, name: str) -> None:
+        await aincr_counter(self._store, self._stat_key(name))
+
+
+def incr_counter(store: BaseCache, key: str, amount: int = 1) -> None:
+    """Add `amount` to a shared counter that never expires, creating it if needed."""
+    try:
+        store.incr(key, amount)
+    except ValueError:  # counter does not exist yet
+        if not store.add(key, amount, timeout=None):
+            store.incr(key, amount)
+
+
+async def aincr_counter(store: BaseCache, key: str, amount: int = 1) -> None:
+    """Async variant of `incr_counter`."""
+    try:
+        await store.aincr(key, amount)
+    except ValueError:  # counter does not exist yet
+        if not await store.aadd(key, amount, timeout=None):
+            await store.aincr(key, amount)
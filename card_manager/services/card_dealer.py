@@ -1,13 +1,18 @@
 """
 THIS MODULE IS REDUNDANT
 """
-import random
 import os
 import sys
+from collections import Counter
 
 import django
 import requests
-from card_manager.models import Card, Deck, ShowCardDailyStat
+from django.utils import timezone
+
+from card_manager.models import Card, Deck
+from card_manager.services.daily_stats import increment_daily_learning
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.reviews import CardReviewService
 
 # Set the default settings module for Django and initialize Django
 # (needed for standalone scripts that interact with django)
@@ -86,11 +91,12 @@ def save_data(response, deck_name, user):  # this function does 2 things: proces
         "examples": examples,
     }
 
-    Card.objects.create(
+    card = Card.objects.create(
         deck=deck,
         json_data=cleaned_data,
         word=word,
     )
+    DifficultyBuckets.apply(Counter({(deck.id, card.difficulty): 1}))
     return word if word else "success"  # return strings?
 
 
@@ -138,79 +144,27 @@ def show_card(deck_name, user):
     # can this function be called from view? and here remove show card at all?
     increment_daily_learning(user)
 
-    now = timezone.now()
-
-    all_cards_ids = list(
+    # the most overdue card; see card_manager.services.study.DueCardSelector for the API
+    card_to_show = (
         Card.objects.filter(
             deck__deck_name=deck_name,
             deck__user=user,
-            due_date__lte=now,  # __lte stands for 'less than or equal to'
-        ).values_list("id", flat=True)
+            due_date__lte=timezone.now(),
+        )
+        .order_by("due_date")
+        .first()
     )
 
-    if not all_cards_ids:
+    if card_to_show is None:
         return "No cards left for today"
 
-    card_id = random.choice(all_cards_ids)
-    card_to_show = Card.objects.get(id=card_id, deck__user=user)
-
     return card_to_show
 
 
-@log_errors
-def increment_daily_learning(user):  # this is related to data collected from the user not to sm2
-    today = date.today()
-
-    stat, created = ShowCardDailyStat.objects.get_or_create(user=user, date=today)
-
-    if not created:
-        stat.count = F("count") + 1
-    else:
-        stat.count = 1  # First time today, set count to 1
-
-    stat.save(update_fields=["count"])
-    stat.refresh_from_db()
-
-    return stat
-
-
 @log_errors
 def sm2(card_id, user_feedback, user):
-    """
-    Does this function calculates sm2 and saves the data to the db?
-    It should just calculate the parametars and return them for the caller to db-save
-    """
-
-    card = Card.objects.get(id=card_id, deck__user=user)
-
-    card.quality = user_feedback
-    card.save(update_fields=["quality"])
-
-    if user_feedback < 3:
-        Card.objects.filter(id=card.id).update(
-            interval=1,
-            repetitions=0,
-        )
-    else:
-        if card.repetitions == 0:
-            Card.objects.filter(id=card.id).update(interval=1, repetitions=F("repetitions") + 1)
-        elif card.repetitions == 1:
-            Card.objects.filter(id=card.id).update(interval=3, repetitions=F("repetitions") + 1)
-        else:
-            Card.objects.filter(id=card.id).update(
-                interval=F("interval") * F("ef"), repetitions=F("repetitions") + 1
-            )
-
-    card.refresh_from_db(fields=["interval", "repetitions", "ef"])
-
-    # parameters hardcoded? what if I want to change them later?
-    new_ef = card.ef + (0.1 - (5 - user_feedback) * (0.08 + (5 - user_feedback) * 0.02))
-    card.ef = max(new_ef, 1.3)
-
-    interval_days = round(float(card.interval))
-    card.due_date = timezone.now() + timedelta(days=interval_days)
-
-    card.save(update_fields=["ef", "due_date"])
+    """Review a card through CardReviewService, which also keeps the difficulty buckets in sync."""
+    return CardReviewService().submit_review(card_id, user_feedback, user)
 
 # ===========================================================================================
 # THIS IS THE END
@@ -0,0 +1,114 @@
+"""
+Card module that turns parsed dictionary data into stored cards.
+
+It provides:
+- `CardData`: the `Card.json_data` structure the frontend renders.
+- `CardDataBuilder`: converts `ParsedWordData` into `CardData`.
+- `CardCreationService`: looks a word up and stores it as a card in a user's deck.
+
+Exceptions:
+- CardExistsError: Raised when the deck already holds a card for the word.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TypedDict
+
+from card_manager.models import Card, Deck
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.hedging import HedgedDictApiModule
+from card_manager.services.service import WordDataService
+from card_manager.services.services_types import ParsedWordData
+
+
+class CardData(TypedDict):
+    """Structure stored in `Card.json_data`."""
+
+    word: str
+    phonetic: str
+    definitions: list[str]
+    examples: list[str]
+
+
+class CardDataBuilder:
+    """Flattens definitions grouped by part of speech into card definitions and examples.
+
+    Examples come from the definitions the parser kept (DICTIONARY_API
+    `max_definition` per part of speech), in the same order as the definitions.
+
+    Args:
+        max_items: Max definitions and max examples kept on a card.
+    """
+
+    def __init__(self, max_items: int = 2) -> None:
+        self._max_items = max_items
+
+    def build(self, parsed: ParsedWordData) -> CardData:
+        definitions: list[str] = []
+        examples: list[str] = []
+
+        for entries in parsed["definition_by_part_of_speech"].values():
+            for entry in entries:
+                if len(definitions) < self._max_items:
+                    definitions.append(entry["definition"])
+                example = entry.get("example")
+                if example and len(examples) < self._max_items:
+                    examples.append(example)
+
+        return CardData(
+            word=parsed["word"],
+            phonetic=parsed.get("phonetic", ""),
+            definitions=definitions,
+            examples=examples,
+        )
+
+
+class CardCreationService:
+    """Creates a card for a word in a user's deck.
+
+    Args:
+        word_service: Source of parsed word data (default: hedged dictionaryapi.dev service).
+        builder: Converts parsed data into card data (default: CardDataBuilder()).
+        buckets: Difficulty bucket bookkeeping (default: DifficultyBuckets()).
+    """
+
+    def __init__(
+        self,
+        word_service: WordDataService | None = None,
+        builder: CardDataBuilder | None = None,
+        buckets: DifficultyBuckets | None = None,
+    ) -> None:
+        self._word_service = word_service or HedgedDictApiModule.get_hedged_service()
+        self._builder = builder or CardDataBuilder()
+        self._buckets = buckets or DifficultyBuckets()
+
+    def create(self, word: str, deck_name: str, user) -> Card:
+        """Look `word` up and store it as a new card.
+
+        Raises:
+            CardExistsError: If the deck already has a card for `word`.
+            WordNotFoundError: If the dictionary does not know `word`.
+            ExternalAPIError: If the dictionary lookup failed.
+            ResponseValidationError: If the dictionary answer is unusable.
+        """
+        deck, _ = Deck.objects.get_or_create(user=user, deck_name=deck_name)
+        if Card.objects.filter(deck=deck, word__iexact=word).exists():
+            raise CardExistsError(word, deck_name)
+
+        card_data = self._builder.build(self._word_service.get_clean_word(word))
+        card = Card(deck=deck, json_data=card_data, word=card_data["word"])
+        card.difficulty = self._buckets.classify(card.ef)
+        card.save()
+
+        self._buckets.apply(Counter({(deck.id, card.difficulty): 1}))
+        return card
+
+
+class CardExistsError(Exception):
+    """Raised when a deck already contains a card for the word."""
+
+    def __init__(self, word: str, deck_name: str) -> None:
+        super().__init__(f"Word already in the deck: '{word}' is already in '{deck_name}'.")
+        self.word = word
+        self.deck_name = deck_name
@@ -0,0 +1,248 @@
+"""
+Daily stats module that buffers the "cards shown today" counter.
+
+Every shown card used to run get_or_create, an UPDATE and a refresh on the
+user's `daily_card_learning` row, so study clicks queued on one hot row lock.
+Shown cards are now added to a counter buffer in O(1) without touching the
+database. The buffer is flushed into ShowCardDailyStat with one batched
+`INSERT ... ON CONFLICT DO UPDATE SET count = count + excluded.count` per
+`batch_size` counters: by a Celery beat task for the shared buffer, or inline
+every `flush_interval` seconds and at exit for the in-process buffer.
+
+Flushing takes the buffered deltas out atomically and only adds them to the
+table, so concurrent flushes never double count. Deltas of a failed flush are
+put back into the buffer; a process dying between take and commit loses them.
+
+It provides:
+- `DailyStatsConfig`: buffer and flush settings.
+- `CounterBuffer`: interface of a buffer of per (user, day) deltas.
+- `LocalCounterBuffer`: in-process buffer, for a single process and tests.
+- `RedisCounterBuffer`: buffer shared by all processes in one Redis hash.
+- `DailyLearningCounter`: counts shown cards, flushes them and reads merged totals.
+- `increment_daily_learning`: counts cards shown to a user today.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+
+import redis
+from django.conf import settings
+from django.db import connection, transaction
+
+from card_manager.models import ShowCardDailyStat
+
+logger = logging.getLogger(__name__)
+
+# (user id, day) of a counter
+CounterKey = tuple[int, date]
+
+
+@dataclass
+class DailyStatsConfig:
+    """Counter buffer settings.
+
+    Attributes:
+        shared (bool): Buffer in Redis for all processes; flushed by Celery beat.
+        flush_interval (float): Seconds between flushes.
+        batch_size (int): Counters per upsert statement.
+    """
+
+    shared: bool = True
+    flush_interval: float = 10
+    batch_size: int = 500
+
+    @classmethod
+    def from_settings(cls) -> DailyStatsConfig:
+        """Build the config from the DAILY_STATS_BUFFER setting (defaults if missing)."""
+        return cls(**getattr(settings, "DAILY_STATS_BUFFER", {}))
+
+
+class CounterBuffer(ABC):
+    """Buffer of counter deltas keyed by (user id, day)."""
+
+    @abstractmethod
+    def add(self, key: CounterKey, amount: int = 1) -> None:
+        """Add `amount` to the buffered delta of `key`."""
+
+    @abstractmethod
+    def pending(self, key: CounterKey) -> int:
+        """Return the buffered delta of `key` (0 if none)."""
+
+    @abstractmethod
+    def take(self) -> Counter[CounterKey]:
+        """Remove and return all buffered deltas at once."""
+
+    def put_back(self, deltas: Counter[CounterKey]) -> None:
+        """Return deltas of a failed flush to the buffer."""
+        for key, amount in deltas.items():
+            self.add(key, amount)
+
+
+class LocalCounterBuffer(CounterBuffer):
+    """Thread-safe buffer held in process memory."""
+
+    def __init__(self) -> None:
+        self._deltas: Counter[CounterKey] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, key: CounterKey, amount: int = 1) -> None:
+        with self._lock:
+            self._deltas[key] += amount
+
+    def pending(self, key: CounterKey) -> int:
+        with self._lock:
+            return self._deltas[key]
+
+    def take(self) -> Counter[CounterKey]:
+        with self._lock:
+            deltas, self._deltas = self._deltas, Counter()
+        return deltas
+
+
+# KEYS[1]: buffer hash. Reads and deletes it in one step, so increments arriving
+# meanwhile land in a new hash and are taken by the next flush.
+TAKE_SCRIPT = """
+local deltas = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return deltas
+"""
+
+
+class RedisCounterBuffer(CounterBuffer):
+    """Buffer shared by all processes through one Redis hash of "user_id:day" fields.
+
+    Args:
+        name: Buffer name, part of the Redis key.
+        client: Redis client (default: client for REDIS_URL database 1, the cache database).
+    """
+
+    KEY_PREFIX = "counter_buffer"
+
+    def __init__(self, name: str, client: redis.Redis | None = None) -> None:
+        self._key = f"{self.KEY_PREFIX}:{name}"
+        self._client = client or redis.Redis.from_url(f"{settings.REDIS_URL}/1")
+        self._take = self._client.register_script(TAKE_SCRIPT)
+
+    def add(self, key: CounterKey, amount: int = 1) -> None:
+        self._client.hincrby(self._key, self._field(key), amount)
+
+    def pending(self, key: CounterKey) -> int:
+        return int(self._client.hget(self._key, self._field(key)) or 0)
+
+    def take(self) -> Counter[CounterKey]:
+        flat = self._take(keys=[self._key])
+        deltas: Counter[CounterKey] = Counter()
+        for field, amount in zip(flat[::2], flat[1::2]):
+            user_id, day = field.decode().split(":")
+            deltas[(int(user_id), date.fromisoformat(day))] += int(amount)
+        return deltas
+
+    def put_back(self, deltas: Counter[CounterKey]) -> None:
+        with self._client.pipeline(transaction=False) as pipe:
+            for key, amount in deltas.items():
+                pipe.hincrby(self._key, self._field(key), amount)
+            pipe.execute()
+
+    @staticmethod
+    def _field(key: CounterKey) -> str:
+        user_id, day = key
+        return f"{user_id}:{day.isoformat()}"
+
+
+class DailyLearningCounter:
+    """Counts cards shown per user and day through a write-behind buffer.
+
+    Args:
+        buffer: Buffer the increments go to.
+        config: Flush settings (default: DailyStatsConfig.from_settings()).
+        auto_flush: Flush inline once `flush_interval` passed since the last flush.
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        buffer: CounterBuffer,
+        config: DailyStatsConfig | None = None,
+        auto_flush: bool = False,
+    ) -> None:
+        self._buffer = buffer
+        self._config = config or DailyStatsConfig.from_settings()
+        self._auto_flush = auto_flush
+        self._flushed_at = time.monotonic()
+
+    @classmethod
+    def default(cls) -> DailyLearningCounter:
+        """Return the process-wide counter configured by DAILY_STATS_BUFFER."""
+        if cls._default is None:
+            config = DailyStatsConfig.from_settings()
+            if config.shared:
+                cls._default = cls(RedisCounterBuffer("daily_learning"), config)
+            else:
+                cls._default = cls(LocalCounterBuffer(), config, auto_flush=True)
+                atexit.register(cls._default.flush)
+        return cls._default
+
+    def increment(self, user_id: int, amount: int = 1, day: date | None = None) -> None:
+        """Count `amount` cards shown to the user on `day` (default: today)."""
+        self._buffer.add((user_id, day or date.today()), amount)
+        if self._auto_flush and time.monotonic() - self._flushed_at >= self._config.flush_interval:
+            self.flush()
+
+    def count(self, user_id: int, day: date | None = None) -> int:
+        """Return the user's count for `day` (default: today), buffered delta included."""
+        key = (user_id, day or date.today())
+        stored = (
+            ShowCardDailyStat.objects.filter(user_id=key[0], date=key[1])
+            .values_list("count", flat=True)
+            .first()
+        )
+        return (stored or 0) + self._buffer.pending(key)
+
+    def flush(self) -> int:
+        """Upsert all buffered deltas into ShowCardDailyStat; return the rows written."""
+        self._flushed_at = time.monotonic()
+        deltas = self._buffer.take()
+        if not deltas:
+            return 0
+
+        rows = [(user_id, day, amount) for (user_id, day), amount in deltas.items() if amount]
+        try:
+            with transaction.atomic():
+                for start in range(0, len(rows), self._config.batch_size):
+                    self._upsert(rows[start : start + self._config.batch_size])
+        except Exception:
+            self._buffer.put_back(deltas)
+            logger.exception("Flushing %d daily learning counters failed", len(rows))
+            raise
+        return len(rows)
+
+    @staticmethod
+    def _upsert(rows: list[tuple[int, date, int]]) -> None:
+        meta = ShowCardDailyStat._meta
+        table = connection.ops.quote_name(meta.db_table)
+        user, day, count = (
+            connection.ops.quote_name(meta.get_field(name).column)
+            for name in ("user", "date", "count")
+        )
+        values = ", ".join(["(%s, %s, %s)"] * len(rows))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({user}, {day}, {count}) VALUES {values} "
+                f"ON CONFLICT ({user}, {day}) "
+                f"DO UPDATE SET {count} = {table}.{count} + EXCLUDED.{count}",
+                [value for row in rows for value in row],
+            )
+
+
+def increment_daily_learning(user, amount: int = 1) -> None:
+    """Count `amount` cards shown to `user` today in the process-wide counter."""
+    DailyLearningCounter.default().increment(user.id, amount)
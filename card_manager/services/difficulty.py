@@ -0,0 +1,168 @@
+"""
+Difficulty module that maintains per-deck card difficulty buckets.
+
+Every card stores the bucket its easiness factor falls into (`Card.difficulty`)
+and every deck stores how many cards each bucket holds (`Deck.hard_cards`,
+`Deck.medium_cards`, `Deck.easy_cards`). Review and card creation/deletion paths
+report bucket changes here, so readers (e.g. quizzes) know bucket sizes without
+COUNT queries and can fetch bucket members through an index.
+
+Decks that existed before the buckets (and new, empty decks) start with
+`Deck.buckets_counted` unset. The first `counts` call over such a deck rebuilds
+its buckets, so no manual backfill is needed after the schema migration.
+
+It provides:
+- `DifficultyConfig`: configurable EF boundaries between buckets.
+- `DifficultyBuckets`: classifies EF values and keeps deck counters in sync.
+
+Exceptions:
+- InvalidBoundariesError: Raised when configured boundaries are not increasing.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+
+from card_manager.models import Card, Deck, Difficulty
+
+COUNT_FIELDS = {
+    Difficulty.HARD: "hard_cards",
+    Difficulty.MEDIUM: "medium_cards",
+    Difficulty.EASY: "easy_cards",
+}
+
+
+@dataclass(frozen=True)
+class DifficultyConfig:
+    """EF boundaries between difficulty buckets.
+
+    Cards with `ef < medium_min_ef` are hard, cards with `ef >= easy_min_ef`
+    are easy and the rest are medium.
+
+    Raises:
+        InvalidBoundariesError: If `medium_min_ef >= easy_min_ef`.
+    """
+
+    medium_min_ef: float = 2.0
+    easy_min_ef: float = 3.5
+
+    def __post_init__(self) -> None:
+        if not self.medium_min_ef < self.easy_min_ef:
+            raise InvalidBoundariesError(self.medium_min_ef, self.easy_min_ef)
+
+    @classmethod
+    def from_settings(cls) -> DifficultyConfig:
+        """Build the config from the CARD_DIFFICULTY setting (defaults if missing)."""
+        return cls(**getattr(settings, "CARD_DIFFICULTY", {}))
+
+
+class DifficultyBuckets:
+    """Classifies cards into difficulty buckets and maintains deck counters.
+
+    Args:
+        config: Bucket boundaries (default: DifficultyConfig.from_settings()).
+    """
+
+    def __init__(self, config: DifficultyConfig | None = None) -> None:
+        self._config = config or DifficultyConfig.from_settings()
+
+    def classify(self, ef: float) -> Difficulty:
+        """Return the bucket an easiness factor falls into."""
+        if ef >= self._config.easy_min_ef:
+            return Difficulty.EASY
+        if ef >= self._config.medium_min_ef:
+            return Difficulty.MEDIUM
+        return Difficulty.HARD
+
+    @staticmethod
+    def apply(changes: Counter[tuple[int, int]]) -> None:
+        """Add counter deltas to decks, with one UPDATE per affected deck.
+
+        Args:
+            changes: `(deck_id, difficulty) -> delta` counter.
+        """
+        per_deck: dict[int, dict[str, F]] = defaultdict(dict)
+        for (deck_id, difficulty), delta in changes.items():
+            if delta:
+                field = COUNT_FIELDS[Difficulty(difficulty)]
+                per_deck[deck_id][field] = F(field) + delta
+
+        for deck_id, updates in per_deck.items():
+            Deck.objects.filter(id=deck_id).update(**updates)
+
+    @staticmethod
+    def moves(moved: Iterable[tuple[int, int, int]]) -> Counter[tuple[int, int]]:
+        """Turn `(deck_id, old_difficulty, new_difficulty)` moves into counter deltas."""
+        changes: Counter[tuple[int, int]] = Counter()
+        for deck_id, old, new in moved:
+            if old != new:
+                changes[(deck_id, old)] -= 1
+                changes[(deck_id, new)] += 1
+        return changes
+
+    @staticmethod
+    def counts(deck_ids: Iterable[int]) -> dict[Difficulty, int]:
+        """Return the number of cards per bucket across `deck_ids` with one query.
+
+        Decks whose buckets were never counted are rebuilt first (once per deck).
+        """
+        decks = Deck.objects.filter(id__in=list(deck_ids))
+        aggregates = {field: Sum(field) for field in COUNT_FIELDS.values()}
+        totals = decks.aggregate(
+            uncounted=Count("id", filter=Q(buckets_counted=False)), **aggregates
+        )
+        if totals["uncounted"]:
+            uncounted = decks.filter(buckets_counted=False).values_list("id", flat=True)
+            DifficultyBuckets().rebuild(list(uncounted))
+            totals = decks.aggregate(**aggregates)
+        return {difficulty: totals[field] or 0 for difficulty, field in COUNT_FIELDS.items()}
+
+    def rebuild(self, deck_ids: Iterable[int] | None = None) -> None:
+        """Reclassify cards with the current boundaries and recount the buckets.
+
+        Needed after changing CARD_DIFFICULTY or to repair counters. The deck rows
+        are locked meanwhile, so concurrent rebuilds and counter updates of the same
+        decks wait for each other instead of double counting.
+
+        Args:
+            deck_ids: Decks to rebuild (default: all decks).
+        """
+        cards = Card.objects.all()
+        decks = Deck.objects.all()
+        if deck_ids is not None:
+            cards = cards.filter(deck_id__in=deck_ids)
+            decks = decks.filter(id__in=deck_ids)
+
+        with transaction.atomic():
+            list(decks.select_for_update().values_list("id", flat=True))
+            cards.update(
+                difficulty=Case(
+                    When(ef__gte=self._config.easy_min_ef, then=Value(Difficulty.EASY)),
+                    When(ef__gte=self._config.medium_min_ef, then=Value(Difficulty.MEDIUM)),
+                    default=Value(Difficulty.HARD),
+                    output_field=IntegerField(),
+                )
+            )
+            decks.update(buckets_counted=True, **{field: 0 for field in COUNT_FIELDS.values()})
+
+            changes: Counter[tuple[int, int]] = Counter()
+            for row in cards.values("deck_id", "difficulty").annotate(total=Count("id")):
+                changes[(row["deck_id"], row["difficulty"])] = row["total"]
+            self.apply(changes)
+
+
+class InvalidBoundariesError(ValueError):
+    """Raised when difficulty bucket boundaries are not strictly increasing."""
+
+    def __init__(self, medium_min_ef: float, easy_min_ef: float) -> None:
+        super().__init__(
+            f"medium_min_ef ({medium_min_ef}) must be lower than easy_min_ef ({easy_min_ef})."
+        )
+        self.medium_min_ef = medium_min_ef
+        self.easy_min_ef = easy_min_ef
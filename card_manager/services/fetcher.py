@@ -5,6 +5,7 @@ It provides:
 - Fetcher classes to retrieve word data from the API.
 - Error mappers to translate API responses and exceptions into domain-specific errors.
 - A service class to orchestrate fetching words and handling errors.
+- Async variants of the fetcher and service for concurrent lookups from asyncio code.
 
 Exceptions:
 - ExternalAPIError: Base exception for all fetcher-related API errors.
@@ -25,9 +26,10 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Type
 
+import httpx
 import requests
 
-from card_manager.services.providers import Provider
+from card_manager.services.providers import AsyncProvider, Provider
 from card_manager.services.services_types import ProviderResponse
 
 
@@ -64,6 +66,29 @@ class FetcherService(ABC):
     def get_fetched_word(self, word: str) -> ProviderResponse | ExternalAPIError: ...
 
 
+class AsyncFetcher(ABC):
+    """Abstract base class for fetching word data from an API without blocking."""
+
+    @abstractmethod
+    def __init__(self, provider: AsyncProvider, api_url: str) -> None: ...
+
+    @abstractmethod
+    async def fetch_word(self, word: str) -> ProviderResponse:
+        """Fetch a word from an API."""
+
+    async def aclose(self) -> None:
+        """Release connections held for the running event loop."""
+
+
+class AsyncFetcherService(ABC):
+
+    @abstractmethod
+    async def get_fetched_word(self, word: str) -> ProviderResponse | ExternalAPIError: ...
+
+    async def aclose(self) -> None:
+        """Release connections held for the running event loop."""
+
+
 class DictApiFetcher(Fetcher):
     """
     Fetcher for dictionaryapi.dev API.
@@ -93,6 +118,27 @@ class DictApiFetcher(Fetcher):
         return response
 
 
+class AsyncDictApiFetcher(AsyncFetcher):
+    """Async fetcher for dictionaryapi.dev API. See DictApiFetcher."""
+
+    def __init__(self, provider: AsyncProvider, api_url: str = DICTIONARYAPI_URL):
+        self._api_url = api_url
+        self._provider = provider
+
+    async def fetch_word(self, word: str) -> ProviderResponse:
+        """
+        Fetch the word data from the API.
+
+        Args:
+            word (str): The word to fetch data from the dictionaryapi.def for.
+        """
+        endpoint = f"{self._api_url}{word}"
+        return await self._provider.get_word_data(endpoint)
+
+    async def aclose(self) -> None:
+        await self._provider.aclose()
+
+
 class DictApiErrorMapper(ErrorMapper):
     """Handles API exceptions and status codes for dictionaryapi.dev"""
 
@@ -136,7 +182,10 @@ class DictApiErrorMapper(ErrorMapper):
         Returns:
             ExternalAPIError: Mapped domain error.
         """
-        if isinstance(exception, requests.RequestException):
+        if isinstance(exception, ExternalAPIError):
+            return exception  # already a domain error, e.g. raised by a rate limiter
+
+        if isinstance(exception, (requests.RequestException, httpx.HTTPError)):
             logger.error(
                 "Network/request error while fetching '%s': %s",
                 word,
@@ -180,6 +229,33 @@ class WordFetcherService(FetcherService):
             return self.error_handler.map_exception(word, e)
 
 
+class AsyncWordFetcherService(AsyncFetcherService):
+    """Async counterpart of WordFetcherService for AsyncFetcher implementations."""
+
+    def __init__(self, fetcher: AsyncFetcher, error_handler: ErrorMapper):
+        self.fetcher = fetcher
+        self.error_handler = error_handler
+
+    async def get_fetched_word(self, word: str) -> ProviderResponse | ExternalAPIError:
+        """Fetch a word and return the response or a mapped domain error.
+
+        Args:
+            word (str): The word to fetch.
+
+        Returns:
+            ProviderResponse: The API response if successful.
+            ExternalAPIError: Mapped error if fetching or status check fails.
+        """
+        try:
+            response = await self.fetcher.fetch_word(word)
+            return self.error_handler.map_status(response, word)
+        except (httpx.HTTPError, ExternalAPIError) as e:
+            return self.error_handler.map_exception(word, e)
+
+    async def aclose(self) -> None:
+        await self.fetcher.aclose()
+
+
 class ExternalAPIError(Exception):
     """Base exception for all fetcher-related API errors."""
 
@@ -0,0 +1,80 @@
+"""
+Forecast module that counts cards coming due in the next days.
+
+A "cards due per day" chart used to need every `Card.due_date` of the user in
+Python. The counts are now computed by one GROUP BY over the truncated due date,
+which reads only the `(deck, due_date, id)` index range of each of the user's
+decks up to the end of the forecast. Overdue cards collapse into one group, so
+the query returns at most `days + 1` rows however many cards there are.
+
+It provides:
+- `Forecast`: due-card counts per day, starting today.
+- `DueForecast`: computes forecasts for a user or one of their decks.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TypedDict
+
+from django.db.models import Case, Count, DateField, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from card_manager.models import Card
+
+
+class Forecast(TypedDict):
+    """Cards due per day; `counts[i]` is the number due on `start + i` days."""
+
+    start: date
+    overdue: int
+    counts: list[int]
+
+
+class DueForecast:
+    """Counts due cards per day with a single grouped query."""
+
+    MAX_DAYS = 365
+
+    def forecast(
+        self, user, days: int = 30, deck_id: int | None = None, today: date | None = None
+    ) -> Forecast:
+        """Return the cards due on each of the next `days` days, today included.
+
+        Args:
+            user: Owner of the cards.
+            days: Length of the forecast, capped at MAX_DAYS.
+            deck_id: Restrict to one of the user's decks (default: all decks).
+            today: First day of the forecast (default: today in the current time zone).
+        """
+        days = min(days, self.MAX_DAYS)
+        today = today or timezone.localdate()
+        tz = timezone.get_current_timezone()
+        start = datetime.combine(today, time.min, tzinfo=tz)
+        end = datetime.combine(today + timedelta(days=days), time.min, tzinfo=tz)
+
+        cards = Card.objects.filter(deck__user=user, due_date__lt=end)
+        if deck_id is not None:
+            cards = cards.filter(deck_id=deck_id)
+
+        # overdue cards all fall into the NULL group
+        rows = (
+            cards.annotate(
+                day=Case(
+                    When(due_date__lt=start, then=Value(None, output_field=DateField())),
+                    default=TruncDate("due_date", tzinfo=tz),
+                )
+            )
+            .values("day")
+            .annotate(cards=Count("*"))
+            .order_by()
+        )
+
+        forecast = Forecast(start=today, overdue=0, counts=[0] * days)
+        for row in rows:
+            if row["day"] is None:
+                forecast["overdue"] = row["cards"]
+            else:
+                forecast["counts"][(row["day"] - today).days] = row["cards"]
+        return forecast
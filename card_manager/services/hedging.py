@@ -0,0 +1,304 @@
+"""
+Hedging module that cuts the tail latency of word lookups.
+
+A slow answer from one dictionary source used to become a slow card creation.
+`HedgedWordService` queries registered sources in priority order: if the current
+source has not answered within its own p95 latency, the next source is queried in
+parallel (a hedged request) and the first usable answer wins. A source failing
+with a transient error (5xx/429, network error, timeout) is skipped right away.
+
+Sources are full fetch → validate → parse pipelines, so every source can come
+with its own provider, validator and parser. Every source must reach a different
+upstream: a hedge or a fallback to the same API would only double the load on a
+server that is already slow or throttling us, and wait again on the same rate
+limiter bucket. With a single source there is nothing to hedge to, so a lookup
+only waits for it (up to the timeout).
+
+It provides:
+- `HedgingConfig`: hedge delay, deadline and worker settings.
+- `LatencyTracker`: rolling latency window of a source.
+- `HedgedWordService`: WordDataService over several prioritized sources.
+- `HedgedDictApiModule`: factory for the hedged dictionaryapi.dev service.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
+
+import pinject
+from django.conf import settings
+from requests import Response
+
+from card_manager.services.cache import WordDataCache
+from card_manager.services.fetcher import (
+    BadRequestError,
+    DictApiErrorMapper,
+    DictApiFetcher,
+    ExternalAPIError,
+    ServiceUnavailableError,
+    WordFetcherService,
+    WordNotFoundError,
+)
+from card_manager.services.parser import Parser
+from card_manager.services.providers import Provider
+from card_manager.services.service import (
+    DictApiBindings,
+    DictApiConfig,
+    DictApiWordService,
+    InjectedDictApiWordService,
+    WordDataService,
+)
+from card_manager.services.services_types import ParsedWordData
+from card_manager.services.validator import Validator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgingConfig:
+    """Settings of HedgedWordService.
+
+    Attributes:
+        percentile (float): Latency percentile of a source after which the next is hedged.
+        window (int): Latencies kept per source.
+        min_samples (int): Samples needed before the percentile replaces `initial_delay`.
+        initial_delay (float): Hedge delay in seconds while a source has too few samples.
+        min_delay (float): Lower bound of the hedge delay in seconds.
+        max_delay (float): Upper bound of the hedge delay in seconds.
+        timeout (float): Seconds after which a lookup fails if no source answered.
+        max_workers (int): Threads running source lookups.
+    """
+
+    percentile: float = 95
+    window: int = 200
+    min_samples: int = 20
+    initial_delay: float = 1.0
+    min_delay: float = 0.05
+    max_delay: float = 5.0
+    timeout: float = 30.0
+    max_workers: int = 16
+
+    @classmethod
+    def from_settings(cls) -> HedgingConfig:
+        """Build the config from the DICTIONARY_HEDGING setting (defaults if missing)."""
+        return cls(**getattr(settings, "DICTIONARY_HEDGING", {}))
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of lookup latencies in seconds."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the nearest-rank percentile, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+
+class HedgedWordService(WordDataService):
+    """Looks words up on prioritized sources with hedged requests and fallback.
+
+    WordNotFoundError, BadRequestError and validation errors are answers, not
+    source failures: they are raised without asking other sources. Requests that
+    lose the race are not cancelled; they finish in the background and still
+    feed their source's latency window.
+
+    Args:
+        word_cache: Shared cache consulted before any source, or None.
+        config: Hedging settings (default: HedgingConfig.from_settings()).
+    """
+
+    def __init__(
+        self, word_cache: WordDataCache | None = None, config: HedgingConfig | None = None
+    ) -> None:
+        self._word_cache = word_cache
+        self._config = config or HedgingConfig.from_settings()
+        self._sources: list[tuple[str, WordDataService]] = []
+        self._upstreams: dict[str, str] = {}
+        self._latencies: dict[str, LatencyTracker] = {}
+        self._executor = ThreadPoolExecutor(
+            self._config.max_workers, thread_name_prefix="hedged-lookup"
+        )
+        self.stats: Counter[str] = Counter()
+
+    def register(self, name: str, service: WordDataService, upstream: str | None = None) -> None:
+        """Add a source after the already registered ones.
+
+        `service` should not cache on its own; caching happens in front of all sources.
+
+        Args:
+            name: Source name in stats and logs.
+            service: Lookup pipeline of the source.
+            upstream: Server the source queries (default: `name`). Sources must
+                not share an upstream.
+        """
+        upstream = upstream or name
+        if name in self._latencies:
+            raise ValueError(f"Source '{name}' is already registered.")
+        if upstream in self._upstreams.values():
+            raise ValueError(f"Upstream '{upstream}' already has a source.")
+        self._sources.append((name, service))
+        self._upstreams[name] = upstream
+        self._latencies[name] = LatencyTracker(self._config.window)
+
+    def register_provider(
+        self,
+        name: str,
+        provider: Provider,
+        validator_factory: Callable[[Response], Validator],
+        parser_factory: Callable[[Response, int], Parser],
+        config: DictApiConfig | None = None,
+        upstream: str | None = None,
+    ) -> None:
+        """Add a source built from a provider, validator and parser (see `register`).
+
+        `config` defaults to DictApiConfig.from_settings().
+        """
+        config = config or DictApiConfig.from_settings()
+        fetcher = WordFetcherService(
+            DictApiFetcher(provider, config.api_url), DictApiErrorMapper()
+        )
+        self.register(
+            name,
+            DictApiWordService(fetcher, validator_factory, parser_factory, None, config),
+            upstream,
+        )
+
+    def hedge_delay(self, name: str) -> float:
+        """Seconds to wait for source `name` before hedging to the next source."""
+        latencies = self._latencies[name]
+        delay = self._config.initial_delay
+        if len(latencies) >= self._config.min_samples:
+            delay = latencies.percentile(self._config.percentile)
+        return min(max(delay, self._config.min_delay), self._config.max_delay)
+
+    def get_clean_word(self, word: str) -> ParsedWordData:
+        """
+        Return clean word data from the first source giving a usable answer.
+
+        Raises:
+            WordNotFoundError: If the answering source does not know the word.
+            ServiceUnavailableError: If no source answered within the timeout.
+            ExternalAPIError: If every source failed; the last failure is raised.
+            ResponseValidationError: If the answering source's response is unusable.
+        """
+        if self._word_cache is None:
+            return self._hedged_fetch(word)
+
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+        return self._word_cache.fill(word, self._hedged_fetch)
+
+    def _hedged_fetch(self, word: str) -> ParsedWordData:
+        if not self._sources:
+            raise ServiceUnavailableError("No dictionary sources are registered.")
+
+        deadline = time.monotonic() + self._config.timeout
+        waiting = iter(self._sources)
+        pending: dict[Future, str] = {}
+        last_error: ExternalAPIError | None = None
+
+        def launch() -> bool:
+            name, service = next(waiting, (None, None))
+            if service is None:
+                return False
+            pending[self._executor.submit(self._timed_lookup, name, service, word)] = name
+            return True
+
+        launch()
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            newest = list(pending.values())[-1]
+            done, _ = wait(
+                pending, min(self.hedge_delay(newest), remaining), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                if launch():
+                    self.stats["hedged"] += 1
+                    logger.info("Hedging lookup of '%s': '%s' is slow", word, newest)
+                continue
+
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except ExternalAPIError as e:
+                    if isinstance(e, (WordNotFoundError, BadRequestError)):
+                        raise
+                    logger.warning("Source '%s' failed for '%s': %s", name, word, e)
+                    last_error = e
+                    continue
+                self.stats[f"won:{name}"] += 1
+                return result
+
+            if not pending and launch():
+                self.stats["fallbacks"] += 1
+
+        if pending:
+            raise ServiceUnavailableError(
+                f"No dictionary source answered '{word}' within {self._config.timeout}s"
+            )
+        raise last_error
+
+    def _timed_lookup(self, name: str, service: WordDataService, word: str) -> ParsedWordData:
+        start = time.monotonic()
+        try:
+            return service.get_clean_word(word)
+        finally:
+            self._latencies[name].record(time.monotonic() - start)
+
+
+class UncachedDictApiBindings(DictApiBindings):
+    """DictApiBindings for a hedged source: caching happens in front of all sources."""
+
+    def provide_word_cache(self) -> None:
+        return None
+
+
+class HedgedDictApiModule:
+    """Factory for the hedged dictionary service.
+
+    dictionaryapi.dev (behind the offline dictionary, if one is imported) is the
+    only upstream so far, so the service has a single source and does not hedge.
+    Register a second provider here once there is one.
+
+    Methods:
+        get_hedged_service(): Returns the process-wide HedgedWordService.
+    """
+
+    _service = None
+
+    @classmethod
+    def get_hedged_service(cls) -> HedgedWordService:
+        if cls._service is None:
+            service = HedgedWordService(WordDataCache(provider=DictApiConfig.provider_name))
+            graph = pinject.new_object_graph(
+                binding_specs=[UncachedDictApiBindings()], allow_injecting_none=True
+            )
+            service.register(DictApiConfig.provider_name, graph.provide(InjectedDictApiWordService))
+            cls._service = service
+        return cls._service
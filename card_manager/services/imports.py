@@ -0,0 +1,304 @@
+"""
+Import module that creates many cards in one deck from a word list.
+
+A single import job replaces one HTTP request and one Celery task per word:
+the deck is resolved once, words already in the deck are filtered out with one
+query, dictionary lookups run concurrently (bounded by a semaphore) on the async
+word service, and cards are inserted with `bulk_create` in chunks as lookups
+complete. Progress is reported over the user's `ws/cards/` group as aggregated
+updates instead of one message per word.
+
+It provides:
+- `parse_word_list`: turns pasted text or CSV/plain-text file content into unique words.
+- `ImportResult`: outcome of an import job.
+- `ImportProgress`: throttled WebSocket progress reporter of an import job.
+- `BulkCardImporter`: looks words up and stores them as cards in a user's deck.
+
+Exceptions:
+- WordListError: Raised when a word list is empty, too long or holds too long words.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+import time
+from collections import Counter
+from typing import Iterable, TypedDict
+
+from asgiref.sync import sync_to_async
+from django.db.models.functions import Lower
+
+from card_manager.models import Card, Deck
+from card_manager.services.cards import CardDataBuilder
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.fetcher import ExternalAPIError, WordNotFoundError
+from card_manager.services.service import AsyncWordDataService, DictApiModule
+from card_manager.services.services_types import ParsedWordData
+from card_manager.services.validator import ResponseValidationError
+
+logger = logging.getLogger(__name__)
+
+MAX_IMPORT_WORDS = 500
+MAX_WORD_LENGTH = Card._meta.get_field("word").max_length
+
+
+def parse_word_list(text: str, max_words: int = MAX_IMPORT_WORDS) -> list[str]:
+    """Return unique words (case-insensitive, first spelling kept) in input order.
+
+    Accepts one word per line, comma/semicolon/tab separated words, or CSV rows;
+    blank cells are skipped.
+
+    Raises:
+        WordListError: If there are no words, more than `max_words` or a word is too long.
+    """
+    words: dict[str, str] = {}
+    for row in csv.reader(io.StringIO(text.replace(";", ",").replace("\t", ","))):
+        for cell in row:
+            word = " ".join(cell.split())
+            if word:
+                words.setdefault(word.lower(), word)
+
+    if not words:
+        raise WordListError("The word list is empty.")
+    if len(words) > max_words:
+        raise WordListError(f"Too many words: {len(words)} (max {max_words}).")
+    too_long = [word for word in words.values() if len(word) > MAX_WORD_LENGTH]
+    if too_long:
+        raise WordListError(f"Words longer than {MAX_WORD_LENGTH} characters: {too_long[:5]}.")
+
+    return list(words.values())
+
+
+class ImportResult(TypedDict):
+    """Outcome of an import job, also sent as the final progress message."""
+
+    import_id: str
+    deck_name: str
+    total: int
+    created: int
+    skipped: list[str]
+    not_found: list[str]
+    failed: list[str]
+
+
+class ImportProgress:
+    """Sends aggregated progress of an import job to the user's WebSocket group.
+
+    A message goes out at most every `every` processed words or `interval`
+    seconds, whichever comes first, plus a final message with the result.
+
+    Args:
+        channel_layer: Channels layer to send through, or None to only log.
+        group: Channels group of the user, e.g. "user_1".
+        import_id: Id of the import job, echoed in every message.
+        total: Number of words in the job.
+        every: Processed words between two messages.
+        interval: Max seconds between two messages while words are processed.
+    """
+
+    def __init__(
+        self,
+        channel_layer,
+        group: str,
+        import_id: str,
+        total: int,
+        every: int = 25,
+        interval: float = 1.0,
+    ) -> None:
+        self._channel_layer = channel_layer
+        self._group = group
+        self.import_id = import_id
+        self._total = total
+        self._every = every
+        self._interval = interval
+        self.counts: Counter[str] = Counter()
+        self._sent_at_processed = 0
+        self._sent_at = time.monotonic()
+
+    @property
+    def processed(self) -> int:
+        return sum(self.counts.values())
+
+    async def advance(self, outcome: str, amount: int = 1) -> None:
+        """Record `amount` words with `outcome` and send an update if one is due."""
+        self.counts[outcome] += amount
+        due = (
+            self.processed - self._sent_at_processed >= self._every
+            or time.monotonic() - self._sent_at >= self._interval
+        )
+        if due and self.processed < self._total:
+            await self._send(
+                {
+                    "status": "progress",
+                    "type": "import_progress",
+                    "message": f"{self.processed}/{self._total} words processed",
+                    "import_id": self.import_id,
+                    "total": self._total,
+                    "processed": self.processed,
+                    "counts": dict(self.counts),
+                }
+            )
+
+    async def finish(self, result: ImportResult) -> None:
+        await self._send(
+            {
+                "status": "success",
+                "type": "import_finished",
+                "message": (
+                    f"Imported {result['created']} of {result['total']} words "
+                    f"into '{result['deck_name']}'."
+                ),
+                **result,
+            }
+        )
+
+    async def fail(self, message: str) -> None:
+        await self._send(
+            {
+                "status": "error",
+                "type": "import_failed",
+                "import_id": self.import_id,
+                "message": message,
+            }
+        )
+
+    async def _send(self, content: dict) -> None:
+        self._sent_at_processed = self.processed
+        self._sent_at = time.monotonic()
+        if self._channel_layer is None:
+            logger.warning("Cannot send import progress: channel_layer is None")
+            return
+        await self._channel_layer.group_send(
+            self._group, {"type": "card_status", "content": content}
+        )
+
+
+class BulkCardImporter:
+    """Creates cards for a list of words in one deck.
+
+    Args:
+        word_service: Async source of parsed word data (default: DictApiModule async service).
+        builder: Converts parsed data into card data (default: CardDataBuilder()).
+        buckets: Difficulty bucket bookkeeping (default: DifficultyBuckets()).
+        concurrency: Max dictionary lookups in flight.
+        chunk_size: Cards per `bulk_create`.
+    """
+
+    def __init__(
+        self,
+        word_service: AsyncWordDataService | None = None,
+        builder: CardDataBuilder | None = None,
+        buckets: DifficultyBuckets | None = None,
+        concurrency: int = 20,
+        chunk_size: int = 100,
+    ) -> None:
+        self._word_service = word_service or DictApiModule.get_async_dict_service()
+        self._builder = builder or CardDataBuilder()
+        self._buckets = buckets or DifficultyBuckets()
+        self._concurrency = concurrency
+        self._chunk_size = chunk_size
+
+    async def run(
+        self, words: list[str], deck_name: str, user, progress: ImportProgress
+    ) -> ImportResult:
+        """Look `words` up and store new ones as cards in the user's `deck_name` deck.
+
+        Words already in the deck are skipped, as are lookups resolving to a word
+        already in the deck or in this import (the dictionary may normalize spelling).
+        """
+        deck = await sync_to_async(self._get_deck)(user, deck_name)
+        existing = await sync_to_async(self.existing_words)(deck, words)
+
+        skipped = [word for word in words if word.lower() in existing]
+        if skipped:
+            await progress.advance("skipped", len(skipped))
+
+        not_found: list[str] = []
+        failed: list[str] = []
+        pending: list[Card] = []
+        created = 0
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def lookup(word: str) -> tuple[str, ParsedWordData | None, str]:
+            async with semaphore:
+                try:
+                    return word, await self._word_service.get_clean_word(word), "created"
+                except WordNotFoundError:
+                    return word, None, "not_found"
+                except (ExternalAPIError, ResponseValidationError) as e:
+                    logger.warning("Import lookup of '%s' failed: %s", word, e)
+                    return word, None, "failed"
+
+        to_fetch = [word for word in words if word.lower() not in existing]
+        for future in asyncio.as_completed([lookup(word) for word in to_fetch]):
+            word, parsed, outcome = await future
+
+            if parsed is not None:
+                card = self._build_card(deck, parsed)
+                if card.word.lower() in existing:
+                    outcome = "skipped"
+                    skipped.append(word)
+                else:
+                    existing.add(card.word.lower())
+                    pending.append(card)
+            elif outcome == "not_found":
+                not_found.append(word)
+            else:
+                failed.append(word)
+
+            if len(pending) >= self._chunk_size:
+                created += await sync_to_async(self.insert)(deck, pending)
+                pending = []
+            await progress.advance(outcome)
+
+        if pending:
+            created += await sync_to_async(self.insert)(deck, pending)
+
+        return ImportResult(
+            import_id=progress.import_id,
+            deck_name=deck_name,
+            total=len(words),
+            created=created,
+            skipped=skipped,
+            not_found=not_found,
+            failed=failed,
+        )
+
+    async def aclose(self) -> None:
+        """Close the word service's connections; call before the import's event loop ends."""
+        await self._word_service.aclose()
+
+    @staticmethod
+    def existing_words(deck: Deck, words: Iterable[str]) -> set[str]:
+        """Return lowercased `words` already in `deck`, with one query."""
+        return set(
+            Card.objects.filter(deck=deck)
+            .annotate(word_lower=Lower("word"))
+            .filter(word_lower__in=[word.lower() for word in words])
+            .values_list("word_lower", flat=True)
+        )
+
+    def insert(self, deck: Deck, cards: list[Card]) -> int:
+        """Insert `cards` with one `bulk_create` and update the deck's bucket counters."""
+        Card.objects.bulk_create(cards, batch_size=self._chunk_size)
+        self._buckets.apply(Counter((deck.id, card.difficulty) for card in cards))
+        return len(cards)
+
+    def _build_card(self, deck: Deck, parsed: ParsedWordData) -> Card:
+        card_data = self._builder.build(parsed)
+        card = Card(deck=deck, json_data=card_data, word=card_data["word"])
+        card.difficulty = self._buckets.classify(card.ef)
+        card.render()  # bulk_create skips Card.save
+        return card
+
+    @staticmethod
+    def _get_deck(user, deck_name: str) -> Deck:
+        deck, _ = Deck.objects.get_or_create(user=user, deck_name=deck_name)
+        return deck
+
+
+class WordListError(ValueError):
+    """Raised when an import word list is empty, too long or holds invalid words."""
@@ -0,0 +1,181 @@
+"""
+Notifications module that batches card status events sent to users.
+
+Every created card used to cost one channel layer `group_send` from its Celery
+task and one WebSocket frame from the consumer, so a bulk addition flooded Redis
+and the browser. Events are now coalesced per user over a short window on both
+hops: tasks hand them to a `NotificationAggregator`, which sends one channel
+layer message per user and window, and every WebSocket connection buffers what
+it receives in a `FrameCoalescer`, which sends one frame per window.
+
+A window holding a single event is sent unchanged. Several events go out as one
+batch frame flagged by its type, so clients can handle both formats:
+`{"type": "batch", "events": [<event>, ...]}`.
+
+It provides:
+- `NotificationConfig`: window and batch size settings.
+- `batch_frame`: WebSocket frame for the events of one window.
+- `NotificationAggregator`: coalesces events of synchronous senders (Celery tasks)
+  before they reach the channel layer.
+- `FrameCoalescer`: coalesces events of one WebSocket connection into frames.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_TYPE = "batch"
+# channel layer message types, handled by CardProgressConsumer
+EVENT_MESSAGE = "card_status"
+BATCH_MESSAGE = "card_status_batch"
+
+
+@dataclass(frozen=True)
+class NotificationConfig:
+    """Notification batching settings.
+
+    Attributes:
+        window (float): Seconds events are collected before they are sent together.
+        max_batch (int): Events that trigger a send before the window ends.
+    """
+
+    window: float = 0.1
+    max_batch: int = 100
+
+    @classmethod
+    def from_settings(cls) -> NotificationConfig:
+        """Build the config from the NOTIFICATION_BATCHING setting (defaults if missing)."""
+        return cls(**getattr(settings, "NOTIFICATION_BATCHING", {}))
+
+
+def batch_frame(events: list[dict]) -> dict:
+    """Return the WebSocket frame of one window's events: the event itself, or a batch."""
+    if len(events) == 1:
+        return events[0]
+    return {"type": BATCH_TYPE, "events": events}
+
+
+class NotificationAggregator:
+    """Coalesces card status events per group before sending them to the channel layer.
+
+    Events are sent by a timer thread `window` seconds after the first event of
+    a window, or right away once a group holds `max_batch` events. Call `flush`
+    before the process exits to send what is still buffered.
+
+    Args:
+        channel_layer: Channels layer to send through, or None to only log.
+        config: Batching settings (default: NotificationConfig.from_settings()).
+    """
+
+    _default = None
+
+    def __init__(self, channel_layer, config: NotificationConfig | None = None) -> None:
+        self._channel_layer = channel_layer
+        self._config = config or NotificationConfig.from_settings()
+        self._pending: dict[str, list[dict]] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @classmethod
+    def default(cls) -> NotificationAggregator:
+        """Return the aggregator of this process (a forked worker gets its own)."""
+        if cls._default is None or cls._default._pid != os.getpid():
+            cls._default = cls(get_channel_layer())
+        return cls._default
+
+    def send(self, group: str, content: dict) -> None:
+        """Queue `content` for the users of `group`."""
+        with self._lock:
+            events = self._pending.setdefault(group, [])
+            events.append(content)
+            full = len(events) >= self._config.max_batch
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self._config.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all buffered events, one channel layer message per group."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for group, events in pending.items():
+            if self._channel_layer is None:
+                logger.warning("Cannot send %d notifications: channel_layer is None", len(events))
+                continue
+            try:
+                async_to_sync(self._channel_layer.group_send)(group, self.message(events))
+            except Exception:
+                logger.exception("Sending %d notifications to %s failed", len(events), group)
+
+    @staticmethod
+    def message(events: list[dict]) -> dict:
+        """Channel layer message carrying `events`."""
+        if len(events) == 1:
+            return {"type": EVENT_MESSAGE, "content": events[0]}
+        return {"type": BATCH_MESSAGE, "contents": events}
+
+
+class FrameCoalescer:
+    """Buffers the events of one WebSocket connection and sends them as frames.
+
+    Args:
+        send: Coroutine function sending one frame.
+        config: Batching settings (default: NotificationConfig.from_settings()).
+    """
+
+    def __init__(
+        self, send: Callable[[dict], Awaitable[None]], config: NotificationConfig | None = None
+    ) -> None:
+        self._send = send
+        self._config = config or NotificationConfig.from_settings()
+        self._pending: list[dict] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def add(self, events: list[dict]) -> None:
+        """Queue `events`; they are sent when the window ends or the batch is full."""
+        self._pending.extend(events)
+        if len(self._pending) >= self._config.max_batch:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send the buffered events as one frame."""
+        self._cancel_timer()
+        if not self._pending:
+            return
+        events, self._pending = self._pending, []
+        await self._send(batch_frame(events))
+
+    def close(self) -> None:
+        """Drop buffered events and the pending flush (the connection is gone)."""
+        self._cancel_timer()
+        self._pending = []
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._config.window)
+        self._flush_task = None
+        await self.flush()
+
+    def _cancel_timer(self) -> None:
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
@@ -0,0 +1,249 @@
+"""
+Offline module that serves dictionary lookups from a local dump.
+
+A dump of dictionaryapi.dev entries is imported into a SQLite file once (see the
+`import_dictionary` management command). Lookups then read a handful of rows
+through the primary key of a memory-mapped, read-only database and never leave
+the box; only words missing from the dump go to the network.
+
+Dump format: JSON lines, each line either one dictionaryapi.dev entry object
+(`{"word": ..., "phonetics": [...], "meanings": [...]}`) or an API response,
+i.e. a list of such entries. Entries of the same word are served together in
+file order, exactly like the API returns them.
+
+It provides:
+- `OfflineDictionary`: read-only lookups in an imported dump.
+- `OfflineDictionaryImporter`: streams a JSON-lines dump into a new SQLite file.
+- `OfflineDictionaryProvider`: Provider answering from an OfflineDictionary.
+- `OfflineFirstFetcher` / `AsyncOfflineFirstFetcher`: fetchers that try the offline
+  dictionary first and fall back to another fetcher for words it lacks.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import unquote
+
+from django.conf import settings
+
+from card_manager.services.cache import WordDataCache
+from card_manager.services.fetcher import AsyncFetcher, Fetcher
+from card_manager.services.providers import Provider
+from card_manager.services.services_types import Entry, ProviderResponse
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE entries (
+    word TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (word, seq)
+) WITHOUT ROWID
+"""
+
+# Body of the API's answer for unknown words.
+NOT_FOUND_DATA = {
+    "title": "No Definitions Found",
+    "message": "Sorry pal, we couldn't find definitions for the word you were looking for.",
+    "resolution": "You can try the search again at later time or head to the web instead.",
+}
+
+
+class OfflineDictionary:
+    """Read-only lookups in an imported dictionary dump.
+
+    Every thread gets its own connection (re-opened after a fork). The file is
+    memory-mapped, so hot pages are served from the page cache without copies.
+    Restart workers after re-importing the dump to pick up the new file.
+
+    Args:
+        path: SQLite file written by OfflineDictionaryImporter.
+        mmap_size: Bytes of the file to memory-map.
+    """
+
+    def __init__(self, path: str | Path, mmap_size: int = 1 << 30) -> None:
+        self._path = Path(path)
+        self._mmap_size = mmap_size
+        self._local = threading.local()
+
+    @classmethod
+    def from_settings(cls) -> OfflineDictionary | None:
+        """Return the dictionary at OFFLINE_DICTIONARY_PATH, or None if there is no dump."""
+        path = getattr(settings, "OFFLINE_DICTIONARY_PATH", None)
+        if not path or not Path(path).is_file():
+            return None
+        return cls(path)
+
+    def lookup(self, word: str) -> list[Entry] | None:
+        """Return the entries of `word` as the API would, or None if it is not in the dump."""
+        rows = self._connection().execute(
+            "SELECT entry FROM entries WHERE word = ? ORDER BY seq",
+            (WordDataCache.normalize(word),),
+        )
+        entries = [entry for (entry,) in rows]
+        if not entries:
+            return None
+        return json.loads(f"[{','.join(entries)}]")
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            local.connection = sqlite3.connect(
+                f"{self._path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            local.connection.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+            local.pid = os.getpid()
+        return local.connection
+
+
+@dataclass
+class ImportStats:
+    """Outcome of a dump import."""
+
+    entries: int = 0
+    words: int = 0
+    skipped_lines: int = 0
+
+
+class OfflineDictionaryImporter:
+    """Streams a JSON-lines dump into a new offline dictionary file.
+
+    Lines are read and inserted in batches, so memory use does not grow with the
+    dump. The database is built next to `path` and moved over it only when the
+    import succeeded, so readers never see a half-imported file.
+
+    Args:
+        path: Target SQLite file.
+        batch_size: Entries per insert batch.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = 5000) -> None:
+        self._path = Path(path)
+        self._batch_size = batch_size
+
+    def import_lines(self, lines: Iterable[str | bytes]) -> ImportStats:
+        """Import dump lines (str or bytes) and replace the target file.
+
+        Lines that are not valid JSON or hold no entry with a word are skipped.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.importing")
+        tmp_path.unlink(missing_ok=True)
+
+        stats = ImportStats()
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute(SCHEMA)
+
+            batch: list[tuple[str, int, str]] = []
+            for entry in self._entries(lines, stats):
+                word = WordDataCache.normalize(entry["word"])
+                batch.append((word, stats.entries, self._dump(entry)))
+                stats.entries += 1
+                if len(batch) >= self._batch_size:
+                    connection.executemany("INSERT INTO entries VALUES (?, ?, ?)", batch)
+                    batch = []
+            connection.executemany("INSERT INTO entries VALUES (?, ?, ?)", batch)
+            connection.commit()
+
+            stats.words = connection.execute(
+                "SELECT COUNT(DISTINCT word) FROM entries"
+            ).fetchone()[0]
+        except BaseException:
+            connection.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        connection.close()
+
+        os.replace(tmp_path, self._path)
+        logger.info("Imported offline dictionary %s: %s", self._path, stats)
+        return stats
+
+    @staticmethod
+    def _entries(lines: Iterable[str | bytes], stats: ImportStats) -> Iterator[Entry]:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping dump line %d: not valid JSON", number)
+                stats.skipped_lines += 1
+                continue
+
+            entries = [
+                entry
+                for entry in (data if isinstance(data, list) else [data])
+                if isinstance(entry, dict) and isinstance(entry.get("word"), str)
+            ]
+            if not entries:
+                logger.warning("Skipping dump line %d: no entry with a word", number)
+                stats.skipped_lines += 1
+            yield from entries
+
+    @staticmethod
+    def _dump(entry: Entry) -> str:
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class OfflineDictionaryProvider(Provider):
+    """Answer lookups from the offline dictionary, with the API's status codes.
+
+    The word is the last path segment of the endpoint built by the fetcher.
+    Words missing from the dump get the API's 404 answer.
+    """
+
+    def __init__(self, dictionary: OfflineDictionary) -> None:
+        self._dictionary = dictionary
+
+    def get_word_data(self, endpoint: str) -> ProviderResponse:
+        entries = self._dictionary.lookup(unquote(str(endpoint).rsplit("/", 1)[-1]))
+        if entries is None:
+            return ProviderResponse(data=NOT_FOUND_DATA, status_code=404)
+        return ProviderResponse(data=entries, status_code=200)
+
+
+class OfflineFirstFetcher(Fetcher):
+    """Fetch from the offline dictionary; fall back to `fetcher` for words it lacks.
+
+    Args:
+        offline: Fetcher over an OfflineDictionaryProvider.
+        fetcher: Fetcher used for words missing from the dump.
+    """
+
+    def __init__(self, offline: Fetcher, fetcher: Fetcher) -> None:
+        self._offline = offline
+        self._fetcher = fetcher
+
+    def fetch_word(self, word: str) -> ProviderResponse:
+        response = self._offline.fetch_word(word)
+        if response["status_code"] == 404:
+            return self._fetcher.fetch_word(word)
+        return response
+
+
+class AsyncOfflineFirstFetcher(AsyncFetcher):
+    """Async variant of OfflineFirstFetcher; offline lookups are short blocking calls."""
+
+    def __init__(self, offline: Fetcher, fetcher: AsyncFetcher) -> None:
+        self._offline = offline
+        self._fetcher = fetcher
+
+    async def fetch_word(self, word: str) -> ProviderResponse:
+        response = self._offline.fetch_word(word)
+        if response["status_code"] == 404:
+            return await self._fetcher.fetch_word(word)
+        return response
+
+    async def aclose(self) -> None:
+        await self._fetcher.aclose()
@@ -3,18 +3,32 @@ Providers for fetching word data, abstracting the requests library.
 
 - Provider: interface for any data source.
 - RequestsProvider: concrete implementation for requests.
+- SessionProvider: requests implementation over a pooled keep-alive session.
+- AsyncProvider: interface for any data source awaited from asyncio code.
+- HttpxAsyncProvider: pooled httpx.AsyncClient implementation of AsyncProvider.
 
 Purpose: decouple business logic from the HTTP library.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from card_manager.services.services_types import ProviderResponse
 
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class Provider(ABC):
     """Abstraction for any source of word data."""
@@ -31,3 +45,168 @@ class RequestsProvider(Provider):
         response = requests.get(str(endpoint), timeout=10)
 
         return ProviderResponse(data=response.json(), status_code=response.status_code)
+
+
+@dataclass
+class HttpPoolConfig:
+    """Connection pool settings for SessionProvider.
+
+    Attributes:
+        pool_size (int): Max kept-alive connections per host.
+        connect_timeout (float): Seconds to establish a connection.
+        read_timeout (float): Seconds to wait for the response.
+        retries (int): Retries on 429/5xx responses and connection errors.
+        backoff_factor (float): Exponential backoff base between retries, in seconds.
+    """
+
+    pool_size: int = 10
+    connect_timeout: float = 3.05
+    read_timeout: float = 10
+    retries: int = 3
+    backoff_factor: float = 0.3
+
+
+class SessionProvider(Provider):
+    """Fetch word data over a long-lived, pooled requests session.
+
+    Connections are kept alive between lookups, so only the first request to a host
+    pays the TCP and TLS handshake. Throttled (429) and 5xx responses are retried
+    with exponential backoff, honouring Retry-After; if retries run out, the last
+    response is returned and mapped to ServiceUnavailableError downstream.
+
+    The session is created lazily and re-created after a fork, so every worker
+    process owns its own pool.
+
+    Args:
+        config: Pool, timeout and retry settings (default: HttpPoolConfig()).
+        raw: Return the undecoded body as `data`, for streaming parsers.
+    """
+
+    def __init__(self, config: HttpPoolConfig | None = None, raw: bool = False) -> None:
+        self._config = config or HttpPoolConfig()
+        self._raw = raw
+        self._session: requests.Session | None = None
+        self._pid: int | None = None
+
+    def get_word_data(self, endpoint: str) -> ProviderResponse:
+        """Fetch data from api and return ProviderResponse."""
+        response = self._get_session().get(
+            str(endpoint), timeout=(self._config.connect_timeout, self._config.read_timeout)
+        )
+
+        data = response.content if self._raw else response.json()
+        return ProviderResponse(data=data, status_code=response.status_code)
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None or self._pid != os.getpid():
+            self._session = self._create_session()
+            self._pid = os.getpid()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        retry = Retry(
+            total=self._config.retries,
+            backoff_factor=self._config.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self._config.pool_size, max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+class AsyncProvider(ABC):
+    """Abstraction for any source of word data awaited from asyncio code."""
+
+    @abstractmethod
+    async def get_word_data(self, endpoint: str) -> ProviderResponse: ...
+
+    async def aclose(self) -> None:
+        """Release connections held for the running event loop."""
+
+
+class HttpxAsyncProvider(AsyncProvider):
+    """Fetch word data concurrently over a pooled httpx.AsyncClient.
+
+    The async equivalent of SessionProvider: one event loop can keep up to
+    `pool_size` requests in flight on kept-alive connections. Throttled (429) and
+    5xx responses are retried with exponential backoff, honouring Retry-After; if
+    retries run out, the last response is returned.
+
+    An AsyncClient is bound to the event loop it was opened in, so the client is
+    created lazily on first use in a loop. Callers running their own loop (e.g.
+    one `asyncio.run` per Celery task) must `await aclose()` before the loop ends;
+    the next loop then opens a new client.
+
+    Args:
+        config: Pool, timeout and retry settings (default: HttpPoolConfig()).
+        transport: httpx transport override, e.g. httpx.MockTransport in tests.
+        raw: Return the undecoded body as `data`, for streaming parsers.
+    """
+
+    def __init__(
+        self,
+        config: HttpPoolConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        raw: bool = False,
+    ) -> None:
+        self._config = config or HttpPoolConfig()
+        self._transport = transport
+        self._raw = raw
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_word_data(self, endpoint: str) -> ProviderResponse:
+        """Fetch data from api and return ProviderResponse."""
+        client = self._get_client()
+
+        for attempt in range(self._config.retries + 1):
+            response = await client.get(str(endpoint))
+            if response.status_code not in RETRY_STATUSES or attempt == self._config.retries:
+                break
+            await asyncio.sleep(self._backoff(response, attempt))
+
+        data = response.content if self._raw else response.json()
+        return ProviderResponse(data=data, status_code=response.status_code)
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the current client."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # its sockets belong to a loop that is gone and cannot be closed from here
+            logger.warning("Dropping an httpx client that was not closed with its event loop")
+            self._client = None
+        if self._client is None:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self._config.pool_size,
+            max_keepalive_connections=self._config.pool_size,
+        )
+        timeout = httpx.Timeout(self._config.read_timeout, connect=self._config.connect_timeout)
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            limits=limits, retries=self._config.retries
+        )
+        return httpx.AsyncClient(transport=transport, limits=limits, timeout=timeout)
+
+    def _backoff(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before the next attempt."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self._config.backoff_factor * (2**attempt)
@@ -0,0 +1,308 @@
+"""
+Rate limit module that keeps dictionary lookups under the provider's limit.
+
+dictionaryapi.dev answers bursts with 429, which used to fail card creation.
+Lookups now take a token from a shared token bucket first. Tokens are reserved
+rather than polled for: a caller that finds the bucket empty is told how long to
+wait for its slot and sleeps exactly that long, so concurrent callers queue in
+arrival order. Only callers that would wait longer than `max_wait` are rejected.
+
+It provides:
+- `RateLimitConfig`: rate, burst and queueing settings.
+- `TokenBucket`: interface of a token bucket that reserves tokens.
+- `LocalTokenBucket`: in-process bucket, for a single worker process and tests.
+- `RedisTokenBucket`: bucket shared by all workers, updated atomically by a Lua script.
+- `RateLimitMetrics`: shared counters of wait time and throttle events.
+- `RateLimiter`: blocks (or awaits) callers until their token is due.
+- `RateLimitedFetcher` / `AsyncRateLimitedFetcher`: fetchers that take a token per lookup.
+
+Exceptions:
+- RateLimitTimeoutError: Raised when a caller would wait longer than `max_wait`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import redis
+from django.conf import settings
+from django.core.cache import BaseCache, cache
+
+from card_manager.services.cache import incr_counter
+from card_manager.services.fetcher import AsyncFetcher, Fetcher, ServiceUnavailableError
+from card_manager.services.services_types import ProviderResponse
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("acquired", "delayed", "wait_ms", "rejected", "throttled")
+
+
+@dataclass
+class RateLimitConfig:
+    """Token bucket settings.
+
+    Attributes:
+        rate (float): Tokens added per second, the sustained request rate.
+        burst (int): Bucket capacity, the requests allowed at once after idling.
+        max_wait (float): Seconds a caller may queue for a token before failing.
+        shared (bool): Share the bucket between workers through Redis.
+    """
+
+    rate: float = 1.5
+    burst: int = 10
+    max_wait: float = 30
+    shared: bool = True
+
+    @classmethod
+    def from_settings(cls) -> RateLimitConfig:
+        """Build the config from the DICTIONARY_RATE_LIMIT setting (defaults if missing)."""
+        return cls(**getattr(settings, "DICTIONARY_RATE_LIMIT", {}))
+
+
+class TokenBucket(ABC):
+    """Token bucket that hands out reservations instead of failing when empty."""
+
+    @abstractmethod
+    def reserve(self, max_wait: float) -> float | None:
+        """Reserve one token.
+
+        Returns:
+            Seconds until the reserved token is due (0 if available now), or None if
+            it would be due in more than `max_wait` seconds; nothing is reserved then.
+        """
+
+
+class LocalTokenBucket(TokenBucket):
+    """Thread-safe token bucket held in process memory."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> float | None:
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            wait = max(0.0, (1 - tokens) / self._rate)
+            if wait > max_wait:
+                return None
+
+            self._tokens = tokens - 1
+            self._updated = now
+            return wait
+
+
+# KEYS[1]: bucket hash; ARGV: rate, burst, max_wait. Uses the Redis clock so all
+# workers agree on time. Returns the wait as a string ("-1" when rejected) since
+# Redis truncates Lua numbers to integers.
+RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+
+local wait = math.max(0, (1 - tokens) / rate)
+if wait > max_wait then
+    return '-1'
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil((burst + 1) / rate + max_wait))
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token bucket shared by all processes through one Redis hash.
+
+    Args:
+        name: Bucket name, part of the Redis key.
+        rate: Tokens added per second.
+        burst: Bucket capacity.
+        client: Redis client (default: client for REDIS_URL database 1, the cache database).
+    """
+
+    KEY_PREFIX = "rate_limit"
+
+    def __init__(
+        self, name: str, rate: float, burst: int, client: redis.Redis | None = None
+    ) -> None:
+        self._key = f"{self.KEY_PREFIX}:{name}"
+        self._rate = rate
+        self._burst = burst
+        self._client = client or redis.Redis.from_url(f"{settings.REDIS_URL}/1")
+        self._script = self._client.register_script(RESERVE_SCRIPT)
+
+    def reserve(self, max_wait: float) -> float | None:
+        wait = float(self._script(keys=[self._key], args=[self._rate, self._burst, max_wait]))
+        return None if wait < 0 else wait
+
+
+class RateLimitMetrics:
+    """Shared counters of a rate limiter, kept in the Django cache.
+
+    Counters: `acquired` tokens, `delayed` callers that had to queue, total
+    `wait_ms`, `rejected` callers that would have waited too long and `throttled`
+    429 answers still received from the provider.
+
+    Args:
+        name: Limiter name, part of every key.
+        store: Django cache backend (default: the default cache).
+    """
+
+    KEY_PREFIX = "rate_limit_stats"
+
+    def __init__(self, name: str, store: BaseCache | None = None) -> None:
+        self._name = name
+        self._store = store or cache
+
+    def record_wait(self, wait: float) -> None:
+        self._incr("acquired")
+        if wait > 0:
+            self._incr("delayed")
+            self._incr("wait_ms", math.ceil(wait * 1000))
+
+    def record_rejected(self) -> None:
+        self._incr("rejected")
+
+    def record_throttled(self) -> None:
+        self._incr("throttled")
+
+    def snapshot(self) -> dict[str, float]:
+        """Return all counters plus the average wait of delayed callers in ms."""
+        counters = self._store.get_many([self._key(name) for name in METRICS])
+        stats = {name: counters.get(self._key(name), 0) for name in METRICS}
+        stats["avg_delay_ms"] = stats["wait_ms"] / stats["delayed"] if stats["delayed"] else 0
+        return stats
+
+    def _key(self, name: str) -> str:
+        return f"{self.KEY_PREFIX}:{self._name}:{name}"
+
+    def _incr(self, name: str, amount: int = 1) -> None:
+        incr_counter(self._store, self._key(name), amount)
+
+
+class RateLimiter:
+    """Makes callers wait for a token of the bucket.
+
+    Args:
+        bucket: Token bucket to reserve from.
+        config: Queueing settings.
+        metrics: Counters to record waits and throttling in, or None.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        config: RateLimitConfig,
+        metrics: RateLimitMetrics | None = None,
+    ) -> None:
+        self._bucket = bucket
+        self._config = config
+        self.metrics = metrics
+
+    @classmethod
+    def from_settings(cls, name: str) -> RateLimiter:
+        """Build a limiter named `name` from the DICTIONARY_RATE_LIMIT setting."""
+        config = RateLimitConfig.from_settings()
+        if config.shared:
+            bucket: TokenBucket = RedisTokenBucket(name, config.rate, config.burst)
+        else:
+            bucket = LocalTokenBucket(config.rate, config.burst)
+        return cls(bucket, config, RateLimitMetrics(name))
+
+    def acquire(self) -> float:
+        """Block until a token is due and return the seconds waited.
+
+        Raises:
+            RateLimitTimeoutError: If the token would be due after `max_wait` seconds.
+        """
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Async variant of `acquire`.
+
+        The reservation (a Redis round trip plus metrics updates) runs in a worker
+        thread, so concurrent lookups do not block the event loop on it.
+        """
+        wait = await asyncio.to_thread(self._reserve)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _reserve(self) -> float:
+        wait = self._bucket.reserve(self._config.max_wait)
+        if wait is None:
+            if self.metrics:
+                self.metrics.record_rejected()
+            raise RateLimitTimeoutError(self._config.max_wait)
+
+        if self.metrics:
+            self.metrics.record_wait(wait)
+        if wait > 1:
+            logger.info("Dictionary lookup queued for %.2fs by the rate limiter", wait)
+        return wait
+
+
+class RateLimitedFetcher(Fetcher):
+    """Fetcher that takes a rate limiter token before every lookup.
+
+    Args:
+        fetcher: Fetcher doing the actual lookup.
+        limiter: Limiter shared by all lookups of the provider.
+    """
+
+    def __init__(self, fetcher: Fetcher, limiter: RateLimiter) -> None:
+        self._fetcher = fetcher
+        self._limiter = limiter
+
+    def fetch_word(self, word: str) -> ProviderResponse:
+        self._limiter.acquire()
+        response = self._fetcher.fetch_word(word)
+        if response["status_code"] == 429 and self._limiter.metrics:
+            self._limiter.metrics.record_throttled()
+        return response
+
+
+class AsyncRateLimitedFetcher(AsyncFetcher):
+    """Async variant of RateLimitedFetcher."""
+
+    def __init__(self, fetcher: AsyncFetcher, limiter: RateLimiter) -> None:
+        self._fetcher = fetcher
+        self._limiter = limiter
+
+    async def fetch_word(self, word: str) -> ProviderResponse:
+        await self._limiter.aacquire()
+        response = await self._fetcher.fetch_word(word)
+        if response["status_code"] == 429 and self._limiter.metrics:
+            self._limiter.metrics.record_throttled()
+        return response
+
+    async def aclose(self) -> None:
+        await self._fetcher.aclose()
+
+
+class RateLimitTimeoutError(ServiceUnavailableError):
+    """Raised when the rate limiter queue is longer than a caller may wait."""
+
+    def __init__(self, max_wait: float) -> None:
+        super().__init__(f"Rate limit queue longer than {max_wait}s, try again later.")
+        self.max_wait = max_wait
@@ -0,0 +1,117 @@
+"""
+Rendering module that pre-encodes the card payloads of study and quiz responses.
+
+Study and quiz endpoints used to run every card's `json_data` through DRF's
+serializer fields and JSON renderer on each request. A card's content now gets
+encoded once, when it is created or edited, and is stored as JSON bytes in
+`Card.rendered`. Responses are assembled from those bytes and only the per-request
+members (`id`, quiz `difficulty`) are encoded at request time.
+
+The bytes are exactly what DRF's JSONRenderer produces for the same data (compact
+separators, no ASCII escaping, U+2028/U+2029 escaped). `RENDER_VERSION` is stored
+with every payload. Bump it whenever the payload layout changes: outdated cards
+are then rendered on the fly until `manage.py render_cards` re-renders them.
+
+It provides:
+- `RENDER_VERSION`: version of the payload layout.
+- `encode`: DRF-compatible JSON encoding to bytes.
+- `render_card_fields`: the pre-encoded `"word"` and `"json_data"` members of a card.
+- `PAYLOAD_FIELDS`: Card fields a payload is built from.
+- `card_payload` / `cards_payload`: JSON object (array) bytes for cards.
+- `row_payload` / `rows_payload`: the same for `values(*PAYLOAD_FIELDS)` rows.
+- `object_payload`: JSON object bytes mixing encoded and pre-encoded members.
+- `json_bytes_response`: HttpResponse for pre-encoded JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from django.http import HttpResponse
+
+if TYPE_CHECKING:
+    from card_manager.models import Card
+
+RENDER_VERSION = 1
+
+# Card fields a payload is built from, for `values()` reads
+PAYLOAD_FIELDS = ("id", "word", "json_data", "rendered", "render_version")
+
+
+def encode(data: Any) -> bytes:
+    """Encode `data` to JSON bytes exactly like DRF's default JSONRenderer."""
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+def render_card_fields(word: str, json_data: Any) -> bytes:
+    """Return the `"word":...,"json_data":...` members of a card payload."""
+    return encode({"word": word, "json_data": json_data})[1:-1]
+
+
+def card_payload(card: Card, extra: dict[str, Any] | None = None) -> bytes:
+    """Return the payload of `card`: `{"id", "word", "json_data", **extra}` as JSON bytes.
+
+    Uses the stored render when it is current, otherwise renders the card now.
+    """
+    return _payload(
+        card.id, card.word, card.json_data, card.rendered, card.render_version, extra
+    )
+
+
+def cards_payload(
+    cards: Iterable[Card], extra: Callable[[Card], dict[str, Any]] | None = None
+) -> bytes:
+    """Return a JSON array of card payloads; `extra(card)` adds per-card members."""
+    return b"[" + b",".join(card_payload(card, extra and extra(card)) for card in cards) + b"]"
+
+
+def row_payload(row: dict[str, Any], extra: dict[str, Any] | None = None) -> bytes:
+    """`card_payload` for a `values(*PAYLOAD_FIELDS)` row."""
+    return _payload(
+        row["id"], row["word"], row["json_data"], row["rendered"], row["render_version"], extra
+    )
+
+
+def rows_payload(
+    rows: Iterable[dict[str, Any]],
+    extra: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+) -> bytes:
+    """`cards_payload` for `values(*PAYLOAD_FIELDS)` rows."""
+    return b"[" + b",".join(row_payload(row, extra and extra(row)) for row in rows) + b"]"
+
+
+def object_payload(head: dict[str, Any], raw_members: dict[str, bytes]) -> bytes:
+    """Return the JSON object of `head`'s members followed by `raw_members`.
+
+    `raw_members` values are pre-encoded JSON (e.g. `cards_payload` bytes) and are
+    inserted as they are.
+    """
+    members = [encode(head)[1:-1]] if head else []
+    members.extend(encode(name) + b":" + value for name, value in raw_members.items())
+    return b"{" + b",".join(members) + b"}"
+
+
+def _payload(
+    card_id: int,
+    word: str,
+    json_data: Any,
+    rendered: bytes | memoryview,
+    render_version: int,
+    extra: dict[str, Any] | None,
+) -> bytes:
+    if render_version == RENDER_VERSION and rendered:
+        fields = bytes(rendered)
+    else:
+        fields = render_card_fields(word, json_data)
+
+    payload = b'{"id":%d,%s' % (card_id, fields)
+    if extra:
+        return payload + b"," + encode(extra)[1:]
+    return payload + b"}"
+
+
+def json_bytes_response(content: bytes, status: int = 200) -> HttpResponse:
+    """Return pre-encoded JSON as a response, bypassing DRF's renderers."""
+    return HttpResponse(content, status=status, content_type="application/json")
@@ -0,0 +1,174 @@
+"""
+Review stats module that logs answered reviews and keeps their rollups.
+
+ShowCardDailyStat only counts shown cards per day, so any other statistic would
+have to scan raw rows. Every review is now appended to the ReviewEvent log, in
+one `bulk_create` per review batch. In the same transaction the review is added
+to daily, weekly and monthly rollups per user and per deck, with one
+`INSERT ... ON CONFLICT DO UPDATE SET x = x + EXCLUDED.x` per rollup table.
+Readers only touch rollups, so a stats query costs O(periods), not O(reviews).
+
+It provides:
+- `period_start`: first day of the rollup period a day falls into.
+- `ReviewLog`: appends review events and updates the rollups.
+- `ReviewStats`: reads per-period review series of a user or deck from the rollups.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable
+
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from card_manager.models import (
+    DeckReviewRollup,
+    ReviewEvent,
+    RollupPeriod,
+    UserReviewRollup,
+)
+
+# Additive rollup columns, in the order ReviewLog.totals() sums them
+SUM_FIELDS = (
+    "reviews",
+    "correct",
+    "quality_sum",
+    "ef_sum",
+    "timed_reviews",
+    "latency_ms_sum",
+)
+CORRECT_QUALITY = 3
+
+# (owner id, period, period start) of a rollup row
+RollupKey = tuple[int, str, date]
+
+
+def period_start(day: date, period: str) -> date:
+    """Return the first day of the `period` containing `day` (weeks start on Monday)."""
+    if period == RollupPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == RollupPeriod.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+class ReviewLog:
+    """Appends review events and adds them to the user and deck rollups.
+
+    Args:
+        batch_size: Max rows per INSERT statement.
+    """
+
+    def __init__(self, batch_size: int = 500) -> None:
+        self._batch_size = batch_size
+
+    def record(self, user, events: Iterable[ReviewEvent]) -> None:
+        """Write the events of `user`'s reviews and their rollup increments.
+
+        The events' user is set here. Everything is written in one transaction;
+        callers already inside one (the review that produced the events) get the
+        log written atomically with their changes.
+        """
+        events = list(events)
+        if not events:
+            return
+
+        for event in events:
+            event.user_id = user.id
+        with transaction.atomic():
+            ReviewEvent.objects.bulk_create(events, batch_size=self._batch_size)
+            self._upsert(UserReviewRollup, "user", self.totals(events, "user_id"))
+            self._upsert(DeckReviewRollup, "deck", self.totals(events, "deck_id"))
+
+    @staticmethod
+    def totals(events: Iterable[ReviewEvent], owner: str) -> dict[RollupKey, list[float]]:
+        """Sum `events` per rollup row of `owner` ("user_id" or "deck_id")."""
+        totals: dict[RollupKey, list[float]] = defaultdict(lambda: [0] * len(SUM_FIELDS))
+        for event in events:
+            day = timezone.localdate(event.reviewed_at)
+            timed = event.latency_ms is not None
+            increment = (
+                1,
+                int(event.quality >= CORRECT_QUALITY),
+                event.quality,
+                event.ef,
+                int(timed),
+                event.latency_ms if timed else 0,
+            )
+            for period in RollupPeriod.values:
+                row = totals[(getattr(event, owner), period, period_start(day, period))]
+                for index, value in enumerate(increment):
+                    row[index] += value
+        return totals
+
+    def _upsert(
+        self, model: type[Model], owner: str, totals: dict[RollupKey, list[float]]
+    ) -> None:
+        meta = model._meta
+        quote = connection.ops.quote_name
+        table = quote(meta.db_table)
+        key_columns = [quote(meta.get_field(name).column) for name in (owner, "period", "start")]
+        sum_columns = [quote(name) for name in SUM_FIELDS]
+        updates = ", ".join(
+            f"{column} = {table}.{column} + EXCLUDED.{column}" for column in sum_columns
+        )
+
+        rows = [(*key, *sums) for key, sums in totals.items()]
+        placeholders = f"({', '.join(['%s'] * (len(key_columns) + len(sum_columns)))})"
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), self._batch_size):
+                batch = rows[start : start + self._batch_size]
+                cursor.execute(
+                    f"INSERT INTO {table} ({', '.join(key_columns + sum_columns)}) "
+                    f"VALUES {', '.join([placeholders] * len(batch))} "
+                    f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}",
+                    [value for row in batch for value in row],
+                )
+
+
+class ReviewStats:
+    """Reads review series from the rollups, never from the event log."""
+
+    MAX_POINTS = 366
+
+    def series(
+        self,
+        user,
+        period: str = RollupPeriod.DAY,
+        deck_id: int | None = None,
+        points: int = 30,
+    ) -> list[dict]:
+        """Return the last `points` periods with reviews, oldest first.
+
+        Args:
+            user: Owner of the statistics.
+            period: Rollup period ("day", "week" or "month").
+            deck_id: Restrict to one of the user's decks (default: all decks).
+            points: Number of periods, capped at MAX_POINTS.
+        """
+        if deck_id is None:
+            rollups = UserReviewRollup.objects.filter(user=user)
+        else:
+            rollups = DeckReviewRollup.objects.filter(deck_id=deck_id, deck__user=user)
+
+        rows = rollups.filter(period=period).order_by("-start").values("start", *SUM_FIELDS)
+        latest = list(rows[: min(points, self.MAX_POINTS)])
+        return [self.point(row) for row in reversed(latest)]
+
+    @staticmethod
+    def point(row: dict) -> dict:
+        """Turn a rollup row into a series point with averages."""
+        reviews, timed = row["reviews"], row["timed_reviews"]
+        return {
+            "start": row["start"],
+            "reviews": reviews,
+            "correct": row["correct"],
+            "accuracy": row["correct"] / reviews if reviews else None,
+            "average_quality": row["quality_sum"] / reviews if reviews else None,
+            "average_ef": row["ef_sum"] / reviews if reviews else None,
+            "average_latency_ms": row["latency_ms_sum"] / timed if timed else None,
+        }
+
@@ -0,0 +1,305 @@
+"""
+Review module that persists SM2 scheduling results to cards.
+
+It provides:
+- `CardReviewService`: applies `SM2Scheduler` results to `Card` rows and logs the reviews.
+
+Exceptions:
+- CardNotFoundError: Raised when the reviewed card does not exist or belongs to another user.
+- ReviewConflictError: Raised when a card kept changing concurrently during a review.
+
+Scheduling math lives in `scheduling.py`; this module only decides how the
+computed values reach the database (e.g. one `bulk_update` for a whole batch
+instead of several UPDATE/refresh round-trips per card).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Sequence
+
+from django.db import transaction
+from django.utils import timezone
+
+from card_manager.models import Card, ReviewEvent
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.review_stats import ReviewLog
+from card_manager.services.scheduling import SchedulingData, SM2Scheduler
+
+SCHEDULING_FIELDS = ["quality", "ef", "repetitions", "interval", "due_date"]
+SCHEDULING_INPUT_FIELDS = ("repetitions", "interval", "ef")
+REVIEW_FIELDS = [*SCHEDULING_FIELDS, "last_reviewed_at", "difficulty"]
+CLOCK_SKEW = timedelta(minutes=5)
+
+
+class CardReviewService:
+    """Applies SM2 scheduling to cards and writes the results.
+
+    Args:
+        scheduler: Scheduler used to compute new values (default: SM2Scheduler()).
+        batch_size: Max rows per UPDATE statement issued by `bulk_update`.
+        max_attempts: How many times `submit_review` re-reads a card that changed
+            between its read and its conditional UPDATE.
+        buckets: Keeps card difficulty buckets in sync with EF (default: DifficultyBuckets()).
+        log: Review event log and rollups (default: ReviewLog()).
+    """
+
+    def __init__(
+        self,
+        scheduler: SM2Scheduler | None = None,
+        batch_size: int = 500,
+        max_attempts: int = 3,
+        buckets: DifficultyBuckets | None = None,
+        log: ReviewLog | None = None,
+    ) -> None:
+        self._scheduler = scheduler or SM2Scheduler()
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._buckets = buckets or DifficultyBuckets()
+        self._log = log or ReviewLog(batch_size)
+
+    def submit_review(
+        self,
+        card_id: int,
+        quality: int,
+        user,
+        now: datetime | None = None,
+        latency_ms: int | None = None,
+    ) -> SchedulingData:
+        """Review a single card with one SELECT and one conditional UPDATE.
+
+        The new state is computed in Python and written only if the card still holds
+        the values it was computed from (optimistic concurrency). A concurrent review
+        of the same card makes the UPDATE match no rows and the review is retried
+        on fresh values. The review is logged in the same transaction, and when the
+        card moves to another difficulty bucket the deck counter is updated as well.
+
+        Args:
+            card_id: Id of the reviewed card.
+            quality: User feedback.
+            user: Owner of the card.
+            now: Review moment (default: timezone.now()).
+            latency_ms: Time the user took to answer, if the client measured it.
+
+        Raises:
+            CardNotFoundError: If the card does not exist or is not owned by `user`.
+            ReviewConflictError: If every attempt lost the race to a concurrent write.
+
+        Returns:
+            SchedulingData: The values written, including the new due date.
+        """
+        now = now or timezone.now()
+
+        for _ in range(self._max_attempts):
+            current = (
+                Card.objects.filter(id=card_id, deck__user=user)
+                .values(*SCHEDULING_INPUT_FIELDS, "deck_id", "difficulty")
+                .first()
+            )
+            if current is None:
+                raise CardNotFoundError(card_id)
+
+            deck_id = current.pop("deck_id")
+            old_difficulty = current.pop("difficulty")
+            result = self._scheduler.calculate_scheduling_data(
+                quality=quality, now=now, **current
+            )
+            difficulty = self._buckets.classify(result["ef"])
+            changes = {"last_reviewed_at": now, "difficulty": difficulty}
+
+            event = ReviewEvent(
+                deck_id=deck_id,
+                card_id=card_id,
+                quality=quality,
+                previous_interval=current["interval"],
+                interval=result["interval"],
+                ef=result["ef"],
+                latency_ms=latency_ms,
+                reviewed_at=now,
+            )
+
+            with transaction.atomic():
+                if not Card.objects.filter(id=card_id, **current).update(**result, **changes):
+                    continue
+                if difficulty != old_difficulty:
+                    self._buckets.apply(
+                        self._buckets.moves([(deck_id, old_difficulty, difficulty)])
+                    )
+                self._log.record(user, [event])
+                return result
+
+        raise ReviewConflictError(card_id, self._max_attempts)
+
+    def bulk_reschedule(
+        self,
+        cards: Sequence[Card],
+        qualities: Sequence[int],
+        now: datetime | None = None,
+        user=None,
+        latencies: Sequence[int | None] | None = None,
+    ) -> list[Card]:
+        """Reschedule many cards with one vectorized pass and one `bulk_update`.
+
+        Args:
+            cards: Cards to reschedule. Their current scheduling fields are read as input.
+            qualities: User feedback, aligned by index with `cards`.
+            now: Review moment shared by the batch (default: timezone.now()).
+            user: Owner of the cards; the reviews are logged when given.
+            latencies: Answer times in ms, aligned by index with `cards`.
+
+        Returns:
+            list[Card]: The same cards with updated scheduling fields.
+        """
+        if not cards:
+            return []
+
+        cards = list(cards)
+        now = now or timezone.now()
+        previous_intervals = [card.interval for card in cards]
+        result = self._scheduler.calculate_batch_scheduling_data(
+            repetitions=[card.repetitions for card in cards],
+            interval=previous_intervals,
+            ef=[card.ef for card in cards],
+            quality=qualities,
+            now=now,
+        )
+
+        moves = []
+        for index, card in enumerate(cards):
+            for field in SCHEDULING_FIELDS:
+                setattr(card, field, result[field][index])
+            card.last_reviewed_at = now
+            difficulty = self._buckets.classify(card.ef)
+            moves.append((card.deck_id, card.difficulty, difficulty))
+            card.difficulty = difficulty
+
+        with transaction.atomic():
+            Card.objects.bulk_update(cards, REVIEW_FIELDS, batch_size=self._batch_size)
+            self._buckets.apply(self._buckets.moves(moves))
+            if user is not None:
+                latencies = latencies or [None] * len(cards)
+                self._log.record(
+                    user,
+                    [
+                        self._event(card, qualities[i], previous_intervals[i], latencies[i])
+                        for i, card in enumerate(cards)
+                    ],
+                )
+        return cards
+
+    def replay_reviews(
+        self, user, reviews: Sequence[tuple[int, int, datetime]]
+    ) -> list[dict]:
+        """Apply reviews recorded offline, in the order they were answered.
+
+        All reviews are replayed in memory in `answered_at` order, so several answers
+        for the same card build on each other, and are committed in one transaction
+        with a single `bulk_update`. A review already in the card's ReviewEvent log,
+        or answered exactly at its `last_reviewed_at`, has already been applied, which
+        makes retrying the same upload harmless; any other review answered before the
+        card's last review arrived too late to be applied.
+
+        Args:
+            user: Owner of the cards.
+            reviews: `(card_id, quality, answered_at)` tuples in any order.
+
+        Returns:
+            list[dict]: One outcome per review, in input order. Statuses: "applied",
+            "duplicate" (already applied: logged for the card or equal to its last
+            review), "stale" (not applied, answered before the card's last review),
+            "not_found", "future" (answered_at later than now).
+        """
+        now = timezone.now()
+        outcomes: list[dict] = [{} for _ in reviews]
+
+        with transaction.atomic():
+            cards = Card.objects.select_for_update().filter(
+                id__in={card_id for card_id, _, _ in reviews}, deck__user=user
+            )
+            cards_by_id = {card.id: card for card in cards}
+            old_difficulty = {card.id: card.difficulty for card in cards_by_id.values()}
+            logged = set(
+                ReviewEvent.objects.filter(
+                    user=user,
+                    card_id__in=cards_by_id,
+                    reviewed_at__in={answered_at for _, _, answered_at in reviews},
+                ).values_list("card_id", "reviewed_at")
+            )
+            touched: dict[int, Card] = {}
+            events: list[ReviewEvent] = []
+
+            for index in sorted(range(len(reviews)), key=lambda i: reviews[i][2]):
+                card_id, quality, answered_at = reviews[index]
+                card = cards_by_id.get(card_id)
+                outcome = outcomes[index]
+                outcome["card_id"] = card_id
+
+                if card is None:
+                    outcome["status"] = "not_found"
+                elif answered_at > now + CLOCK_SKEW:
+                    outcome["status"] = "future"
+                elif (card_id, answered_at) in logged or answered_at == card.last_reviewed_at:
+                    outcome["status"] = "duplicate"
+                elif card.last_reviewed_at and answered_at < card.last_reviewed_at:
+                    outcome["status"] = "stale"
+                else:
+                    previous_interval = card.interval
+                    result = self._scheduler.calculate_scheduling_data(
+                        card.repetitions, card.interval, card.ef, quality, now=answered_at
+                    )
+                    for field in SCHEDULING_FIELDS:
+                        setattr(card, field, result[field])
+                    card.last_reviewed_at = answered_at
+                    touched[card.id] = card
+                    events.append(self._event(card, quality, previous_interval))
+                    outcome["status"] = "applied"
+                    outcome["due_date"] = result["due_date"]
+
+            for card in touched.values():
+                card.difficulty = self._buckets.classify(card.ef)
+
+            Card.objects.bulk_update(
+                touched.values(), REVIEW_FIELDS, batch_size=self._batch_size
+            )
+            self._buckets.apply(
+                self._buckets.moves(
+                    (card.deck_id, old_difficulty[card.id], card.difficulty)
+                    for card in touched.values()
+                )
+            )
+            self._log.record(user, events)
+
+        return outcomes
+
+    @staticmethod
+    def _event(
+        card: Card, quality: int, previous_interval: float, latency_ms: int | None = None
+    ) -> ReviewEvent:
+        """Log entry of a review just applied to `card`."""
+        return ReviewEvent(
+            deck_id=card.deck_id,
+            card_id=card.id,
+            quality=quality,
+            previous_interval=previous_interval,
+            interval=card.interval,
+            ef=card.ef,
+            latency_ms=latency_ms,
+            reviewed_at=card.last_reviewed_at,
+        )
+
+
+class CardNotFoundError(Exception):
+    """Raised when a card does not exist or is not owned by the reviewing user."""
+
+    def __init__(self, card_id: int) -> None:
+        super().__init__(f"Card {card_id} not found.")
+        self.card_id = card_id
+
+
+class ReviewConflictError(Exception):
+    """Raised when a card was concurrently modified on every review attempt."""
+
+    def __init__(self, card_id: int, attempts: int) -> None:
+        super().__init__(f"Card {card_id} was modified concurrently {attempts} times in a row.")
+        self.card_id = card_id
+        self.attempts = attempts
@@ -3,28 +3,66 @@ from dataclasses import dataclass
 from typing import Callable
 
 import pinject
+from django.conf import settings
 from requests import Response
 
-from card_manager.services.services_types import ParsedWordData
+from card_manager.services.services_types import ParsedWordData, ProviderResponse
 
+from .cache import WordDataCache
 from .fetcher import (
     DICTIONARYAPI_URL,
+    AsyncDictApiFetcher,
+    AsyncFetcherService,
+    AsyncWordFetcherService,
     DictApiErrorMapper,
     DictApiFetcher,
+    ExternalAPIError,
     FetcherService,
     WordFetcherService,
 )
+from .offline import (
+    AsyncOfflineFirstFetcher,
+    OfflineDictionary,
+    OfflineDictionaryProvider,
+    OfflineFirstFetcher,
+)
 from .parser import DictApiParser, Parser
-from .providers import RequestsProvider
+from .providers import HttpPoolConfig, HttpxAsyncProvider, SessionProvider
+from .ratelimit import AsyncRateLimitedFetcher, RateLimitedFetcher, RateLimiter
+from .streaming import StatusValidator, StreamingDictApiParser, ValidatingDictApiParser
 from .validator import DictApiValidator, Validator
 
 
+TWO_STAGE_PIPELINE = "two_stage"
+VALIDATING_PIPELINE = "validating"
+
+
 @dataclass
 class DictApiConfig:
-    """Configuration for DictApiWordService that has url and max definition parameters."""
+    """Configuration for DictApiWordService.
+
+    Attributes:
+        api_url (str): Base url of the dictionary API.
+        max_definition (int): Definitions kept per part of speech.
+        provider_name (str): Name of the provider in cache keys and metrics.
+        pipeline (str): "two_stage" builds a validator and a parser per lookup from the
+            factories; "validating" runs one shared ValidatingDictApiParser, a single
+            traversal that ignores the factories.
+    """
 
     api_url: str = DICTIONARYAPI_URL
     max_definition: int = 2
+    provider_name: str = "dictionaryapi.dev"
+    pipeline: str = TWO_STAGE_PIPELINE
+
+    def __post_init__(self) -> None:
+        if self.pipeline not in (TWO_STAGE_PIPELINE, VALIDATING_PIPELINE):
+            raise ValueError(f"Unknown dictionary pipeline: '{self.pipeline}'.")
+
+    @classmethod
+    def from_settings(cls) -> "DictApiConfig":
+        """Build the config from the DICTIONARY_API setting (defaults if missing)."""
+        return cls(**getattr(settings, "DICTIONARY_API", {}))
 
 
 class WordDataService(ABC):
@@ -44,8 +82,8 @@ class DictApiWordService(WordDataService):
         fetcher: Object to fetch API responses.
         validator_factory: Factory to create a validator.
         parser_factory: Factory to create a parser.
-        api_url: Base URL of the API (default: DICTIONARYAPI_URL).
-        max_definitions: Max definitions per part of speech (default: 2).
+        word_cache: Shared cache consulted before fetching (default: None, always fetch).
+        config: API url, max definitions and pipeline (default: DictApiConfig.from_settings()).
     """
 
     def __init__(
@@ -53,21 +91,52 @@ class DictApiWordService(WordDataService):
         fetcher: FetcherService,
         validator_factory: Callable[[Response], Validator],
         parser_factory: Callable[[Response, int], Parser],
-        config: DictApiConfig = DictApiConfig(),
+        word_cache: WordDataCache | None = None,
+        config: DictApiConfig | None = None,
     ):
+        config = config or DictApiConfig.from_settings()
         self._fetcher = fetcher
         self._validator_factory = validator_factory
         self._parser_factory = parser_factory
+        self._word_cache = word_cache
         self._api_url = config.api_url
         self._max_definitions = config.max_definition
+        self._validating_parser = None
+        if config.pipeline == VALIDATING_PIPELINE:
+            self._validating_parser = ValidatingDictApiParser(config.max_definition)
 
     def get_clean_word(self, word: str) -> ParsedWordData:
         """
         Fetch, validate, and parse data for a given word.
         Returns clean word data ready for db recording.
+
+        Concurrent calls for the same uncached word share one fetch, see
+        `WordDataCache.fill`.
+
+        Raises:
+            WordNotFoundError: If the provider does not know the word (cached as well).
+            ExternalAPIError: If fetching failed for another reason.
+            ResponseValidationError: If the provider response is unusable.
         """
+        if self._word_cache is None:
+            return self._fetch_clean_word(word)
+
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+        return self._word_cache.fill(word, self._fetch_clean_word)
 
+    def _fetch_clean_word(self, word: str) -> ParsedWordData:
+        """Fetch, validate and parse a word, bypassing the cache."""
         response = self._fetcher.get_fetched_word(word)
+        if isinstance(response, ExternalAPIError):
+            raise response
+        return self._parse(response)
+
+    def _parse(self, response: ProviderResponse) -> ParsedWordData:
+        """Validate and parse a response with the configured pipeline."""
+        if self._validating_parser is not None:
+            return self._validating_parser.parse(response)
 
         validator = self._validator_factory(response)
         validator.validate_response()
@@ -76,6 +145,127 @@ class DictApiWordService(WordDataService):
         return parser.parse_word_data()
 
 
+class AsyncWordDataService(ABC):
+    """Async counterpart of WordDataService, awaited from asyncio code."""
+
+    @abstractmethod
+    async def get_clean_word(self, word: str) -> ParsedWordData: ...
+
+    async def aclose(self) -> None:
+        """Release connections held for the running event loop."""
+
+
+class AsyncDictApiWordService(AsyncWordDataService):
+    """Async service to fetch, validate, and parse word data from dictionaryapi.dev.
+
+    Only the fetch (and cache access) is awaited; validation and parsing are CPU-bound
+    and reuse the sync validator and parser. Many `get_clean_word` calls can run
+    concurrently in one event loop, e.g. with `asyncio.gather`. Call `aclose` before
+    that loop ends.
+
+    Args:
+        fetcher: Object to fetch API responses without blocking.
+        validator_factory: Factory to create a validator.
+        parser_factory: Factory to create a parser.
+        word_cache: Shared cache consulted before fetching (default: None, always fetch).
+        config: API url, max definitions and pipeline (default: DictApiConfig.from_settings()).
+    """
+
+    def __init__(
+        self,
+        fetcher: AsyncFetcherService,
+        validator_factory: Callable[[Response], Validator],
+        parser_factory: Callable[[Response, int], Parser],
+        word_cache: WordDataCache | None = None,
+        config: DictApiConfig | None = None,
+    ):
+        config = config or DictApiConfig.from_settings()
+        self._fetcher = fetcher
+        self._validator_factory = validator_factory
+        self._parser_factory = parser_factory
+        self._word_cache = word_cache
+        self._api_url = config.api_url
+        self._max_definitions = config.max_definition
+        self._validating_parser = None
+        if config.pipeline == VALIDATING_PIPELINE:
+            self._validating_parser = ValidatingDictApiParser(config.max_definition)
+
+    async def get_clean_word(self, word: str) -> ParsedWordData:
+        """
+        Fetch, validate, and parse data for a given word.
+        Returns clean word data ready for db recording.
+
+        Raises:
+            WordNotFoundError: If the provider does not know the word (cached as well).
+            ExternalAPIError: If fetching failed for another reason.
+            ResponseValidationError: If the provider response is unusable.
+        """
+        if self._word_cache is None:
+            return await self._fetch_clean_word(word)
+
+        cached = await self._word_cache.aget(word)
+        if cached is not None:
+            return cached
+        return await self._word_cache.afill(word, self._fetch_clean_word)
+
+    async def _fetch_clean_word(self, word: str) -> ParsedWordData:
+        """Fetch, validate and parse a word, bypassing the cache."""
+        response = await self._fetcher.get_fetched_word(word)
+        if isinstance(response, ExternalAPIError):
+            raise response
+        return self._parse(response)
+
+    async def aclose(self) -> None:
+        """Close the fetcher's pooled connections; call before the event loop ends."""
+        await self._fetcher.aclose()
+
+    def _parse(self, response: ProviderResponse) -> ParsedWordData:
+        """Validate and parse a response with the configured pipeline."""
+        if self._validating_parser is not None:
+            return self._validating_parser.parse(response)
+
+        validator = self._validator_factory(response)
+        validator.validate_response()
+
+        parser = self._parser_factory(response, self._max_definitions)
+        return parser.parse_word_data()
+
+
+def streaming_parse_enabled() -> bool:
+    """Whether lookups are parsed from raw bodies (the DICTIONARY_STREAMING_PARSE setting)."""
+    return getattr(settings, "DICTIONARY_STREAMING_PARSE", False)
+
+
+class InjectedDictApiWordService(DictApiWordService):
+    """DictApiWordService as built by pinject.
+
+    Pinject only injects arguments without a default, so this signature makes
+    the word cache a required, injected dependency.
+    """
+
+    def __init__(
+        self,
+        fetcher: FetcherService,
+        validator_factory: Callable[[Response], Validator],
+        parser_factory: Callable[[Response, int], Parser],
+        word_cache: WordDataCache | None,
+    ):
+        super().__init__(fetcher, validator_factory, parser_factory, word_cache)
+
+
+class InjectedAsyncDictApiWordService(AsyncDictApiWordService):
+    """AsyncDictApiWordService as built by pinject. See InjectedDictApiWordService."""
+
+    def __init__(
+        self,
+        fetcher: AsyncFetcherService,
+        validator_factory: Callable[[Response], Validator],
+        parser_factory: Callable[[Response, int], Parser],
+        word_cache: WordDataCache | None,
+    ):
+        super().__init__(fetcher, validator_factory, parser_factory, word_cache)
+
+
 class DictApiBindings(pinject.BindingSpec):
     """Provides dependencies for DictApiService using DI library Pinject.
 
@@ -83,19 +273,56 @@ class DictApiBindings(pinject.BindingSpec):
     implementations by supplying them via factories.
 
     Methods:
-        provide_fetcher(): Returns a concrete BaseApiDataFetcher instance.
+        provide_fetcher(): Returns a concrete BaseApiDataFetcher instance, serving words
+            from the offline dictionary first when a dump is imported.
+        provide_rate_limiter(): Returns the RateLimiter shared by lookups.
         provide_validator_factory(): Returns a factory for ResponseValidator.
         provide_parser_factory(): Returns a factory for ApiParser.
+        provide_word_cache(): Returns the shared WordDataCache.
+
+    With the DICTIONARY_STREAMING_PARSE setting on, providers hand over raw bodies
+    and StreamingDictApiParser validates and parses them in one pass.
     """
 
-    def provide_fetcher(self) -> WordFetcherService:
-        return WordFetcherService(DictApiFetcher(RequestsProvider()), DictApiErrorMapper())
+    def provide_fetcher(self, rate_limiter: RateLimiter) -> WordFetcherService:
+        pool_config = HttpPoolConfig(**getattr(settings, "DICTIONARY_HTTP_POOL", {}))
+        provider = SessionProvider(pool_config, raw=streaming_parse_enabled())
+        fetcher = RateLimitedFetcher(DictApiFetcher(provider), rate_limiter)
+
+        offline = OfflineDictionary.from_settings()
+        if offline is not None:
+            offline_fetcher = DictApiFetcher(OfflineDictionaryProvider(offline))
+            fetcher = OfflineFirstFetcher(offline_fetcher, fetcher)
+
+        return WordFetcherService(fetcher, DictApiErrorMapper())
+
+    def provide_rate_limiter(self) -> RateLimiter:
+        return RateLimiter.from_settings(DictApiConfig.provider_name)
 
     def provide_validator_factory(self) -> Callable[[Response], Validator]:
-        return DictApiValidator
+        return StatusValidator if streaming_parse_enabled() else DictApiValidator
 
     def provide_parser_factory(self) -> Callable[[Response, int], Parser]:
-        return DictApiParser
+        return StreamingDictApiParser if streaming_parse_enabled() else DictApiParser
+
+    def provide_word_cache(self) -> WordDataCache:
+        return WordDataCache(provider=DictApiConfig.provider_name)
+
+
+class AsyncDictApiBindings(DictApiBindings):
+    """DictApiBindings variant that provides an async fetcher for AsyncDictApiWordService."""
+
+    def provide_fetcher(self, rate_limiter: RateLimiter) -> AsyncWordFetcherService:
+        pool_config = HttpPoolConfig(**getattr(settings, "DICTIONARY_HTTP_POOL", {}))
+        provider = HttpxAsyncProvider(pool_config, raw=streaming_parse_enabled())
+        fetcher = AsyncRateLimitedFetcher(AsyncDictApiFetcher(provider), rate_limiter)
+
+        offline = OfflineDictionary.from_settings()
+        if offline is not None:
+            offline_fetcher = DictApiFetcher(OfflineDictionaryProvider(offline))
+            fetcher = AsyncOfflineFirstFetcher(offline_fetcher, fetcher)
+
+        return AsyncWordFetcherService(fetcher, DictApiErrorMapper())
 
 
 class DictApiModule:
@@ -106,12 +333,20 @@ class DictApiModule:
 
     Methods:
         get_dict_service(): Returns a DictApiService instance with dependencies injected.
+        get_async_dict_service(): Returns an AsyncDictApiWordService instance.
     """
 
     _graph = None
+    _async_graph = None
 
     @classmethod
     def get_dict_service(cls) -> DictApiWordService:
         if cls._graph is None:
             cls._graph = pinject.new_object_graph(binding_specs=[DictApiBindings()])
-        return cls._graph.provide(DictApiWordService)
+        return cls._graph.provide(InjectedDictApiWordService)
+
+    @classmethod
+    def get_async_dict_service(cls) -> AsyncDictApiWordService:
+        if cls._async_graph is None:
+            cls._async_graph = pinject.new_object_graph(binding_specs=[AsyncDictApiBindings()])
+        return cls._async_graph.provide(InjectedAsyncDictApiWordService)
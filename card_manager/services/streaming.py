@@ -0,0 +1,245 @@
+"""
+Streaming module that parses raw dictionaryapi.dev bodies in one pass.
+
+Responses for common words hold many entries, but only the first one is turned
+into a card. Decoding the whole body with `response.json()` and then walking the
+first entry twice (validator, then parser) wasted most of the work. Here the
+provider hands over the raw body, entries are decoded one at a time and decoding
+stops after the first one; that entry is then validated and parsed in a single
+traversal, which stops collecting definitions of a part of speech once
+`max_definitions` are kept.
+
+Entries are decoded by the C JSON scanner; a token-level pull parser written in
+Python would be slower than decoding an entry whole.
+
+It provides:
+- `iter_entries`: decodes the top-level entries of a raw body lazily.
+- `first_entry`: first entry of decoded data or a raw body.
+- `StatusValidator`: Validator that checks the status code only, for streaming parsers.
+- `ValidatingDictApiParser`: stateless single-pass validator and parser of responses,
+  the "validating" pipeline of DictApiWordService.
+- `StreamingDictApiParser`: Parser validating and parsing raw (or decoded) responses.
+
+Exceptions:
+- ResponseValidationError (from `validator`): Raised with the same messages and details
+  as DictApiValidator.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator
+
+from card_manager.services.parser import Parser
+from card_manager.services.services_types import (
+    DefinitionExampleEntry,
+    Entry,
+    ParsedWordData,
+    ProviderResponse,
+)
+from card_manager.services.validator import REQUIRED_FIELDS, ResponseValidationError, Validator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_entries(body: bytes | str) -> Iterator[Any]:
+    """Yield the items of a JSON array body one by one, decoding each only when needed.
+
+    Raises:
+        ResponseValidationError: If the body is not a JSON array.
+        json.JSONDecodeError: If the body is malformed up to the consumed item.
+    """
+    text = body.decode("utf-8") if isinstance(body, (bytes, bytearray)) else body
+    pos = _WHITESPACE.match(text, 0).end()
+    if not text.startswith("[", pos):
+        raise ResponseValidationError(
+            "Response root must be a list.",
+            details={"actual_type": type(json.loads(text)).__name__},
+        )
+
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text.startswith("]", pos):
+        return
+
+    while True:
+        item, pos = _DECODER.raw_decode(text, pos)
+        yield item
+
+        pos = _WHITESPACE.match(text, pos).end()
+        if text.startswith("]", pos):
+            return
+        if not text.startswith(",", pos):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
+
+def first_entry(data: Any) -> Any:
+    """Return the first entry of decoded data or a raw body, decoding nothing beyond it.
+
+    Raises:
+        ResponseValidationError: If there is no first entry or the body is not valid JSON.
+    """
+    if isinstance(data, list):
+        entries = iter(data)
+    elif isinstance(data, (bytes, bytearray, str)):
+        entries = iter_entries(data)
+    else:
+        raise ResponseValidationError(
+            "Response root must be a list.", details={"actual_type": type(data).__name__}
+        )
+
+    try:
+        return next(entries)
+    except StopIteration:
+        raise ResponseValidationError("Response list is empty.") from None
+    except ValueError as e:
+        raise ResponseValidationError(
+            "Response body is not valid JSON.", details={"error": str(e)}
+        ) from e
+
+
+class StatusValidator(Validator):
+    """Checks the status code only; the body is validated by the streaming parser."""
+
+    def __init__(self, response: ProviderResponse) -> None:
+        self._response = response
+
+    def validate_response(self) -> bool:
+        if not 200 <= self._response["status_code"] < 300:
+            raise ResponseValidationError(
+                "Invalid HTTP status code.",
+                details={"status_code": self._response["status_code"]},
+            )
+        return True
+
+
+class ValidatingDictApiParser:
+    """
+    Validate and parse dictionaryapi.dev responses in one traversal.
+
+    Produces the same ParsedWordData as DictApiParser and raises the same
+    ResponseValidationError messages and details as DictApiValidator, but walks
+    meanings and definitions once, stopping per part of speech once
+    `max_definitions` are kept. It holds no per-response state, so one instance
+    serves every lookup instead of a validator and a parser built per call.
+
+    `data` may be the raw body (bytes or str, see the providers' `raw` mode) or the
+    already decoded list, e.g. from the offline dictionary.
+
+    Args:
+        max_definitions: Definitions kept per part of speech.
+    """
+
+    def __init__(self, max_definitions: int) -> None:
+        self._max_definitions = max_definitions
+
+    def parse(self, response: ProviderResponse) -> ParsedWordData:
+        """
+        Raises:
+            ResponseValidationError: If the response is unsuccessful, malformed or misses
+                required data.
+        """
+        if not 200 <= response["status_code"] < 300:
+            raise ResponseValidationError(
+                "Invalid HTTP status code.", details={"status_code": response["status_code"]}
+            )
+        return self.parse_entry(first_entry(response["data"]))
+
+    def parse_entry(self, entry: Any) -> ParsedWordData:
+        """Validate and parse one decoded entry."""
+        if not isinstance(entry, dict):
+            raise ResponseValidationError(
+                "First entry must be a dictionary.",
+                details={"actual_type": type(entry).__name__},
+            )
+
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in entry]
+        if missing_fields:
+            raise ResponseValidationError(
+                "Missing required fields.", details={"missing_fields": missing_fields}
+            )
+
+        word = entry["word"]
+        if not self._is_non_empty_str(word):
+            raise ResponseValidationError("Invalid or empty 'word' field.", details={"word": word})
+
+        return {
+            "word": word,
+            "phonetic": entry.get("phonetic", ""),
+            "audio": self._parse_audio(entry),
+            "definition_by_part_of_speech": self._group_definitions(entry),
+        }
+
+    def _group_definitions(self, entry: Entry) -> dict[str, list[DefinitionExampleEntry]]:
+        """Validate meanings and group definitions by part of speech in one traversal."""
+        meanings = entry["meanings"]
+        if not isinstance(meanings, list) or not meanings:
+            raise ResponseValidationError(
+                "Invalid or empty 'meanings' field.", details={"meanings": meanings}
+            )
+
+        result: dict[str, list[DefinitionExampleEntry]] = {}
+        has_valid_definition = False
+        for meaning in meanings:
+            if not isinstance(meaning, dict) or "definitions" not in meaning:
+                raise ResponseValidationError(
+                    "Missing 'definitions' in meanings.", details={"meanings": meanings}
+                )
+
+            kept: list[DefinitionExampleEntry] = []
+            for definition in meaning["definitions"]:
+                if len(kept) >= self._max_definitions and has_valid_definition:
+                    break
+                if not isinstance(definition, dict):
+                    continue
+
+                text = definition.get("definition")
+                has_valid_definition = has_valid_definition or self._is_non_empty_str(text)
+                if not text or len(kept) >= self._max_definitions:
+                    continue
+
+                example = definition.get("example")
+                if example and not example.strip():
+                    example = None
+                kept.append(DefinitionExampleEntry(definition=text, example=example))
+
+            result[meaning.get("partOfSpeech", "part_of_speech_unknown")] = kept
+
+        if not has_valid_definition:
+            raise ResponseValidationError(
+                "Meaning must contain at least one valid definition.",
+                details={"meanings": meanings},
+            )
+        return result
+
+    @staticmethod
+    def _parse_audio(entry: Entry) -> str:
+        for phonetic in entry.get("phonetics", []):
+            if isinstance(phonetic, dict) and phonetic.get("audio"):
+                return phonetic["audio"]
+        return ""
+
+    @staticmethod
+    def _is_non_empty_str(obj: Any) -> bool:
+        return isinstance(obj, str) and bool(obj.strip())
+
+
+class StreamingDictApiParser(Parser):
+    """
+    Parser interface over ValidatingDictApiParser, for the validator/parser factories.
+
+    Pair it with StatusValidator: the body is validated while it is parsed.
+    """
+
+    def __init__(self, response: ProviderResponse, max_definitions: int) -> None:
+        self._response = response
+        self._parser = ValidatingDictApiParser(max_definitions)
+
+    def parse_word_data(self) -> ParsedWordData:
+        """
+        Raises:
+            ResponseValidationError: If the body is malformed or misses required data.
+        """
+        return self._parser.parse_entry(first_entry(self._response["data"]))
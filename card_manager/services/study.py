@@ -0,0 +1,317 @@
+"""
+Study module that picks which due card a user sees next.
+
+It provides:
+- `NextCardStrategy`: how the next card is chosen among the due ones.
+- `DueCardSelector`: fetches the next due card with a single indexed query.
+- `StudySession`: compact server-side state of a prefetched study session.
+- `StudySessionService`: hands out batches of due cards and accepts batched answers.
+
+Exceptions:
+- StudySessionNotFoundError: Raised when a session expired or belongs to another user.
+- StudySessionBusyError: Raised when another answer batch of the session holds it too long.
+
+Selection relies on the composite `(deck, due_date)` index on `Card`, so the
+cost of picking a card does not grow with the size of the deck.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Iterator, Mapping, Sequence
+
+from django.core.cache import BaseCache, cache
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from card_manager.models import Card
+from card_manager.services.daily_stats import increment_daily_learning
+from card_manager.services.reviews import CardReviewService
+
+
+class NextCardStrategy(str, Enum):
+    """Strategies for choosing the next due card.
+
+    RANDOM: a random card among the `random_window` most overdue cards.
+    OLDEST: the most overdue card.
+    """
+
+    RANDOM = "random"
+    OLDEST = "oldest"
+
+
+class DueCardSelector:
+    """Selects the next due card of a deck.
+
+    Both strategies issue exactly one query that walks the `(deck, due_date)`
+    index from the oldest due date and stops after at most `random_window` rows,
+    instead of materializing every due card id.
+
+    Args:
+        random_window: Number of most overdue cards the RANDOM strategy picks from.
+    """
+
+    def __init__(self, random_window: int = 50) -> None:
+        self._random_window = random_window
+
+    def due_batch(
+        self,
+        deck_name: str,
+        user,
+        size: int,
+        strategy: NextCardStrategy = NextCardStrategy.RANDOM,
+        now: datetime | None = None,
+    ) -> list[Card]:
+        """Return up to `size` due cards in the order they should be studied.
+
+        RANDOM shuffles the most overdue cards; OLDEST keeps due date order.
+        """
+        cards = list(self.due_cards(deck_name, user, now)[:size])
+        if strategy is NextCardStrategy.RANDOM:
+            random.shuffle(cards)
+        return cards
+
+    def next_card(
+        self,
+        deck_name: str,
+        user,
+        strategy: NextCardStrategy = NextCardStrategy.RANDOM,
+        now: datetime | None = None,
+    ) -> Card | None:
+        """Return the next card to study or None if nothing is due.
+
+        Args:
+            deck_name: Name of the user's deck to study.
+            user: Owner of the deck.
+            strategy: How to choose among due cards.
+            now: Moment due dates are compared against (default: timezone.now()).
+        """
+        due_cards = self.due_cards(deck_name, user, now)
+
+        if strategy is NextCardStrategy.OLDEST:
+            return due_cards.first()
+
+        candidates = list(due_cards[: self._random_window])
+        return random.choice(candidates) if candidates else None
+
+    @staticmethod
+    def due_cards(deck_name: str, user, now: datetime | None = None) -> QuerySet[Card]:
+        """Return the deck's due cards ordered from the most overdue."""
+        return Card.objects.filter(
+            deck__deck_name=deck_name,
+            deck__user=user,
+            due_date__lte=now or timezone.now(),
+        ).order_by("due_date")
+
+
+@dataclass
+class StudySession:
+    """Server-side state of a study session.
+
+    Only ids are kept: `card_ids` in the order the cards were served and
+    `answered_mask`, a bit set where bit `i` marks `card_ids[i]` as answered.
+    """
+
+    session_id: str
+    user_id: int
+    card_ids: tuple[int, ...]
+    answered_mask: int = 0
+
+    def position(self, card_id: int) -> int | None:
+        """Return the index of `card_id` in the session or None if it was not served."""
+        try:
+            return self.card_ids.index(card_id)
+        except ValueError:
+            return None
+
+    def is_answered(self, position: int) -> bool:
+        return bool(self.answered_mask >> position & 1)
+
+    def mark_answered(self, position: int) -> None:
+        self.answered_mask |= 1 << position
+
+    @property
+    def remaining(self) -> int:
+        return len(self.card_ids) - self.answered_mask.bit_count()
+
+
+class StudySessionService:
+    """Prefetches due cards for a whole study session and reviews them in batches.
+
+    A session costs one request to start (one due-cards query and one stats update
+    for the whole batch) and one request per batch of answers (one SELECT and one
+    `bulk_update`), instead of a GET and a POST per card.
+
+    Answer batches of one session are serialized by a lock taken with an atomic
+    `add` in the shared store, so concurrent batches cannot overwrite each other's
+    answered bits and review the same card twice.
+
+    Args:
+        selector: Picks due cards (default: DueCardSelector()).
+        reviewer: Persists answers (default: CardReviewService()).
+        store: Cache holding session state (default: django default cache).
+        ttl: Seconds an idle session is kept.
+        lock_ttl: Seconds a session lock is held at most; also how long a batch waits for it.
+        poll_interval: Seconds between attempts to take a held session lock.
+    """
+
+    KEY_PREFIX = "study_session"
+
+    def __init__(
+        self,
+        selector: DueCardSelector | None = None,
+        reviewer: CardReviewService | None = None,
+        store: BaseCache | None = None,
+        ttl: int = 2 * 60 * 60,
+        lock_ttl: int = 10,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self._selector = selector or DueCardSelector()
+        self._reviewer = reviewer or CardReviewService()
+        self._store = store or cache
+        self._ttl = ttl
+        self._lock_ttl = lock_ttl
+        self._poll_interval = poll_interval
+
+    def start(
+        self,
+        deck_name: str,
+        user,
+        size: int,
+        strategy: NextCardStrategy = NextCardStrategy.RANDOM,
+    ) -> tuple[StudySession, list[Card]]:
+        """Open a session with up to `size` due cards and return it with the cards."""
+        cards = self._selector.due_batch(deck_name, user, size, strategy)
+        session = StudySession(
+            session_id=uuid.uuid4().hex,
+            user_id=user.id,
+            card_ids=tuple(card.id for card in cards),
+        )
+
+        if cards:
+            increment_daily_learning(user, amount=len(cards))
+            self._save(session)
+
+        return session, cards
+
+    def answer(
+        self,
+        session_id: str,
+        user,
+        answers: Sequence[tuple[int, int]],
+        latencies: Mapping[int, int] | None = None,
+    ) -> tuple[StudySession, list[dict]]:
+        """Review a batch of `(card_id, quality)` answers within a session.
+
+        Returns the updated session and one outcome per answer, in input order.
+        Outcome statuses: "reviewed", "not_in_session", "already_answered".
+        `latencies` maps card ids to answer times in ms, for the review log.
+
+        Raises:
+            StudySessionNotFoundError: If the session expired or is not owned by `user`.
+            StudySessionBusyError: If another batch held the session for `lock_ttl` seconds.
+        """
+        with self._locked(session_id):
+            return self._answer(session_id, user, answers, latencies or {})
+
+    def _answer(
+        self,
+        session_id: str,
+        user,
+        answers: Sequence[tuple[int, int]],
+        latencies: Mapping[int, int],
+    ) -> tuple[StudySession, list[dict]]:
+        session = self.get(session_id, user)
+
+        outcomes: list[dict] = []
+        accepted: dict[int, int] = {}
+        for card_id, quality in answers:
+            position = session.position(card_id)
+            if position is None:
+                outcomes.append({"card_id": card_id, "status": "not_in_session"})
+            elif session.is_answered(position) or card_id in accepted:
+                outcomes.append({"card_id": card_id, "status": "already_answered"})
+            else:
+                accepted[card_id] = quality
+                outcomes.append({"card_id": card_id, "status": "reviewed"})
+
+        cards = list(Card.objects.filter(id__in=accepted, deck__user=user))
+        reviewed = self._reviewer.bulk_reschedule(
+            cards,
+            [accepted[card.id] for card in cards],
+            user=user,
+            latencies=[latencies.get(card.id) for card in cards],
+        )
+        due_dates = {card.id: card.due_date for card in reviewed}
+
+        for outcome in outcomes:
+            if outcome["status"] != "reviewed":
+                continue
+            if outcome["card_id"] not in due_dates:  # card deleted during the session
+                outcome["status"] = "not_in_session"
+                continue
+            outcome["due_date"] = due_dates[outcome["card_id"]]
+            session.mark_answered(session.position(outcome["card_id"]))
+
+        if session.remaining:
+            self._save(session)
+        else:
+            self._store.delete(self._key(session.session_id))
+
+        return session, outcomes
+
+    def get(self, session_id: str, user) -> StudySession:
+        """Return an open session owned by `user`.
+
+        Raises:
+            StudySessionNotFoundError: If the session expired or is not owned by `user`.
+        """
+        session = self._store.get(self._key(session_id))
+        if session is None or session.user_id != user.id:
+            raise StudySessionNotFoundError(session_id)
+        return session
+
+    def _save(self, session: StudySession) -> None:
+        self._store.set(self._key(session.session_id), session, self._ttl)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{session_id}"
+
+    @contextmanager
+    def _locked(self, session_id: str) -> Iterator[None]:
+        """Hold the session's lock, waiting up to `lock_ttl` seconds for it."""
+        key = f"{self.KEY_PREFIX}_lock:{session_id}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self._lock_ttl
+        while not self._store.add(key, token, self._lock_ttl):
+            if time.monotonic() >= deadline:
+                raise StudySessionBusyError(session_id)
+            time.sleep(self._poll_interval)
+        try:
+            yield
+        finally:
+            # get + delete is not atomic; the lock TTL bounds the damage of a race
+            if self._store.get(key) == token:
+                self._store.delete(key)
+
+
+class StudySessionNotFoundError(Exception):
+    """Raised when a study session does not exist, expired or belongs to another user."""
+
+    def __init__(self, session_id: str) -> None:
+        super().__init__(f"Study session {session_id} not found or expired.")
+        self.session_id = session_id
+
+
+class StudySessionBusyError(Exception):
+    """Raised when another answer batch holds a study session for too long."""
+
+    def __init__(self, session_id: str) -> None:
+        super().__init__(f"Study session {session_id} is busy with another batch, try again.")
+        self.session_id = session_id
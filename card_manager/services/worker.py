@@ -0,0 +1,159 @@
+"""
+Worker module that sets up connections once per Celery worker process.
+
+`create_card_task` used to open a raw socket to Redis on every run just to log
+whether it was reachable, and to look its dependencies up from scratch. Now
+every worker process builds its connections once, in the `worker_process_init`
+hook (see card_manager.tasks): the channel layer, the notification aggregator
+and a Redis client whose health is checked once and then cached for
+`health_ttl` seconds. Database connections of worker processes are kept open
+across tasks for `db_conn_max_age` seconds. Only the hook changes database
+settings: a process that sets up its connections lazily through
+`WorkerProcess.current()` (web processes running tasks eagerly) keeps its own.
+
+It provides:
+- `WorkerConfig`: health check and connection reuse settings.
+- `RedisHealth`: cached reachability state of the Redis server.
+- `WorkerProcess`: connections shared by all tasks of a worker process.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import redis
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import connections
+
+from card_manager.services.notifications import NotificationAggregator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WorkerConfig:
+    """Worker process settings.
+
+    Attributes:
+        health_ttl (float): Seconds a Redis health check result is reused.
+        health_timeout (float): Seconds a health check may take.
+        db_conn_max_age (int | None): CONN_MAX_AGE of worker database connections
+            (None: keep the DATABASES setting).
+    """
+
+    health_ttl: float = 30
+    health_timeout: float = 2
+    db_conn_max_age: int | None = 60
+
+    @classmethod
+    def from_settings(cls) -> WorkerConfig:
+        """Build the config from the CELERY_WORKER_PROCESS setting (defaults if missing)."""
+        return cls(**getattr(settings, "CELERY_WORKER_PROCESS", {}))
+
+
+class RedisHealth:
+    """Reachability of the Redis server, checked at most once per `ttl` seconds.
+
+    Args:
+        client: Redis client to ping.
+        ttl: Seconds a check result is reused.
+    """
+
+    def __init__(self, client: redis.Redis, ttl: float) -> None:
+        self._client = client
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._ok = False
+        self._checked_at: float | None = None
+        self.error: str | None = None
+
+    @property
+    def healthy(self) -> bool:
+        """Cached state; re-checked only when older than `ttl`."""
+        checked_at = self._checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self._ttl:
+            return self.check()
+        return self._ok
+
+    def check(self) -> bool:
+        """Ping Redis now and cache the result."""
+        with self._lock:
+            try:
+                self._client.ping()
+            except redis.RedisError as e:
+                if self._ok or self._checked_at is None:
+                    logger.warning("Redis is not reachable from the worker: %s", e)
+                self._ok, self.error = False, str(e)
+            else:
+                if not self._ok and self._checked_at is not None:
+                    logger.info("Redis is reachable from the worker again")
+                self._ok, self.error = True, None
+            self._checked_at = time.monotonic()
+            return self._ok
+
+    def snapshot(self) -> dict:
+        """Return the cached state without checking."""
+        age = None if self._checked_at is None else time.monotonic() - self._checked_at
+        return {"healthy": self._ok, "error": self.error, "age": age}
+
+
+class WorkerProcess:
+    """Connections shared by the tasks of one worker process.
+
+    Args:
+        channel_layer: Channels layer of the process.
+        notifications: Aggregator sending card status events through `channel_layer`.
+        health: Cached Redis health state.
+    """
+
+    _current = None
+
+    def __init__(
+        self, channel_layer, notifications: NotificationAggregator, health: RedisHealth
+    ) -> None:
+        self.channel_layer = channel_layer
+        self.notifications = notifications
+        self.health = health
+        self.pid = os.getpid()
+
+    @staticmethod
+    def configure_database(config: WorkerConfig) -> None:
+        """Keep the database connections of a worker process open across tasks."""
+        if config.db_conn_max_age is None:
+            return
+        for alias in connections:
+            connections[alias].settings_dict["CONN_MAX_AGE"] = config.db_conn_max_age
+            connections[alias].settings_dict["CONN_HEALTH_CHECKS"] = True
+
+    @classmethod
+    def init(cls, config: WorkerConfig | None = None) -> WorkerProcess:
+        """Set up the channel layer and Redis client of this process and check Redis once.
+
+        Database settings are left alone; see `configure_database`.
+        """
+        config = config or WorkerConfig.from_settings()
+        client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=config.health_timeout,
+            socket_timeout=config.health_timeout,
+        )
+        process = cls(
+            get_channel_layer(),
+            NotificationAggregator.default(),
+            RedisHealth(client, config.health_ttl),
+        )
+        process.health.check()
+        cls._current = process
+        return process
+
+    @classmethod
+    def current(cls) -> WorkerProcess:
+        """Return the connections of this process, setting them up if the hook did not run."""
+        if cls._current is None or cls._current.pid != os.getpid():
+            return cls.init()
+        return cls._current
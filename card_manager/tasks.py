@@ -1,60 +1,77 @@
 """
 This module is convoluted and hard to read. Redesign it. Use OOP and adhere to SRP. 
 """
+import asyncio
 import logging
-import socket
 import traceback
 
-from asgiref.sync import async_to_sync
 from celery import shared_task
-from channels.layers import get_channel_layer
+from celery.exceptions import Retry
+from celery.signals import worker_process_init, worker_process_shutdown
+from celery.utils.time import get_exponential_backoff_interval
 from django.contrib.auth import get_user_model
 
-from card_manager.services.card_dealer import get_and_save
+from card_manager.services.cards import CardCreationService, CardExistsError
+from card_manager.services.daily_stats import DailyLearningCounter
+from card_manager.services.fetcher import ServiceUnavailableError, WordNotFoundError
+from card_manager.services.imports import BulkCardImporter, ImportProgress
+from card_manager.services.notifications import NotificationAggregator
+from card_manager.services.worker import WorkerConfig, WorkerProcess
 
 logger = logging.getLogger(__name__)
 
+# Retries of lookups throttled by the provider or the rate limiter: full-jitter
+# exponential backoff, up to 2, 4, 8, 16 and 32 seconds.
+THROTTLE_MAX_RETRIES = 5
+THROTTLE_BACKOFF = 2
+THROTTLE_BACKOFF_MAX = 60
+
 
 # consider using OOP here
-@shared_task(bind=True)
+@shared_task(bind=True, max_retries=THROTTLE_MAX_RETRIES)
 def create_card_task(
     self, word, deck_name, user_id
 ):  # redesign this function completely.
 
-    user_model = get_user_model()
-    channel_layer = get_channel_layer()
-
-    try:
-        socket.create_connection(("localhost", 6379), timeout=2)
-    except Exception as e:  # too generic exception
+    # connections and the cached Redis health state are set up once per process
+    worker = WorkerProcess.current()
+    if not worker.health.healthy:
         logger.warning(
-            "❌ Redis is NOT reachable from Celery: %s(message from #card_manager/tasks.py, create_card_task)",
-            e,
+            "Redis is not reachable, card status may not be delivered: %s", worker.health.error
         )
 
     try:
-        user = user_model.objects.get(id=user_id)
-        result = get_and_save(
-            word, deck_name, user
-        )  # the frontend notifications depend on what this line returns
+        # only the id is needed to pick the deck; no query for the user row
+        user = get_user_model()(pk=user_id)
 
-        if isinstance(result, str) and result.startswith("Data not available for word"):
+        try:
+            card = CardCreationService().create(word, deck_name, user)
+        except WordNotFoundError:
             message = {
                 "status": "error",
                 "type": "word_not_found",
-                "message": result,
+                "message": (
+                    f"Data not available for word {word}. "
+                    f"Are you sure you spelled '{word}' correctly?"
+                ),
             }
-        elif isinstance(result, str) and result.startswith("Word already in the deck"):
+        except CardExistsError as e:
             message = {
                 "status": "error",
                 "type": "card_exists",
-                "message": result,
+                "message": str(e),
             }
+        except ServiceUnavailableError as e:
+            countdown = get_exponential_backoff_interval(
+                THROTTLE_BACKOFF, self.request.retries, THROTTLE_BACKOFF_MAX, full_jitter=True
+            )
+            logger.warning("Lookup of '%s' throttled, retrying in %ss: %s", word, countdown, e)
+            raise self.retry(exc=e, countdown=countdown)
         else:
             message = {
                 "status": "success",
                 "type": "card_created",
-                "message": f"Card for '{result}' created.",
+                "message": f"Card for '{card.word}' created.",
             }
 
         logger.info(
@@ -62,20 +79,14 @@ def create_card_task(
             message,
         )
 
-        if channel_layer:
-            async_to_sync(channel_layer.group_send)(
-                f"user_{user_id}",
-                {
-                    "type": "card_status",
-                    "content": message,
-                },
-            )
-            logger.info("✅ Message sent to channel layer.")
-        else:
-            logger.warning("⚠️ Cannot send WebSocket message: channel_layer is None")
+        # coalesced with the user's other events of the next ~100 ms into one message
+        worker.notifications.send(f"user_{user_id}", message)
 
         return message
 
+    except Retry:
+        raise
+
     except Exception as e:  # too general exception
         logger.error("❌ Exception in create_card_task:")
         traceback.print_exc()
@@ -86,26 +97,52 @@ def create_card_task(
             "message": str(e),
         }
 
-        if channel_layer:
-            try:
-                async_to_sync(channel_layer.group_send)(
-                    f"user_{user_id}",
-                    {
-                        "type": "card_status",
-                        "content": error_msg,
-                    },
-                )
-                logger.info(
-                    "✅ Error message sent to channel layer.(message from #card_manager/tasks.py, create_card_task)"
-                )
-            except Exception:  # too general exception
-                logger.error(
-                    "❌ Failed to send error message via WebSocket:(message from #card_manager/tasks.py, create_card_task)"
-                )
-                traceback.print_exc()
-        else:
-            logger.warning(
-                "⚠️ Cannot send error WebSocket message: channel_layer is None(message from #card_manager/tasks.py, create_card_task)"
-            )
+        worker.notifications.send(f"user_{user_id}", error_msg)
 
         return error_msg
+
+
+@shared_task
+def import_cards_task(import_id, words, deck_name, user_id):
+    """Create cards for a word list in one job. See `BulkCardImporter`.
+
+    Progress and the final result are sent to the user's WebSocket group.
+    """
+    user = get_user_model().objects.get(id=user_id)
+    channel_layer = WorkerProcess.current().channel_layer
+    progress = ImportProgress(channel_layer, f"user_{user_id}", import_id, len(words))
+    importer = BulkCardImporter()
+
+    async def run():
+        try:
+            result = await importer.run(words, deck_name, user, progress)
+        except Exception as e:
+            logger.exception("Import %s into '%s' failed", import_id, deck_name)
+            await progress.fail(str(e))
+            raise
+        finally:
+            await importer.aclose()
+        await progress.finish(result)
+        return result
+
+    return asyncio.run(run())
+
+
+@shared_task
+def flush_daily_stats_task():
+    """Write buffered "cards shown today" counters to the database. Run by Celery beat."""
+    return DailyLearningCounter.default().flush()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Set up the connections shared by the tasks of a new worker process."""
+    config = WorkerConfig.from_settings()
+    WorkerProcess.configure_database(config)
+    WorkerProcess.init(config)
+
+
+@worker_process_shutdown.connect
+def flush_notifications(**kwargs):
+    """Send card status events still waiting for their batch window."""
+    NotificationAggregator.default().flush()
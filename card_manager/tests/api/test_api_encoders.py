@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from card_manager.api.encoders import CardRowEncoder, DeckRowEncoder
+from card_manager.api.serializers import CardSerializer, DeckSerializer
+from card_manager.models import Card, Deck
+
+WHEN = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+# ---------------------------
+# Encoder Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize(
+    "encoder, serializer, instance",
+    [
+        (DeckRowEncoder, DeckSerializer, Deck(id=3, deck_name="animals", date_updated=WHEN)),
+        (CardRowEncoder, CardSerializer, Card(id=5, word="dog", due_date=WHEN)),
+    ],
+)
+def test_encoder_matches_serializer(encoder, serializer, instance):
+    row = {field: getattr(instance, field) for field in encoder.fields}
+
+    assert encoder.encode_many([row]) == serializer([instance], many=True).data
+
+
+def test_encoder_keeps_field_order():
+    row = {"id": 1, "deck_name": "animals", "date_updated": WHEN}
+
+    assert list(DeckRowEncoder.encode_many([row])[0]) == DeckSerializer.Meta.fields
+
+
+def test_encoder_passes_none_through():
+    row = {"id": 1, "word": "dog", "due_date": None}
+
+    assert CardRowEncoder.encode_many([row]) == [row]
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from card_manager.api.pagination import (
+    CustomPageNumberPagination,
+    KeysetPagination,
+    KeysetPaginationMixin,
+)
+from card_manager.api.views import CardListByDeckView, DeckListView
+
+WHEN = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def make_request(query: str = "") -> Request:
+    return Request(APIRequestFactory().get(f"/api/decks/{query}"))
+
+
+# ---------------------------
+# Cursor Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_cursor_round_trip(reverse):
+    paginator = KeysetPagination(("due_date", "id"))
+    cursor = paginator._encode_cursor([WHEN, 7], reverse)
+
+    position, decoded_reverse = paginator._decode_cursor(make_request(f"?cursor={cursor}"))
+
+    assert position == [WHEN.isoformat(), 7]
+    assert decoded_reverse is reverse
+
+
+def test_cursor_keeps_microseconds():
+    paginator = KeysetPagination(("due_date", "id"))
+    cursor = paginator._encode_cursor([WHEN, 7], False)
+
+    position, _ = paginator._decode_cursor(make_request(f"?cursor={cursor}"))
+
+    assert datetime.fromisoformat(position[0]) == WHEN
+
+
+def test_no_cursor_is_first_page():
+    assert KeysetPagination(("id",))._decode_cursor(make_request()) == (None, False)
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "bm90IGpzb24", "eyJrIjpbMV0sInIiOmZhbHNlfQ"])
+def test_invalid_cursor_raises_not_found(cursor):
+    # the last cursor is valid JSON with a key of the wrong length
+    with pytest.raises(NotFound):
+        KeysetPagination(("due_date", "id"))._decode_cursor(make_request(f"?cursor={cursor}"))
+
+
+# ---------------------------
+# Seek Tests
+# ---------------------------
+
+
+def test_seek_ascending():
+    seek = KeysetPagination(("due_date", "id"))._seek(("due_date", "id"), [WHEN, 7])
+
+    assert seek == Q(due_date__gte=WHEN) & (Q(due_date__gt=WHEN) | Q(due_date=WHEN, id__gt=7))
+
+
+def test_seek_descending():
+    seek = KeysetPagination(("-date_updated", "-id"))._seek(("-date_updated", "-id"), [WHEN, 7])
+
+    assert seek == Q(date_updated__lte=WHEN) & (
+        Q(date_updated__lt=WHEN) | Q(date_updated=WHEN, id__lt=7)
+    )
+
+
+def test_key_reads_rows_and_instances():
+    paginator = KeysetPagination(("-date_updated", "-id"))
+
+    class Row:
+        id = 7
+        date_updated = WHEN
+
+    assert paginator._key({"id": 7, "date_updated": WHEN}) == [WHEN, 7]
+    assert paginator._key(Row()) == [WHEN, 7]
+
+
+@pytest.mark.parametrize("query, size", [("", 10), ("?page_size=25", 25), ("?page_size=0", 1),
+                                         ("?page_size=5000", 100), ("?page_size=x", 10)])
+def test_page_size_is_clamped(query, size):
+    assert KeysetPagination(("id",))._page_size(make_request(query)) == size
+
+
+# ---------------------------
+# Opt-in Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize("view_class", [DeckListView, CardListByDeckView])
+def test_views_keep_page_numbers_by_default(view_class):
+    view = view_class(request=make_request("?page=2"))
+
+    assert isinstance(view.paginator, CustomPageNumberPagination)
+
+
+@pytest.mark.parametrize(
+    "view_class, ordering",
+    [(DeckListView, ("-date_updated", "-id")), (CardListByDeckView, ("due_date", "id"))],
+)
+def test_views_opt_in_to_cursor(view_class, ordering):
+    view = view_class(request=make_request("?pagination=cursor"))
+
+    assert isinstance(view, KeysetPaginationMixin)
+    assert isinstance(view.paginator, KeysetPagination)
+    assert view.paginator.ordering == ordering
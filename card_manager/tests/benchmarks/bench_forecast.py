@@ -0,0 +1,104 @@
+"""
+Benchmark for the due-card forecast of a user with many cards.
+
+Compares reading every `Card.due_date` of the user and counting in Python with
+`DueForecast`, one grouped query over the `(deck, due_date, id)` index, for
+30-day forecasts of a user with 100k cards spread over 5 decks and 90 days.
+The forecasts are compared before timing.
+
+Requires the configured PostgreSQL database with migrations applied.
+Synthetic data is created inside a transaction that is rolled back at the end.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_forecast
+"""
+
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import timedelta
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from card_manager.models import Card, Deck  # noqa: E402
+from card_manager.services.forecast import DueForecast  # noqa: E402
+
+CARDS = 100_000
+DECKS = 5
+DAYS = 30
+REPEATS = 20
+
+
+def python_forecast(user, today) -> dict:
+    counts, overdue = Counter(), 0
+    for due_date in Card.objects.filter(deck__user=user).values_list("due_date", flat=True):
+        offset = (timezone.localdate(due_date) - today).days
+        if offset < 0:
+            overdue += 1
+        elif offset < DAYS:
+            counts[offset] += 1
+    return {"start": today, "overdue": overdue, "counts": [counts[i] for i in range(DAYS)]}
+
+
+def measure(func) -> list[float]:
+    latencies = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    rng = random.Random(0)
+    now = timezone.now()
+
+    with transaction.atomic():
+        user = get_user_model().objects.create(username="bench_forecast")
+        decks = Deck.objects.bulk_create(
+            Deck(user=user, deck_name=f"deck{index}") for index in range(DECKS)
+        )
+        Card.objects.bulk_create(
+            (
+                Card(
+                    deck=rng.choice(decks),
+                    word=f"word{index}",
+                    json_data={},
+                    due_date=now + timedelta(minutes=rng.randint(-10 * 1440, 80 * 1440)),
+                )
+                for index in range(CARDS)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Card._meta.db_table}")
+
+        today = timezone.localdate()
+        forecast = DueForecast()
+        assert python_forecast(user, today) == forecast.forecast(user, DAYS, today=today)
+
+        print(f"{'forecast':>10} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+        for name, func in (
+            ("python", lambda: python_forecast(user, today)),
+            ("grouped", lambda: forecast.forecast(user, DAYS, today=today)),
+        ):
+            latencies = measure(func)
+            print(
+                f"{name:>10} {statistics.mean(latencies):>9.2f}"
+                f" {statistics.median(latencies):>9.2f} {max(latencies):>9.2f}"
+            )
+
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
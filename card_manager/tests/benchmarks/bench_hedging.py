@@ -0,0 +1,58 @@
+"""
+Benchmark for hedged lookups against stub sources with a heavy latency tail.
+
+Every stub answers in ~20 ms, except 2% of calls that take 400 ms (a slow
+connection or server instance). Compares p50/p99 of one source with a
+HedgedWordService over two such sources. Hedging at p95 only helps tails rarer
+than 5%: if more calls are slow, the p95 itself is slow (lower `percentile`).
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_hedging
+"""
+
+import os
+import random
+import statistics
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from card_manager.services.hedging import HedgedWordService, HedgingConfig  # noqa: E402
+from card_manager.services.service import WordDataService  # noqa: E402
+
+LOOKUPS = 400
+
+
+class TailLatencySource(WordDataService):
+    def get_clean_word(self, word):
+        time.sleep(0.4 if random.random() < 0.02 else 0.02)
+        return {"word": word, "definition_by_part_of_speech": {}}
+
+
+def measure(service: WordDataService) -> list[float]:
+    latencies = []
+    for i in range(LOOKUPS):
+        start = time.perf_counter()
+        service.get_clean_word(f"word{i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    hedged = HedgedWordService(config=HedgingConfig(min_samples=20))
+    hedged.register("primary", TailLatencySource())
+    hedged.register("hedge", TailLatencySource())
+
+    print(f"{'service':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for name, service in (("single", TailLatencySource()), ("hedged", hedged)):
+        latencies = measure(service)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(f"{name:>10} {statistics.median(latencies):>9.1f} {p99:>9.1f}")
+    print(f"hedged requests: {hedged.stats['hedged']} of {LOOKUPS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark for list endpoint encoding: ModelSerializer vs `values()` row encoders.
+
+Measures rows/sec of reading and encoding one page of decks and of cards
+(query + serialization, without HTTP) at page sizes of 10, 100 and 1000, plus
+a quiz read through `QuizSampler`: Card instances with QuizCardSerializer vs
+`values()` rows with pre-rendered payloads.
+The encoded results are compared before timing.
+
+Requires the configured PostgreSQL database with migrations applied.
+Synthetic data is created inside a transaction that is rolled back at the end.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_list_encoders
+"""
+
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import transaction  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from card_manager.api.encoders import CardRowEncoder, DeckRowEncoder  # noqa: E402
+from card_manager.api.serializers import CardSerializer, DeckSerializer  # noqa: E402
+from card_manager.models import Card, Deck  # noqa: E402
+from card_manager.services.difficulty import DifficultyBuckets  # noqa: E402
+from card_manager.services.rendering import PAYLOAD_FIELDS, rows_payload  # noqa: E402
+from card_quiz.quiz_api.serializers import QuizCardSerializer  # noqa: E402
+from card_quiz.quiz_services.quiz_hermit import QuizSampler  # noqa: E402
+
+PAGE_SIZES = (10, 100, 1000)
+REPEATS = 20
+
+
+def rows_per_sec(func, rows: int) -> float:
+    return rows / min(timeit.repeat(func, number=1, repeat=REPEATS))
+
+
+def report(name: str, size: int, before, after) -> None:
+    old, new = rows_per_sec(before, size), rows_per_sec(after, size)
+    print(f"{name:>6} {size:>6} {old:>14,.0f} {new:>14,.0f} {new / old:>8.1f}x")
+
+
+def main() -> None:
+    print(f"{'list':>6} {'rows':>6} {'serializer r/s':>14} {'values r/s':>14} {'speedup':>8}")
+
+    with transaction.atomic():
+        user = get_user_model().objects.create(username="bench_list_encoders")
+        Deck.objects.bulk_create(
+            Deck(user=user, deck_name=f"deck{index}") for index in range(max(PAGE_SIZES))
+        )
+        deck = Deck.objects.filter(user=user).first()
+        cards = [
+            Card(deck=deck, word=f"word{index}", json_data={"word": f"word{index}"})
+            for index in range(max(PAGE_SIZES))
+        ]
+        for index, card in enumerate(cards):
+            card.difficulty = index % 3
+            card.render()
+        Card.objects.bulk_create(cards)
+        DifficultyBuckets().rebuild([deck.id])
+
+        decks = Deck.objects.filter(user=user).order_by("-date_updated")
+        deck_cards = Card.objects.filter(deck=deck).order_by("due_date")
+        for size in PAGE_SIZES:
+            # querysets are built per call: an evaluated queryset caches its rows
+            assert DeckSerializer(decks[:size], many=True).data == DeckRowEncoder.encode_many(
+                DeckRowEncoder.values(decks[:size])
+            )
+            report(
+                "decks",
+                size,
+                lambda: DeckSerializer(decks[:size], many=True).data,
+                lambda: DeckRowEncoder.encode_many(DeckRowEncoder.values(decks[:size])),
+            )
+            report(
+                "cards",
+                size,
+                lambda: CardSerializer(deck_cards[:size], many=True).data,
+                lambda: CardRowEncoder.encode_many(CardRowEncoder.values(deck_cards[:size])),
+            )
+
+        sampler = QuizSampler()
+        report(
+            "quiz",
+            sampler.total_needed,
+            lambda: JSONRenderer().render(
+                QuizCardSerializer(sampler.sample(user, [deck.id]), many=True).data
+            ),
+            lambda: rows_payload(
+                sampler.sample(user, [deck.id], PAYLOAD_FIELDS),
+                lambda row: {"difficulty": row["quiz_difficulty"]},
+            ),
+        )
+
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for picking the next due card: legacy `show_card` lookup vs. `DueCardSelector`.
+
+Requires the configured PostgreSQL database with migrations applied.
+Synthetic decks are created inside a transaction that is rolled back at the end.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_next_card
+"""
+
+import os
+import random
+import timeit
+from datetime import timedelta
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import transaction  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from card_manager.models import Card, Deck  # noqa: E402
+from card_manager.services.study import DueCardSelector, NextCardStrategy  # noqa: E402
+
+DECK_SIZES = (100, 10_000, 1_000_000)
+DUE_SHARE = 0.3
+REPEATS = 50
+INSERT_BATCH = 10_000
+
+
+def legacy_next_card(deck_name: str, user) -> Card | None:
+    """Copy of the pre-selector `card_dealer.show_card` lookup."""
+    ids = list(
+        Card.objects.filter(
+            deck__deck_name=deck_name, deck__user=user, due_date__lte=timezone.now()
+        ).values_list("id", flat=True)
+    )
+    if not ids:
+        return None
+    return Card.objects.get(id=random.choice(ids), deck__user=user)
+
+
+def populate(deck: Deck, size: int) -> None:
+    now = timezone.now()
+    rng = random.Random(size)
+    for start in range(0, size, INSERT_BATCH):
+        Card.objects.bulk_create(
+            Card(
+                deck=deck,
+                word=f"word{index}",
+                json_data={"word": f"word{index}"},
+                due_date=now + timedelta(days=rng.uniform(-30, 30 / DUE_SHARE - 30)),
+            )
+            for index in range(start, min(start + INSERT_BATCH, size))
+        )
+
+
+def timed_ms(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEATS)) * 1000
+
+
+def main() -> None:
+    selector = DueCardSelector()
+    print(f"{'cards':>10} {'legacy ms':>12} {'random ms':>12} {'oldest ms':>12}")
+
+    with transaction.atomic():
+        user = get_user_model().objects.create(username="bench_next_card")
+        for size in DECK_SIZES:
+            deck = Deck.objects.create(user=user, deck_name=f"bench_{size}")
+            populate(deck, size)
+
+            legacy = timed_ms(lambda: legacy_next_card(deck.deck_name, user))
+            rand = timed_ms(lambda: selector.next_card(deck.deck_name, user))
+            oldest = timed_ms(
+                lambda: selector.next_card(deck.deck_name, user, NextCardStrategy.OLDEST)
+            )
+            print(f"{size:>10} {legacy:>12.2f} {rand:>12.2f} {oldest:>12.2f}")
+
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark for offline dictionary lookups.
+
+Imports a synthetic dump of 100k entries (streamed from a generator) into a
+temporary SQLite file and measures `OfflineDictionaryProvider` lookups of
+random known and unknown words.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_offline
+"""
+
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from card_manager.services.offline import (  # noqa: E402
+    OfflineDictionary,
+    OfflineDictionaryImporter,
+    OfflineDictionaryProvider,
+)
+
+WORDS = 100_000
+LOOKUPS = 20_000
+ENDPOINT = "https://api.dictionaryapi.dev/api/v2/entries/en/"
+
+
+def dump_lines():
+    for number in range(WORDS):
+        yield json.dumps(
+            {
+                "word": f"word{number}",
+                "phonetics": [{"text": f"/wɜːd{number}/"}],
+                "meanings": [
+                    {
+                        "partOfSpeech": "noun",
+                        "definitions": [{"definition": f"Definition number {number}."}] * 3,
+                    }
+                ],
+            }
+        )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dictionary.sqlite3"
+        start = time.perf_counter()
+        stats = OfflineDictionaryImporter(path).import_lines(dump_lines())
+        print(
+            f"import: {stats.entries} entries in {time.perf_counter() - start:.2f}s, "
+            f"{path.stat().st_size / 2**20:.1f} MiB"
+        )
+
+        provider = OfflineDictionaryProvider(OfflineDictionary(path))
+        print(f"{'lookup':>8} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+        for label, prefix in (("known", "word"), ("unknown", "missing")):
+            latencies = []
+            for _ in range(LOOKUPS):
+                endpoint = f"{ENDPOINT}{prefix}{random.randrange(WORDS)}"
+                start = time.perf_counter()
+                provider.get_word_data(endpoint)
+                latencies.append((time.perf_counter() - start) * 1000)
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(
+                f"{label:>8} {statistics.mean(latencies):>9.4f}"
+                f" {statistics.median(latencies):>9.4f} {p99:>9.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for parsing large multi-entry dictionary responses.
+
+Compares the two-stage pipeline (`json.loads` of the whole body, then
+DictApiValidator and DictApiParser) with StreamingDictApiParser on the raw body,
+for responses of 1 to 20 entries with 8 meanings of 30 definitions each (common
+words like "set" or "run" come close).
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_parsing
+"""
+
+import json
+import timeit
+
+from card_manager.services.parser import DictApiParser
+from card_manager.services.streaming import StreamingDictApiParser
+from card_manager.services.validator import DictApiValidator
+
+MAX_DEFINITIONS = 2
+REPEAT = 5
+
+
+def make_body(entries: int) -> bytes:
+    entry = {
+        "word": "set",
+        "phonetic": "/sɛt/",
+        "phonetics": [{"text": "/sɛt/", "audio": "https://audio.test/set.mp3"}],
+        "meanings": [
+            {
+                "partOfSpeech": f"part{meaning}",
+                "definitions": [
+                    {
+                        "definition": f"Definition {number} of the word set.",
+                        "example": "Set the table before dinner.",
+                        "synonyms": ["put", "place", "lay"],
+                        "antonyms": [],
+                    }
+                    for number in range(30)
+                ],
+            }
+            for meaning in range(8)
+        ],
+        "sourceUrls": ["https://en.wiktionary.org/wiki/set"],
+    }
+    return json.dumps([entry] * entries).encode()
+
+
+def two_stage(body: bytes):
+    response = {"data": json.loads(body), "status_code": 200}
+    DictApiValidator(response).validate_response()
+    return DictApiParser(response, MAX_DEFINITIONS).parse_word_data()
+
+
+def streaming(body: bytes):
+    response = {"data": body, "status_code": 200}
+    return StreamingDictApiParser(response, MAX_DEFINITIONS).parse_word_data()
+
+
+def main() -> None:
+    print(f"{'entries':>8} {'KiB':>7} {'two-stage us':>13} {'streaming us':>13} {'speedup':>8}")
+    for entries in (1, 5, 20):
+        body = make_body(entries)
+        assert two_stage(body) == streaming(body)
+
+        number = 2000 // entries
+        timings = [
+            min(timeit.repeat(lambda: parse(body), number=number, repeat=REPEAT)) / number * 1e6
+            for parse in (two_stage, streaming)
+        ]
+        print(
+            f"{entries:>8} {len(body) / 1024:>7.1f} {timings[0]:>13.1f} {timings[1]:>13.1f}"
+            f" {timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
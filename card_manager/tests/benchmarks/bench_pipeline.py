@@ -0,0 +1,76 @@
+"""
+Microbenchmark for the validate+parse pipelines of DictApiWordService.
+
+Runs `get_clean_word` over a stub fetcher returning an already decoded response
+(one entry, 4 meanings of 10 definitions), so only validation and parsing are
+measured: the "two_stage" pipeline (a DictApiValidator and a DictApiParser built
+per lookup, each walking the meanings) against the "validating" pipeline (one
+shared ValidatingDictApiParser, one traversal).
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_pipeline
+"""
+
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from card_manager.services.parser import DictApiParser  # noqa: E402
+from card_manager.services.service import DictApiConfig, DictApiWordService  # noqa: E402
+from card_manager.services.validator import DictApiValidator  # noqa: E402
+
+NUMBER = 20_000
+REPEAT = 5
+
+RESPONSE = {
+    "status_code": 200,
+    "data": [
+        {
+            "word": "run",
+            "phonetic": "/ɹʌn/",
+            "phonetics": [{"text": "/ɹʌn/", "audio": "https://audio.test/run.mp3"}],
+            "meanings": [
+                {
+                    "partOfSpeech": part_of_speech,
+                    "definitions": [
+                        {"definition": f"Definition {number}.", "example": "Run home."}
+                        for number in range(10)
+                    ],
+                }
+                for part_of_speech in ("verb", "noun", "adjective", "adverb")
+            ],
+        }
+    ],
+}
+
+
+class StubFetcher:
+    def get_fetched_word(self, word):
+        return RESPONSE
+
+
+def main() -> None:
+    print(f"{'pipeline':>10} {'us/lookup':>10}")
+    results = []
+    for pipeline in ("two_stage", "validating"):
+        service = DictApiWordService(
+            StubFetcher(),
+            DictApiValidator,
+            DictApiParser,
+            None,
+            DictApiConfig(pipeline=pipeline),
+        )
+        results.append(service.get_clean_word("run"))
+        timings = timeit.repeat(lambda: service.get_clean_word("run"), number=NUMBER, repeat=REPEAT)
+        best = min(timings)
+        print(f"{pipeline:>10} {best / NUMBER * 1e6:>10.2f}")
+
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark for dictionary providers against a local stub HTTP server.
+
+Compares per-request latency of `RequestsProvider` (new connection per lookup)
+and `SessionProvider` (pooled keep-alive session). The stub is plain HTTP on
+localhost, so the measured gap is the TCP handshake only; against the real
+HTTPS API the TLS handshake widens it further.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_providers
+"""
+
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from card_manager.services.providers import Provider, RequestsProvider, SessionProvider
+
+REQUESTS = 500
+BODY = json.dumps(
+    [
+        {
+            "word": "dog",
+            "meanings": [{"partOfSpeech": "noun", "definitions": [{"definition": "An animal."}]}],
+        }
+    ]
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(provider: Provider, endpoint: str) -> list[float]:
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        provider.get_word_data(endpoint)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_port}/api/v2/entries/en/dog"
+
+    print(f"{'provider':>18} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for provider in (RequestsProvider(), SessionProvider()):
+        latencies = measure(provider, endpoint)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(
+            f"{type(provider).__name__:>18} {statistics.mean(latencies):>9.3f}"
+            f" {statistics.median(latencies):>9.3f} {p99:>9.3f}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
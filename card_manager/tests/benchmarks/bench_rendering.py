@@ -0,0 +1,70 @@
+"""
+Benchmark for study/quiz response bodies: DRF serialization vs pre-rendered payloads.
+
+Encodes batches of unsaved cards with ShowCardSerializer + JSONRenderer (what
+the study endpoints did per request) and with `cards_payload` over payloads
+rendered at save time. Both produce identical bytes.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_rendering
+"""
+
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from card_manager.api.serializers import ShowCardSerializer  # noqa: E402
+from card_manager.models import Card  # noqa: E402
+from card_manager.services.rendering import cards_payload  # noqa: E402
+
+REPEAT = 5
+
+
+def make_cards(count: int) -> list[Card]:
+    cards = []
+    for number in range(count):
+        card = Card(
+            id=number + 1,
+            word=f"word{number}",
+            json_data={
+                "word": f"word{number}",
+                "phonetic": "/wɜːd/",
+                "audio": "https://audio.test/word.mp3",
+                "definitions": ["A unit of language.", "A short talk or conversation."],
+                "examples": ["Say a word.", "Can I have a word with you?"],
+            },
+        )
+        card.render()
+        cards.append(card)
+    return cards
+
+
+def serialized(cards: list[Card]) -> bytes:
+    return JSONRenderer().render(ShowCardSerializer(cards, many=True).data)
+
+
+def main() -> None:
+    print(f"{'cards':>6} {'serializer us':>14} {'pre-rendered us':>16} {'speedup':>8}")
+    for count in (1, 20, 100):
+        cards = make_cards(count)
+        assert serialized(cards) == cards_payload(cards)
+
+        number = 20_000 // count
+        timings = [
+            min(timeit.repeat(lambda: encode(cards), number=number, repeat=REPEAT)) / number * 1e6
+            for encode in (serialized, cards_payload)
+        ]
+        print(
+            f"{count:>6} {timings[0]:>14.1f} {timings[1]:>16.1f}"
+            f" {timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark for SM2 scheduling: scalar path vs. batch (columnar) path.
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_scheduling
+
+Both paths are checked for identical output before timings are reported.
+"""
+
+import random
+import timeit
+from datetime import datetime
+
+from card_manager.services.scheduling import SM2Scheduler
+
+SIZES = (1_000, 10_000, 100_000)
+REPEATS = 5
+NOW = datetime(2025, 1, 1)
+
+
+def make_columns(size: int, seed: int = 0) -> dict[str, list]:
+    rng = random.Random(seed)
+    return {
+        "repetitions": [rng.randint(0, 10) for _ in range(size)],
+        "interval": [rng.uniform(1, 200) for _ in range(size)],
+        "ef": [rng.uniform(1.3, 4.0) for _ in range(size)],
+        "quality": [rng.randint(0, 5) for _ in range(size)],
+    }
+
+
+def run_scalar(scheduler: SM2Scheduler, columns: dict[str, list]) -> list:
+    return [
+        scheduler.calculate_scheduling_data(*row, now=NOW) for row in zip(*columns.values())
+    ]
+
+
+def run_batch(scheduler: SM2Scheduler, columns: dict[str, list]) -> dict:
+    return scheduler.calculate_batch_scheduling_data(**columns, now=NOW)
+
+
+def main() -> None:
+    scheduler = SM2Scheduler()
+    print(f"{'cards':>10} {'scalar ms':>12} {'batch ms':>12} {'speedup':>9}")
+
+    for size in SIZES:
+        columns = make_columns(size)
+
+        batch = run_batch(scheduler, columns)
+        for index, scalar in enumerate(run_scalar(scheduler, columns)):
+            assert all(batch[field][index] == value for field, value in scalar.items())
+
+        scalar_s = min(
+            timeit.repeat(lambda: run_scalar(scheduler, columns), number=1, repeat=REPEATS)
+        )
+        batch_s = min(
+            timeit.repeat(lambda: run_batch(scheduler, columns), number=1, repeat=REPEATS)
+        )
+        print(
+            f"{size:>10} {scalar_s * 1000:>12.2f} {batch_s * 1000:>12.2f}"
+            f" {scalar_s / batch_s:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
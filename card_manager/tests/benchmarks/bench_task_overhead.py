@@ -0,0 +1,82 @@
+"""
+Benchmark for the per-card overhead of `create_card_task` around card creation.
+
+Before: a raw socket probe of Redis and one channel layer `group_send` per card.
+After: the connections set up once per worker process (`WorkerProcess`), a
+cached Redis health check and card status events coalesced per user by the
+notification aggregator. Dictionary lookup and database work are the same in
+both and left out; the user row SELECT that the task no longer runs saves one
+database round trip per card on top of what is measured here.
+
+Requires a local Redis server (REDIS_URL, CHANNEL_LAYERS).
+
+Run from the project root:
+    python -m card_manager.tests.benchmarks.bench_task_overhead
+"""
+
+import os
+import socket
+import statistics
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "julia.settings")
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from channels.layers import get_channel_layer  # noqa: E402
+
+from card_manager.services.worker import WorkerConfig, WorkerProcess  # noqa: E402
+
+CARDS = 500
+REPEATS = 5
+GROUP = "user_bench_task_overhead"
+MESSAGE = {"status": "success", "type": "card_created", "message": "Card for 'dog' created."}
+
+
+def before() -> None:
+    for _ in range(CARDS):
+        try:
+            socket.create_connection(("localhost", 6379), timeout=2)
+        except Exception:
+            pass
+        channel_layer = get_channel_layer()
+        async_to_sync(channel_layer.group_send)(
+            GROUP, {"type": "card_status", "content": MESSAGE}
+        )
+
+
+def after() -> None:
+    for _ in range(CARDS):
+        worker = WorkerProcess.current()
+        worker.health.healthy
+        worker.notifications.send(GROUP, MESSAGE)
+    worker.notifications.flush()
+
+
+def per_card_us(func) -> list[float]:
+    runs = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        runs.append((time.perf_counter() - start) / CARDS * 1e6)
+    return runs
+
+
+def main() -> None:
+    WorkerProcess.init(WorkerConfig(db_conn_max_age=None))
+    if not WorkerProcess.current().health.healthy:
+        raise SystemExit(f"Redis is not reachable: {WorkerProcess.current().health.error}")
+
+    print(f"{'path':>8} {'mean us/card':>13} {'min us/card':>12}")
+    results = {}
+    for name, func in (("before", before), ("after", after)):
+        runs = per_card_us(func)
+        results[name] = min(runs)
+        print(f"{name:>8} {statistics.mean(runs):>13.1f} {min(runs):>12.1f}")
+    print(f"speedup {results['before'] / results['after']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
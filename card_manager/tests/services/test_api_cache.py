@@ -0,0 +1,222 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from card_manager.services.cache import WordDataCache
+from card_manager.services.fetcher import ServiceUnavailableError, WordNotFoundError
+from card_manager.services.service import AsyncDictApiWordService, DictApiWordService
+
+PARSED = {"word": "dog", "phonetic": "dɒɡ", "audio": "", "definition_by_part_of_speech": {}}
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def word_cache():
+    store = LocMemCache("word-cache-tests", {})
+    store.clear()
+    return WordDataCache(provider="test-provider", store=store, lock_ttl=5, poll_interval=0.01)
+
+
+@pytest.fixture
+def fetcher():
+    return MagicMock()
+
+
+@pytest.fixture
+def word_service(fetcher, word_cache):
+    validator = MagicMock()
+    parser = MagicMock()
+    parser.return_value.parse_word_data.return_value = PARSED
+    return DictApiWordService(fetcher, validator, parser, word_cache)
+
+
+# ---------------------------
+# WordDataCache Tests
+# ---------------------------
+
+
+def test_key_normalizes_word(word_cache):
+    assert word_cache.key("  Ice   Cream ") == "word_data:test-provider:ice cream"
+
+
+def test_miss_then_hit_counted(word_cache):
+    assert word_cache.get("dog") is None
+    word_cache.set("DOG", PARSED)
+
+    assert word_cache.get("dog") == PARSED
+    assert word_cache.stats() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+def test_negative_entry_raises(word_cache):
+    word_cache.set_not_found("qwzx")
+
+    with pytest.raises(WordNotFoundError):
+        word_cache.get("qwzx")
+
+
+# ---------------------------
+# DictApiWordService caching Tests
+# ---------------------------
+
+
+def test_service_fetches_once_per_word(word_service, fetcher):
+    assert word_service.get_clean_word("dog") == PARSED
+    assert word_service.get_clean_word("Dog") == PARSED
+
+    fetcher.get_fetched_word.assert_called_once_with("dog")
+
+
+def test_service_caches_not_found(word_service, fetcher):
+    fetcher.get_fetched_word.return_value = WordNotFoundError("Error 404 for word 'qwzx'")
+
+    for _ in range(2):
+        with pytest.raises(WordNotFoundError):
+            word_service.get_clean_word("qwzx")
+
+    fetcher.get_fetched_word.assert_called_once_with("qwzx")
+
+
+
+# ---------------------------
+# AsyncDictApiWordService caching Tests
+# ---------------------------
+
+
+def test_async_miss_then_hit_counted(word_cache):
+    async def run():
+        assert await word_cache.aget("dog") is None
+        await word_cache.aset("DOG", PARSED)
+        return await word_cache.aget("dog")
+
+    assert asyncio.run(run()) == PARSED
+    assert word_cache.stats() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+def test_async_service_caches_not_found(word_cache):
+    fetcher = AsyncMock()
+    fetcher.get_fetched_word.return_value = WordNotFoundError("Error 404 for word 'qwzx'")
+    service = AsyncDictApiWordService(fetcher, MagicMock(), MagicMock(), word_cache)
+
+    for _ in range(2):
+        with pytest.raises(WordNotFoundError):
+            asyncio.run(service.get_clean_word("qwzx"))
+
+    fetcher.get_fetched_word.assert_awaited_once_with("qwzx")
+
+
+
+# ---------------------------
+# Single-flight fill Tests
+# ---------------------------
+
+
+def slow_fetch(result, calls, delay=0.1):
+    def fetch(word):
+        calls.append(word)
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch
+
+
+def fill_concurrently(word_cache, fetch, words):
+    def run(word):
+        try:
+            return word_cache.fill(word, fetch)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(len(words)) as pool:
+        return list(pool.map(run, words))
+
+
+def test_concurrent_fills_share_one_fetch(word_cache):
+    calls = []
+
+    results = fill_concurrently(word_cache, slow_fetch(PARSED, calls), ["dog", "Dog ", "DOG"] * 3)
+
+    assert calls == [calls[0]]
+    assert results == [PARSED] * 9
+    assert word_cache.stats()["coalesced"] == 8
+
+
+def test_concurrent_fills_share_not_found(word_cache):
+    calls = []
+    fetch = slow_fetch(WordNotFoundError("Error 404"), calls)
+
+    results = fill_concurrently(word_cache, fetch, ["qwzx"] * 4)
+
+    assert len(calls) == 1
+    assert all(isinstance(result, WordNotFoundError) for result in results)
+
+
+def test_waiting_caller_takes_over_failed_fill(word_cache):
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(word):
+        with lock:
+            calls.append(word)
+            first = len(calls) == 1
+        time.sleep(0.05)
+        if first:
+            raise ServiceUnavailableError("Error 429")
+        return PARSED
+
+    results = fill_concurrently(word_cache, fetch, ["dog"] * 4)
+
+    assert len(calls) == 2
+    assert sum(isinstance(result, ServiceUnavailableError) for result in results) == 1
+    assert results.count(PARSED) == 3
+
+
+def test_fill_fetches_alone_after_lock_timeout(word_cache):
+    word_cache._lock_ttl = 0.05
+    word_cache._store.add(word_cache._lock_key("dog"), "stuck-worker", 60)
+    calls = []
+
+    assert word_cache.fill("dog", slow_fetch(PARSED, calls, delay=0)) == PARSED
+    assert calls == ["dog"]
+
+
+def test_async_concurrent_fills_share_one_fetch(word_cache):
+    calls = []
+
+    async def fetch(word):
+        calls.append(word)
+        await asyncio.sleep(0.05)
+        return PARSED
+
+    async def run():
+        return await asyncio.gather(*(word_cache.afill("dog", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == [PARSED] * 5
+    assert calls == ["dog"]
+
+
+def test_new_leader_returns_value_stored_by_previous_leader(word_cache):
+    # the previous leader stored the value and released the lock after our miss
+    word_cache.set("dog", PARSED)
+    calls = []
+
+    assert word_cache.fill("dog", slow_fetch(PARSED, calls, delay=0)) == PARSED
+    assert calls == []
+    assert word_cache.stats()["coalesced"] == 1
+
+
+def test_async_new_leader_returns_value_stored_by_previous_leader(word_cache):
+    word_cache.set("dog", PARSED)
+    fetch = AsyncMock(return_value=PARSED)
+
+    assert asyncio.run(word_cache.afill("dog", fetch)) == PARSED
+    fetch.assert_not_awaited()
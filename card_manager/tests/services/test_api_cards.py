@@ -0,0 +1,32 @@
+from card_manager.services.cards import CardDataBuilder
+
+PARSED = {
+    "word": "test",
+    "phonetic": "tɛst",
+    "audio": "https://audio.test/test.mp3",
+    "definition_by_part_of_speech": {
+        "noun": [
+            {"definition": "A procedure.", "example": None},
+            {"definition": "An exam.", "example": "She passed the test."},
+        ],
+        "verb": [{"definition": "To try.", "example": "Test it."}],
+    },
+}
+
+
+def test_builder_flattens_definitions_and_examples():
+    card_data = CardDataBuilder(max_items=2).build(PARSED)
+
+    assert card_data == {
+        "word": "test",
+        "phonetic": "tɛst",
+        "definitions": ["A procedure.", "An exam."],
+        "examples": ["She passed the test.", "Test it."],
+    }
+
+
+def test_builder_handles_missing_optional_fields():
+    card_data = CardDataBuilder().build({"word": "x", "definition_by_part_of_speech": {}})
+
+    assert card_data["phonetic"] == ""
+    assert card_data["definitions"] == []
@@ -0,0 +1,146 @@
+from collections import Counter
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from card_manager.services.daily_stats import (
+    DailyLearningCounter,
+    DailyStatsConfig,
+    LocalCounterBuffer,
+    RedisCounterBuffer,
+)
+
+TODAY = date(2025, 3, 1)
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def upsert():
+    with (
+        patch("card_manager.services.daily_stats.transaction"),
+        patch.object(DailyLearningCounter, "_upsert") as upsert,
+    ):
+        yield upsert
+
+
+@pytest.fixture
+def clock():
+    with patch("card_manager.services.daily_stats.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        yield monotonic
+
+
+# ---------------------------
+# Buffer Tests
+# ---------------------------
+
+
+def test_local_buffer_take_empties_it():
+    buffer = LocalCounterBuffer()
+    buffer.add((1, TODAY))
+    buffer.add((1, TODAY), 4)
+    buffer.add((2, TODAY))
+
+    assert buffer.pending((1, TODAY)) == 5
+    assert buffer.take() == Counter({(1, TODAY): 5, (2, TODAY): 1})
+    assert buffer.take() == Counter()
+
+
+def test_redis_buffer_increments_field():
+    client = MagicMock()
+
+    RedisCounterBuffer("daily", client).add((7, TODAY), 3)
+
+    client.hincrby.assert_called_once_with("counter_buffer:daily", "7:2025-03-01", 3)
+
+
+def test_redis_buffer_take_runs_script():
+    client = MagicMock()
+    client.register_script.return_value.return_value = [
+        b"7:2025-03-01", b"3", b"8:2025-03-01", b"1"
+    ]
+
+    deltas = RedisCounterBuffer("daily", client).take()
+
+    assert deltas == Counter({(7, TODAY): 3, (8, TODAY): 1})
+    client.register_script.return_value.assert_called_once_with(keys=["counter_buffer:daily"])
+
+
+def test_redis_buffer_pending_defaults_to_zero():
+    client = MagicMock()
+    client.hget.return_value = None
+
+    assert RedisCounterBuffer("daily", client).pending((7, TODAY)) == 0
+
+
+# ---------------------------
+# DailyLearningCounter Tests
+# ---------------------------
+
+
+def test_increment_does_not_touch_database(upsert):
+    counter = DailyLearningCounter(LocalCounterBuffer(), DailyStatsConfig(shared=False))
+
+    counter.increment(1, day=TODAY)
+
+    upsert.assert_not_called()
+
+
+def test_flush_upserts_in_batches(upsert):
+    buffer = LocalCounterBuffer()
+    counter = DailyLearningCounter(buffer, DailyStatsConfig(batch_size=2))
+    for user_id in (1, 2, 3):
+        counter.increment(user_id, amount=user_id, day=TODAY)
+
+    assert counter.flush() == 3
+    assert [call.args[0] for call in upsert.call_args_list] == [
+        [(1, TODAY, 1), (2, TODAY, 2)],
+        [(3, TODAY, 3)],
+    ]
+    assert buffer.take() == Counter()
+
+
+def test_flush_without_deltas_skips_database(upsert):
+    assert DailyLearningCounter(LocalCounterBuffer(), DailyStatsConfig()).flush() == 0
+    upsert.assert_not_called()
+
+
+def test_failed_flush_puts_deltas_back(upsert):
+    upsert.side_effect = RuntimeError("database down")
+    buffer = LocalCounterBuffer()
+    counter = DailyLearningCounter(buffer, DailyStatsConfig())
+    counter.increment(1, amount=2, day=TODAY)
+
+    with pytest.raises(RuntimeError):
+        counter.flush()
+
+    assert buffer.pending((1, TODAY)) == 2
+
+
+def test_auto_flush_when_interval_passed(upsert, clock):
+    counter = DailyLearningCounter(
+        LocalCounterBuffer(), DailyStatsConfig(flush_interval=10), auto_flush=True
+    )
+
+    counter.increment(1, day=TODAY)
+    upsert.assert_not_called()
+
+    clock.return_value = 110.0
+    counter.increment(1, day=TODAY)
+    upsert.assert_called_once_with([(1, TODAY, 2)])
+
+
+def test_count_merges_buffered_delta():
+    buffer = LocalCounterBuffer()
+    counter = DailyLearningCounter(buffer, DailyStatsConfig())
+    counter.increment(1, amount=3, day=TODAY)
+
+    with patch("card_manager.services.daily_stats.ShowCardDailyStat.objects") as objects:
+        objects.filter.return_value.values_list.return_value.first.return_value = 10
+        assert counter.count(1, day=TODAY) == 13
+        objects.filter.return_value.values_list.return_value.first.return_value = None
+        assert counter.count(1, day=TODAY) == 3
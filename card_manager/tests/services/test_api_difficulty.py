@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+import pytest
+
+from card_manager.models import Difficulty
+from card_manager.services.difficulty import (
+    DifficultyBuckets,
+    DifficultyConfig,
+    InvalidBoundariesError,
+)
+
+# ---------------------------
+# DifficultyConfig Tests
+# ---------------------------
+
+
+def test_config_rejects_unordered_boundaries():
+    with pytest.raises(InvalidBoundariesError):
+        DifficultyConfig(medium_min_ef=3.0, easy_min_ef=2.0)
+
+
+def test_config_from_settings(settings):
+    settings.CARD_DIFFICULTY = {"medium_min_ef": 1.8, "easy_min_ef": 3.0}
+    assert DifficultyConfig.from_settings() == DifficultyConfig(1.8, 3.0)
+
+
+# ---------------------------
+# DifficultyBuckets Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize(
+    "ef,expected",
+    [
+        (1.3, Difficulty.HARD),
+        (1.99, Difficulty.HARD),
+        (2.0, Difficulty.MEDIUM),
+        (3.49, Difficulty.MEDIUM),
+        (3.5, Difficulty.EASY),
+    ],
+)
+def test_classify(ef, expected):
+    assert DifficultyBuckets(DifficultyConfig()).classify(ef) == expected
+
+
+def test_moves_skip_unchanged_cards():
+    changes = DifficultyBuckets.moves([(1, 0, 1), (1, 0, 1), (2, 2, 2)])
+    assert changes == {(1, 0): -2, (1, 1): 2}
+
+
+def test_apply_one_update_per_deck():
+    with patch("card_manager.services.difficulty.Deck") as deck_model:
+        DifficultyBuckets.apply({(1, 0): -1, (1, 1): 1, (2, 2): 0})
+
+    deck_model.objects.filter.assert_called_once_with(id=1)
+    updates = deck_model.objects.filter.return_value.update.call_args.kwargs
+    assert set(updates) == {"hard_cards", "medium_cards"}
+
+
+def test_counts_rebuilds_uncounted_decks_first():
+    with patch("card_manager.services.difficulty.Deck") as deck_model, patch.object(
+        DifficultyBuckets, "rebuild"
+    ) as rebuild:
+        decks = deck_model.objects.filter.return_value
+        decks.aggregate.side_effect = [
+            {"uncounted": 1, "hard_cards": 0, "medium_cards": 0, "easy_cards": 0},
+            {"hard_cards": 3, "medium_cards": None, "easy_cards": 1},
+        ]
+        decks.filter.return_value.values_list.return_value = [2]
+
+        counts = DifficultyBuckets.counts([1, 2])
+
+    rebuild.assert_called_once_with([2])
+    assert counts == {Difficulty.HARD: 3, Difficulty.MEDIUM: 0, Difficulty.EASY: 1}
+
+
+def test_counts_of_counted_decks_take_one_query():
+    with patch("card_manager.services.difficulty.Deck") as deck_model, patch.object(
+        DifficultyBuckets, "rebuild"
+    ) as rebuild:
+        decks = deck_model.objects.filter.return_value
+        decks.aggregate.return_value = {
+            "uncounted": 0,
+            "hard_cards": 1,
+            "medium_cards": 2,
+            "easy_cards": 3,
+        }
+
+        counts = DifficultyBuckets.counts([1])
+
+    rebuild.assert_not_called()
+    assert decks.aggregate.call_count == 1
+    assert counts[Difficulty.EASY] == 3
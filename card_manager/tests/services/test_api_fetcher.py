@@ -1,9 +1,13 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 import requests
 
 from card_manager.services.fetcher import (
+    AsyncDictApiFetcher,
+    AsyncWordFetcherService,
     BadRequestError,
     DictApiErrorMapper,
     DictApiFetcher,
@@ -111,6 +115,12 @@ def test_map_exception_requests_error(word):
     assert "Network/request error" in str(result)
 
 
+def test_map_exception_httpx_error(word):
+    mapper = DictApiErrorMapper()
+    result = mapper.map_exception(word, httpx.ConnectError("Network down"))
+    assert "Network/request error" in str(result)
+
+
 def test_map_exception_generic_error(word):
     mapper = DictApiErrorMapper()
     exc = ValueError("Oops")
@@ -150,3 +160,65 @@ def test_get_word_exception_handling(word):
 
     assert isinstance(result, ExternalAPIError)
     assert "Network/request error" in str(result)
+
+
+# ---------------------------
+# Async fetcher Tests
+# ---------------------------
+
+
+@pytest.fixture
+def async_provider_mock():
+    return AsyncMock()
+
+
+def test_async_fetch_word_calls_provider(async_provider_mock, word, success_response):
+    async_provider_mock.get_word_data.return_value = success_response
+    fetcher = AsyncDictApiFetcher(provider=async_provider_mock)
+
+    response = asyncio.run(fetcher.fetch_word(word))
+
+    async_provider_mock.get_word_data.assert_awaited_once_with(
+        f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+    )
+    assert response == success_response
+
+
+@pytest.mark.parametrize(
+    "status_code,expected_exception",
+    [(400, BadRequestError), (404, WordNotFoundError), (503, ServiceUnavailableError)],
+)
+def test_async_get_fetched_word_status_error(
+    async_provider_mock, word, status_code, expected_exception
+):
+    async_provider_mock.get_word_data.return_value = ProviderResponse(
+        data={}, status_code=status_code
+    )
+    service = AsyncWordFetcherService(
+        AsyncDictApiFetcher(provider=async_provider_mock), DictApiErrorMapper()
+    )
+
+    result = asyncio.run(service.get_fetched_word(word))
+
+    assert isinstance(result, expected_exception)
+
+
+def test_async_get_fetched_word_success(async_provider_mock, word, success_response):
+    async_provider_mock.get_word_data.return_value = success_response
+    service = AsyncWordFetcherService(
+        AsyncDictApiFetcher(provider=async_provider_mock), DictApiErrorMapper()
+    )
+
+    assert asyncio.run(service.get_fetched_word(word)) == success_response
+
+
+def test_async_get_fetched_word_exception_handling(async_provider_mock, word):
+    async_provider_mock.get_word_data.side_effect = httpx.ReadTimeout("Too slow")
+    service = AsyncWordFetcherService(
+        AsyncDictApiFetcher(provider=async_provider_mock), DictApiErrorMapper()
+    )
+
+    result = asyncio.run(service.get_fetched_word(word))
+
+    assert isinstance(result, ExternalAPIError)
+    assert "Network/request error" in str(result)
@@ -0,0 +1,61 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from card_manager.services.forecast import DueForecast
+
+TODAY = date(2025, 3, 5)
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def grouped_rows():
+    """Patch Card so the grouped query returns the rows assigned to the fixture."""
+    rows = []
+    with patch("card_manager.services.forecast.Card") as card_model:
+        queryset = card_model.objects.filter.return_value
+        queryset.filter.return_value = queryset
+        grouped = queryset.annotate.return_value.values.return_value.annotate.return_value
+        grouped.order_by.return_value = rows
+        yield rows, card_model
+
+
+# ---------------------------
+# DueForecast Tests
+# ---------------------------
+
+
+def test_forecast_places_days_and_overdue(grouped_rows):
+    rows, _ = grouped_rows
+    rows.extend(
+        [
+            {"day": None, "cards": 12},
+            {"day": TODAY, "cards": 3},
+            {"day": date(2025, 3, 7), "cards": 5},
+        ]
+    )
+
+    forecast = DueForecast().forecast("user", days=4, today=TODAY)
+
+    assert forecast == {"start": TODAY, "overdue": 12, "counts": [3, 0, 5, 0]}
+
+
+def test_forecast_without_due_cards(grouped_rows):
+    assert DueForecast().forecast("user", days=2, today=TODAY) == {
+        "start": TODAY,
+        "overdue": 0,
+        "counts": [0, 0],
+    }
+
+
+def test_forecast_filters_deck_and_caps_days(grouped_rows):
+    _, card_model = grouped_rows
+
+    forecast = DueForecast().forecast("user", days=1000, deck_id=4, today=TODAY)
+
+    assert len(forecast["counts"]) == DueForecast.MAX_DAYS
+    card_model.objects.filter.return_value.filter.assert_called_once_with(deck_id=4)
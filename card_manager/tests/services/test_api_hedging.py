@@ -0,0 +1,203 @@
+import threading
+import time
+
+import pytest
+
+from card_manager.services.fetcher import (
+    ExternalAPIError,
+    ServiceUnavailableError,
+    WordNotFoundError,
+)
+from card_manager.services.hedging import HedgedWordService, HedgingConfig, LatencyTracker
+from card_manager.services.service import WordDataService
+
+# ---------------------------
+# Stub sources
+# ---------------------------
+
+
+class StubSource(WordDataService):
+    """Answers after `delay` seconds with `answer`, raising it if it is an exception."""
+
+    def __init__(self, name, delay=0.0, answer=None):
+        self.name = name
+        self.delay = delay
+        self.answer = answer if answer is not None else {"word": "dog", "source": name}
+        self.calls = 0
+        self.release = threading.Event()
+
+    def get_clean_word(self, word):
+        self.calls += 1
+        self.release.wait(self.delay)
+        if isinstance(self.answer, Exception):
+            raise self.answer
+        return self.answer
+
+
+def hedged_service(*sources, **config):
+    config = {"initial_delay": 0.05, "min_delay": 0.01, "timeout": 2, **config}
+    service = HedgedWordService(config=HedgingConfig(**config))
+    for source in sources:
+        service.register(source.name, source)
+    return service
+
+
+# ---------------------------
+# LatencyTracker Tests
+# ---------------------------
+
+
+def test_percentile_nearest_rank():
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+
+    assert tracker.percentile(95) == 0.095
+    assert tracker.percentile(50) == 0.05
+
+
+def test_percentile_uses_window():
+    tracker = LatencyTracker(window=2)
+    for seconds in (9, 1, 2):
+        tracker.record(seconds)
+
+    assert tracker.percentile(100) == 2
+
+
+def test_hedge_delay_uses_p95_after_min_samples():
+    service = hedged_service(StubSource("a"), min_samples=3, max_delay=5)
+    assert service.hedge_delay("a") == 0.05
+
+    for seconds in (0.2, 0.3, 0.4):
+        service._latencies["a"].record(seconds)
+
+    assert service.hedge_delay("a") == 0.4
+
+
+# ---------------------------
+# HedgedWordService Tests
+# ---------------------------
+
+
+def test_fast_primary_is_not_hedged():
+    primary, backup = StubSource("primary"), StubSource("backup")
+
+    result = hedged_service(primary, backup).get_clean_word("dog")
+
+    assert result["source"] == "primary"
+    assert backup.calls == 0
+
+
+def test_slow_primary_is_hedged():
+    primary, backup = StubSource("primary", delay=1), StubSource("backup")
+    service = hedged_service(primary, backup)
+
+    start = time.monotonic()
+    result = service.get_clean_word("dog")
+    elapsed = time.monotonic() - start
+    primary.release.set()
+
+    assert result["source"] == "backup"
+    assert elapsed < 0.5
+    assert service.stats["hedged"] == 1
+
+
+def test_unavailable_primary_falls_back_immediately():
+    primary = StubSource("primary", answer=ServiceUnavailableError("Error 503"))
+    backup = StubSource("backup")
+    service = hedged_service(primary, backup, initial_delay=5)
+
+    assert service.get_clean_word("dog")["source"] == "backup"
+    assert service.stats["fallbacks"] == 1
+
+
+def test_word_not_found_is_an_answer():
+    primary = StubSource("primary", answer=WordNotFoundError("Error 404"))
+    backup = StubSource("backup")
+
+    with pytest.raises(WordNotFoundError):
+        hedged_service(primary, backup, initial_delay=5).get_clean_word("qwzx")
+    assert backup.calls == 0
+
+
+def test_all_sources_failing_raises_last_error():
+    primary = StubSource("primary", answer=ServiceUnavailableError("Error 503"))
+    backup = StubSource("backup", answer=ExternalAPIError("Network down"))
+
+    with pytest.raises(ExternalAPIError, match="Network down"):
+        hedged_service(primary, backup).get_clean_word("dog")
+
+
+def test_timeout_raises_service_unavailable():
+    primary = StubSource("primary", delay=1)
+
+    with pytest.raises(ServiceUnavailableError):
+        hedged_service(primary, timeout=0.1).get_clean_word("dog")
+    primary.release.set()
+
+
+def test_duplicate_source_name_rejected():
+    service = hedged_service(StubSource("a"))
+
+    with pytest.raises(ValueError):
+        service.register("a", StubSource("a"))
+
+
+def test_sources_sharing_an_upstream_rejected():
+    service = hedged_service()
+    service.register("api#0", StubSource("api#0"), upstream="api")
+
+    with pytest.raises(ValueError):
+        service.register("api#1", StubSource("api#1"), upstream="api")
+
+
+def test_single_source_is_not_hedged():
+    source = StubSource("primary", delay=0.1)
+    service = hedged_service(source, initial_delay=0.01)
+
+    assert service.get_clean_word("dog")["source"] == "primary"
+    assert service.stats["hedged"] == 0
+    assert source.calls == 1
+
+
+class StubProvider:
+    def __init__(self):
+        self.endpoints = []
+
+    def get_word_data(self, endpoint):
+        self.endpoints.append(endpoint)
+        return {"data": [{"word": endpoint.rsplit("/", 1)[-1]}], "status_code": 200}
+
+
+class PassValidator:
+    def __init__(self, response):
+        pass
+
+    def validate_response(self):
+        pass
+
+
+class FirstEntryParser:
+    def __init__(self, response, max_definitions):
+        self.response = response
+
+    def parse_word_data(self):
+        return self.response["data"][0]
+
+
+def test_register_provider_builds_pipeline():
+    service = hedged_service()
+    service.register_provider("stub", StubProvider(), PassValidator, FirstEntryParser)
+
+    assert service.get_clean_word("dog") == {"word": "dog"}
+
+
+def test_register_provider_reads_settings_at_call_time(settings):
+    settings.DICTIONARY_API = {"api_url": "https://mirror.test/entries/"}
+    provider = StubProvider()
+
+    service = hedged_service()
+    service.register_provider("stub", provider, PassValidator, FirstEntryParser)
+    service.get_clean_word("dog")
+
+    assert provider.endpoints[0].startswith("https://mirror.test/entries/")
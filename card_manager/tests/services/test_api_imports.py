@@ -0,0 +1,169 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from card_manager.models import Deck
+from card_manager.services.fetcher import ServiceUnavailableError, WordNotFoundError
+from card_manager.services.imports import (
+    BulkCardImporter,
+    ImportProgress,
+    WordListError,
+    parse_word_list,
+)
+
+# ---------------------------
+# parse_word_list Tests
+# ---------------------------
+
+
+def test_parse_word_list_mixed_separators():
+    text = "dog\ncat, bird;fish\tice  cream\n\n Dog \n"
+
+    assert parse_word_list(text) == ["dog", "cat", "bird", "fish", "ice cream"]
+
+
+def test_parse_word_list_csv_rows():
+    assert parse_word_list('word,note\n"apple",fruit\n') == ["word", "note", "apple", "fruit"]
+
+
+@pytest.mark.parametrize("text", ["", " \n , ;"])
+def test_parse_word_list_empty(text):
+    with pytest.raises(WordListError):
+        parse_word_list(text)
+
+
+def test_parse_word_list_too_many_words():
+    with pytest.raises(WordListError):
+        parse_word_list("a\nb\nc", max_words=2)
+
+
+def test_parse_word_list_too_long_word():
+    with pytest.raises(WordListError):
+        parse_word_list("x" * 46)
+
+
+# ---------------------------
+# ImportProgress Tests
+# ---------------------------
+
+
+def sent_types(channel_layer):
+    return [call.args[1]["content"]["type"] for call in channel_layer.group_send.await_args_list]
+
+
+def test_progress_is_aggregated():
+    channel_layer = AsyncMock()
+    progress = ImportProgress(channel_layer, "user_1", "imp", total=10, every=4, interval=60)
+
+    async def run():
+        for _ in range(10):
+            await progress.advance("created")
+
+    asyncio.run(run())
+
+    assert sent_types(channel_layer) == ["import_progress", "import_progress"]
+    last = channel_layer.group_send.await_args_list[-1].args
+    assert last[0] == "user_1"
+    assert last[1]["content"]["processed"] == 8
+    assert last[1]["content"]["message"] == "8/10 words processed"
+
+
+def test_progress_finish_sends_result():
+    channel_layer = AsyncMock()
+    progress = ImportProgress(channel_layer, "user_1", "imp", total=1)
+    result = {"import_id": "imp", "deck_name": "d", "total": 1, "created": 1}
+
+    asyncio.run(progress.finish(result))
+
+    content = channel_layer.group_send.await_args.args[1]["content"]
+    assert content["type"] == "import_finished"
+    assert content["created"] == 1
+
+
+# ---------------------------
+# BulkCardImporter Tests
+# ---------------------------
+
+
+def parsed(word):
+    return {"word": word, "definition_by_part_of_speech": {}}
+
+
+@pytest.fixture
+def word_service():
+    service = AsyncMock()
+    answers = {
+        "dog": parsed("dog"),
+        "dogs": parsed("dog"),
+        "cat": parsed("cat"),
+        "qwzx": WordNotFoundError("404"),
+        "down": ServiceUnavailableError("503"),
+    }
+
+    async def get_clean_word(word):
+        answer = answers[word]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    service.get_clean_word.side_effect = get_clean_word
+    return service
+
+
+@pytest.fixture
+def importer(word_service):
+    buckets = MagicMock()
+    buckets.classify.return_value = 0
+    importer = BulkCardImporter(word_service, buckets=buckets, chunk_size=1)
+    deck = Deck(id=7, deck_name="animals")
+    with patch.object(BulkCardImporter, "_get_deck", return_value=deck), patch.object(
+        BulkCardImporter, "existing_words", return_value={"bird"}
+    ), patch.object(BulkCardImporter, "insert", side_effect=lambda deck, cards: len(cards)):
+        yield importer
+
+
+def test_import_outcomes(importer, word_service):
+    words = ["dog", "bird", "dogs", "cat", "qwzx", "down"]
+    progress = ImportProgress(None, "user_1", "imp", total=len(words))
+
+    result = asyncio.run(importer.run(words, "animals", "user", progress))
+
+    assert result["created"] == 2
+    # "dogs" resolves to "dog": whichever of the two completes second is skipped
+    assert sorted(result["skipped"])[0] == "bird"
+    assert sorted(result["skipped"])[1] in ("dog", "dogs")
+    assert result["not_found"] == ["qwzx"]
+    assert result["failed"] == ["down"]
+    assert progress.processed == len(words)
+    assert word_service.get_clean_word.await_count == 5
+
+
+def test_import_inserts_in_chunks(importer):
+    words = ["dog", "cat"]
+    progress = ImportProgress(None, "user_1", "imp", total=len(words))
+
+    asyncio.run(importer.run(words, "animals", "user", progress))
+
+    assert BulkCardImporter.insert.call_count == 2
+
+
+def test_import_bounds_concurrency(importer, word_service):
+    in_flight = 0
+    peak = 0
+
+    async def get_clean_word(word):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return parsed(word)
+
+    word_service.get_clean_word.side_effect = get_clean_word
+    importer._concurrency = 3
+    words = [f"w{i}" for i in range(20)]
+
+    asyncio.run(importer.run(words, "d", "user", ImportProgress(None, "g", "imp", 20)))
+
+    assert peak == 3
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from card_manager.services.notifications import (
+    FrameCoalescer,
+    NotificationAggregator,
+    NotificationConfig,
+    batch_frame,
+)
+
+CREATED = {"status": "success", "type": "card_created", "message": "Card for 'dog' created."}
+EXISTS = {"status": "error", "type": "card_exists", "message": "Card 'cat' exists."}
+
+
+def make_layer():
+    layer = MagicMock()
+    layer.group_send = AsyncMock()
+    return layer
+
+
+# ---------------------------
+# batch_frame Tests
+# ---------------------------
+
+
+def test_single_event_frame_is_unchanged():
+    assert batch_frame([CREATED]) == CREATED
+
+
+def test_several_events_make_batch_frame():
+    assert batch_frame([CREATED, EXISTS]) == {"type": "batch", "events": [CREATED, EXISTS]}
+
+
+# ---------------------------
+# NotificationAggregator Tests
+# ---------------------------
+
+
+def test_aggregator_coalesces_per_group():
+    layer = make_layer()
+    aggregator = NotificationAggregator(layer, NotificationConfig(window=60))
+    aggregator.send("user_1", CREATED)
+    aggregator.send("user_1", EXISTS)
+    aggregator.send("user_2", CREATED)
+
+    layer.group_send.assert_not_called()
+    aggregator.flush()
+
+    layer.group_send.assert_any_call(
+        "user_1", {"type": "card_status_batch", "contents": [CREATED, EXISTS]}
+    )
+    layer.group_send.assert_any_call("user_2", {"type": "card_status", "content": CREATED})
+    assert layer.group_send.call_count == 2
+
+
+def test_aggregator_sends_after_window():
+    layer = make_layer()
+    aggregator = NotificationAggregator(layer, NotificationConfig(window=0.01))
+    aggregator.send("user_1", CREATED)
+
+    deadline = time.monotonic() + 2
+    while not layer.group_send.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    layer.group_send.assert_called_once_with("user_1", {"type": "card_status", "content": CREATED})
+
+
+def test_aggregator_sends_full_batch_right_away():
+    layer = make_layer()
+    aggregator = NotificationAggregator(layer, NotificationConfig(window=60, max_batch=2))
+    aggregator.send("user_1", CREATED)
+    aggregator.send("user_1", EXISTS)
+
+    layer.group_send.assert_called_once()
+
+
+def test_aggregator_survives_send_failure():
+    layer = make_layer()
+    layer.group_send.side_effect = ConnectionError("redis down")
+    aggregator = NotificationAggregator(layer, NotificationConfig(window=60))
+    aggregator.send("user_1", CREATED)
+
+    aggregator.flush()
+    aggregator.flush()  # nothing left to send
+
+    layer.group_send.assert_called_once()
+
+
+# ---------------------------
+# FrameCoalescer Tests
+# ---------------------------
+
+
+def test_coalescer_sends_one_frame_per_window():
+    send = AsyncMock()
+
+    async def run():
+        frames = FrameCoalescer(send, NotificationConfig(window=0.01))
+        await frames.add([CREATED])
+        await frames.add([EXISTS, CREATED])
+        send.assert_not_called()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    send.assert_called_once_with({"type": "batch", "events": [CREATED, EXISTS, CREATED]})
+
+
+def test_coalescer_flushes_full_batch():
+    send = AsyncMock()
+
+    async def run():
+        frames = FrameCoalescer(send, NotificationConfig(window=60, max_batch=2))
+        await frames.add([CREATED, EXISTS])
+
+    asyncio.run(run())
+
+    send.assert_called_once_with({"type": "batch", "events": [CREATED, EXISTS]})
+
+
+def test_coalescer_close_drops_pending():
+    send = AsyncMock()
+
+    async def run():
+        frames = FrameCoalescer(send, NotificationConfig(window=0.01))
+        await frames.add([CREATED])
+        frames.close()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    send.assert_not_called()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from card_manager.services.fetcher import DictApiFetcher
+from card_manager.services.offline import (
+    AsyncOfflineFirstFetcher,
+    OfflineDictionary,
+    OfflineDictionaryImporter,
+    OfflineDictionaryProvider,
+    OfflineFirstFetcher,
+)
+
+DOG_NOUN = {"word": "dog", "meanings": [{"partOfSpeech": "noun", "definitions": []}]}
+DOG_VERB = {"word": "dog", "meanings": [{"partOfSpeech": "verb", "definitions": []}]}
+ICE_CREAM = {"word": "Ice Cream", "meanings": []}
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def dump_lines():
+    return [
+        json.dumps(DOG_NOUN),
+        "",
+        "not json",
+        json.dumps([ICE_CREAM]),
+        json.dumps({"no": "word"}),
+        json.dumps(DOG_VERB),
+    ]
+
+
+@pytest.fixture
+def dictionary_path(tmp_path, dump_lines):
+    path = tmp_path / "dictionary.sqlite3"
+    OfflineDictionaryImporter(path, batch_size=2).import_lines(dump_lines)
+    return path
+
+
+@pytest.fixture
+def dictionary(dictionary_path):
+    return OfflineDictionary(dictionary_path)
+
+
+# ---------------------------
+# Importer Tests
+# ---------------------------
+
+
+def test_import_stats(tmp_path, dump_lines):
+    stats = OfflineDictionaryImporter(tmp_path / "d.sqlite3").import_lines(dump_lines)
+
+    assert (stats.entries, stats.words, stats.skipped_lines) == (3, 2, 2)
+    assert not (tmp_path / "d.sqlite3.importing").exists()
+
+
+def test_failed_import_keeps_previous_file(dictionary_path, dictionary):
+    def broken_lines():
+        yield json.dumps(DOG_NOUN)
+        raise OSError("disk read error")
+
+    with pytest.raises(OSError):
+        OfflineDictionaryImporter(dictionary_path).import_lines(broken_lines())
+
+    assert OfflineDictionary(dictionary_path).lookup("ice cream") == [ICE_CREAM]
+
+
+# ---------------------------
+# OfflineDictionary Tests
+# ---------------------------
+
+
+def test_lookup_groups_entries_in_file_order(dictionary):
+    assert dictionary.lookup("dog") == [DOG_NOUN, DOG_VERB]
+
+
+def test_lookup_normalizes_word(dictionary):
+    assert dictionary.lookup("  ICE   cream ") == [ICE_CREAM]
+
+
+def test_lookup_unknown_word(dictionary):
+    assert dictionary.lookup("cat") is None
+
+
+def test_from_settings_without_dump(settings, tmp_path):
+    settings.OFFLINE_DICTIONARY_PATH = tmp_path / "missing.sqlite3"
+
+    assert OfflineDictionary.from_settings() is None
+
+
+# ---------------------------
+# Provider and fetcher Tests
+# ---------------------------
+
+
+def test_provider_answers_like_the_api(dictionary):
+    fetcher = DictApiFetcher(OfflineDictionaryProvider(dictionary))
+
+    assert fetcher.fetch_word("dog") == {"data": [DOG_NOUN, DOG_VERB], "status_code": 200}
+    assert fetcher.fetch_word("ice%20cream")["status_code"] == 200
+    assert fetcher.fetch_word("cat")["status_code"] == 404
+
+
+def test_offline_first_fetcher_falls_back_for_missing_words(dictionary):
+    network = MagicMock()
+    network.fetch_word.return_value = {"data": [], "status_code": 200}
+    fetcher = OfflineFirstFetcher(DictApiFetcher(OfflineDictionaryProvider(dictionary)), network)
+
+    assert fetcher.fetch_word("dog")["status_code"] == 200
+    network.fetch_word.assert_not_called()
+
+    fetcher.fetch_word("cat")
+    network.fetch_word.assert_called_once_with("cat")
+
+
+def test_async_offline_first_fetcher(dictionary):
+    network = AsyncMock()
+    network.fetch_word.return_value = {"data": [], "status_code": 404}
+    offline = DictApiFetcher(OfflineDictionaryProvider(dictionary))
+    fetcher = AsyncOfflineFirstFetcher(offline, network)
+
+    assert asyncio.run(fetcher.fetch_word("dog"))["data"] == [DOG_NOUN, DOG_VERB]
+    assert asyncio.run(fetcher.fetch_word("cat"))["status_code"] == 404
+    network.fetch_word.assert_awaited_once_with("cat")
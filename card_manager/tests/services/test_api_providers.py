@@ -1,9 +1,18 @@
+import asyncio
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 import requests
 
-from card_manager.services.providers import Provider, RequestsProvider
+from card_manager.services.providers import (
+    AsyncProvider,
+    HttpPoolConfig,
+    HttpxAsyncProvider,
+    Provider,
+    RequestsProvider,
+    SessionProvider,
+)
 
 # ---------------------------
 # Test Provider abstract base
@@ -16,6 +25,11 @@ def test_provider_is_abstract():
         Provider()
 
 
+def test_async_provider_is_abstract():
+    with pytest.raises(TypeError):
+        AsyncProvider()
+
+
 # ---------------------------
 # Test RequestsProvider
 # ---------------------------
@@ -54,3 +68,139 @@ def test_get_word_data_invalid_json(endpoint):
     with patch("card_manager.services.providers.requests.get", return_value=mock_resp):
         with pytest.raises(ValueError):
             provider.get_word_data(endpoint)
+
+
+# ---------------------------
+# Test SessionProvider
+# ---------------------------
+
+
+def test_session_provider_reuses_session(endpoint, mock_success_response):
+    provider = SessionProvider(HttpPoolConfig(connect_timeout=1, read_timeout=2))
+
+    with patch("card_manager.services.providers.requests.Session") as session_cls:
+        session_cls.return_value.get.return_value = mock_success_response
+        provider.get_word_data(endpoint)
+        response = provider.get_word_data(endpoint)
+
+    session_cls.assert_called_once()
+    session_cls.return_value.get.assert_called_with(endpoint, timeout=(1, 2))
+    assert response == {"data": {"word": "example"}, "status_code": 200}
+
+
+def test_session_provider_raw_mode(endpoint, mock_success_response):
+    mock_success_response.content = b'[{"word": "example"}]'
+    provider = SessionProvider(raw=True)
+
+    with patch("card_manager.services.providers.requests.Session") as session_cls:
+        session_cls.return_value.get.return_value = mock_success_response
+        response = provider.get_word_data(endpoint)
+
+    assert response == {"data": b'[{"word": "example"}]', "status_code": 200}
+    mock_success_response.json.assert_not_called()
+
+
+def test_session_provider_recreates_session_after_fork(endpoint, mock_success_response):
+    provider = SessionProvider()
+
+    with patch("card_manager.services.providers.requests.Session") as session_cls, patch(
+        "card_manager.services.providers.os.getpid", side_effect=[1, 2, 2]
+    ):
+        session_cls.return_value.get.return_value = mock_success_response
+        provider.get_word_data(endpoint)
+        provider.get_word_data(endpoint)
+
+    assert session_cls.call_count == 2
+
+
+def test_session_provider_pool_settings():
+    config = HttpPoolConfig(pool_size=25, retries=5)
+    session = SessionProvider(config)._create_session()
+
+    adapter = session.get_adapter("https://api.dictionaryapi.dev/")
+    assert adapter._pool_maxsize == 25
+    assert adapter.max_retries.total == 5
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+# ---------------------------
+# Test HttpxAsyncProvider
+# ---------------------------
+
+
+def test_async_provider_returns_provider_response(endpoint):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"word": "example"}))
+    provider = HttpxAsyncProvider(transport=transport)
+
+    response = asyncio.run(provider.get_word_data(endpoint))
+
+    assert response == {"data": {"word": "example"}, "status_code": 200}
+
+
+def test_async_provider_raw_mode(endpoint):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"[]"))
+    provider = HttpxAsyncProvider(transport=transport, raw=True)
+
+    response = asyncio.run(provider.get_word_data(endpoint))
+
+    assert response == {"data": b"[]", "status_code": 200}
+
+
+def test_async_provider_retries_throttled_responses(endpoint):
+    statuses = iter([429, 503, 200])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+    provider = HttpxAsyncProvider(HttpPoolConfig(backoff_factor=0), transport=transport)
+
+    response = asyncio.run(provider.get_word_data(endpoint))
+
+    assert response["status_code"] == 200
+
+
+def test_async_provider_returns_last_response_when_retries_run_out(endpoint):
+    transport = httpx.MockTransport(lambda request: httpx.Response(503, json={}))
+    provider = HttpxAsyncProvider(HttpPoolConfig(retries=1, backoff_factor=0), transport=transport)
+
+    response = asyncio.run(provider.get_word_data(endpoint))
+
+    assert response["status_code"] == 503
+
+
+def test_async_provider_network_error(endpoint):
+    def raise_error(request):
+        raise httpx.ConnectError("Network down")
+
+    provider = HttpxAsyncProvider(transport=httpx.MockTransport(raise_error))
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(provider.get_word_data(endpoint))
+
+
+def test_async_provider_recreates_client_per_event_loop(endpoint):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    provider = HttpxAsyncProvider(transport=transport)
+
+    async def lookup():
+        await provider.get_word_data(endpoint)
+        return provider._client
+
+    first = asyncio.run(lookup())
+    second = asyncio.run(lookup())
+
+    assert first is not second
+
+
+def test_async_provider_aclose_closes_client(endpoint):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    provider = HttpxAsyncProvider(transport=transport)
+
+    async def lookup():
+        try:
+            await provider.get_word_data(endpoint)
+            return provider._client
+        finally:
+            await provider.aclose()
+
+    client = asyncio.run(lookup())
+
+    assert client.is_closed
+    assert provider._client is None
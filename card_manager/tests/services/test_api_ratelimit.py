@@ -0,0 +1,193 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from card_manager.services.fetcher import (
+    DictApiErrorMapper,
+    ProviderResponse,
+    ServiceUnavailableError,
+    WordFetcherService,
+)
+from card_manager.services.ratelimit import (
+    AsyncRateLimitedFetcher,
+    LocalTokenBucket,
+    RateLimitConfig,
+    RateLimitedFetcher,
+    RateLimiter,
+    RateLimitMetrics,
+    RateLimitTimeoutError,
+    RedisTokenBucket,
+)
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("card_manager.services.ratelimit.time", clock):
+        yield clock
+
+
+@pytest.fixture
+def metrics():
+    store = LocMemCache("rate-limit-tests", {})
+    store.clear()
+    return RateLimitMetrics("test-provider", store)
+
+
+# ---------------------------
+# LocalTokenBucket Tests
+# ---------------------------
+
+
+def test_bucket_allows_burst_then_queues(clock):
+    bucket = LocalTokenBucket(rate=2, burst=3)
+
+    waits = [bucket.reserve(max_wait=10) for _ in range(5)]
+
+    assert waits == [0, 0, 0, 0.5, 1.0]
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = LocalTokenBucket(rate=2, burst=2)
+    bucket.reserve(10)
+    bucket.reserve(10)
+
+    clock.now += 0.5
+
+    assert bucket.reserve(10) == 0
+    assert bucket.reserve(10) == 0.5
+
+
+def test_bucket_rejects_without_reserving(clock):
+    bucket = LocalTokenBucket(rate=1, burst=1)
+    bucket.reserve(10)
+
+    assert bucket.reserve(max_wait=0.5) is None
+    assert bucket.reserve(max_wait=1) == 1
+
+
+# ---------------------------
+# RedisTokenBucket Tests
+# ---------------------------
+
+
+def test_redis_bucket_runs_script():
+    client = MagicMock()
+    client.register_script.return_value.return_value = b"0.25"
+    bucket = RedisTokenBucket("provider", rate=4, burst=8, client=client)
+
+    assert bucket.reserve(max_wait=30) == 0.25
+    client.register_script.return_value.assert_called_once_with(
+        keys=["rate_limit:provider"], args=[4, 8, 30]
+    )
+
+
+def test_redis_bucket_rejected():
+    client = MagicMock()
+    client.register_script.return_value.return_value = b"-1"
+
+    assert RedisTokenBucket("provider", 4, 8, client).reserve(30) is None
+
+
+# ---------------------------
+# RateLimiter Tests
+# ---------------------------
+
+
+def test_limiter_sleeps_and_records_wait(clock, metrics):
+    limiter = RateLimiter(LocalTokenBucket(rate=2, burst=1), RateLimitConfig(), metrics)
+
+    limiter.acquire()
+    start = clock.now
+    assert limiter.acquire() == 0.5
+    assert clock.now - start == 0.5
+
+    stats = metrics.snapshot()
+    assert stats["acquired"] == 2
+    assert stats["delayed"] == 1
+    assert stats["avg_delay_ms"] == 500
+
+
+def test_limiter_rejects_long_queue(clock, metrics):
+    bucket = LocalTokenBucket(rate=1, burst=1)
+    limiter = RateLimiter(bucket, RateLimitConfig(max_wait=1), metrics)
+    bucket.reserve(10)
+    bucket.reserve(10)  # concurrent callers already queued for 1s
+
+    with pytest.raises(RateLimitTimeoutError):
+        limiter.acquire()
+    assert metrics.snapshot()["rejected"] == 1
+
+
+def test_timeout_is_service_unavailable():
+    assert isinstance(RateLimitTimeoutError(30), ServiceUnavailableError)
+
+
+# ---------------------------
+# Rate limited fetcher Tests
+# ---------------------------
+
+
+def test_fetcher_takes_token_and_counts_throttling(metrics):
+    inner = MagicMock()
+    inner.fetch_word.return_value = ProviderResponse(data={}, status_code=429)
+    limiter = RateLimiter(LocalTokenBucket(rate=1, burst=5), RateLimitConfig(), metrics)
+
+    response = RateLimitedFetcher(inner, limiter).fetch_word("dog")
+
+    assert response["status_code"] == 429
+    inner.fetch_word.assert_called_once_with("dog")
+    assert metrics.snapshot()["throttled"] == 1
+
+
+def test_fetcher_service_keeps_rate_limit_error_type():
+    limiter = MagicMock()
+    limiter.acquire.side_effect = RateLimitTimeoutError(30)
+    service = WordFetcherService(RateLimitedFetcher(MagicMock(), limiter), DictApiErrorMapper())
+
+    assert isinstance(service.get_fetched_word("dog"), RateLimitTimeoutError)
+
+
+def test_async_fetcher_takes_token(metrics):
+    async def fetch_word(word):
+        return ProviderResponse(data={"word": word}, status_code=200)
+
+    inner = MagicMock()
+    inner.fetch_word.side_effect = fetch_word
+    limiter = RateLimiter(LocalTokenBucket(rate=1, burst=5), RateLimitConfig(), metrics)
+
+    response = asyncio.run(AsyncRateLimitedFetcher(inner, limiter).fetch_word("dog"))
+
+    assert response["data"] == {"word": "dog"}
+    assert metrics.snapshot()["acquired"] == 1
+
+
+def test_async_acquire_reserves_off_the_event_loop(metrics):
+    class ThreadRecordingBucket(LocalTokenBucket):
+        def reserve(self, max_wait):
+            self.thread = threading.get_ident()
+            return super().reserve(max_wait)
+
+    bucket = ThreadRecordingBucket(rate=1, burst=5)
+    limiter = RateLimiter(bucket, RateLimitConfig(), metrics)
+
+    assert asyncio.run(limiter.aacquire()) == 0
+    assert bucket.thread != threading.get_ident()
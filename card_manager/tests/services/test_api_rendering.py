@@ -0,0 +1,114 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from card_manager.api.serializers import ShowCardSerializer
+from card_manager.models import Card
+from card_manager.services.rendering import (
+    RENDER_VERSION,
+    card_payload,
+    cards_payload,
+    object_payload,
+    render_card_fields,
+)
+from card_quiz.quiz_api.serializers import QuizCardSerializer
+
+CARD_DATA = {
+    "word": "café",
+    "phonetic": "/kæˈfeɪ/",
+    "audio": "",
+    "definitions": ["A small restaurant selling coffee.", 'The "drink".'],
+    "examples": [],
+}
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def card():
+    card = Card(id=7, word="café", json_data=CARD_DATA)
+    card.render()
+    return card
+
+
+# ---------------------------
+# Rendering Tests
+# ---------------------------
+
+
+def test_render_sets_current_version(card):
+    assert card.render_version == RENDER_VERSION
+    assert json.loads(b"{" + card.rendered + b"}") == {"word": "café", "json_data": CARD_DATA}
+
+
+def test_card_payload_matches_show_card_serializer(card):
+    expected = JSONRenderer().render(ShowCardSerializer(card).data)
+
+    assert card_payload(card) == expected
+
+
+def test_cards_payload_matches_quiz_card_serializer(card):
+    other = Card(id=8, word="tea", json_data={"word": "tea"})
+    card.quiz_difficulty = "hard"
+    other.quiz_difficulty = "fallback"
+    expected = JSONRenderer().render(QuizCardSerializer([card, other], many=True).data)
+
+    payload = cards_payload([card, other], lambda c: {"difficulty": c.quiz_difficulty})
+
+    assert payload == expected
+
+
+def test_outdated_render_is_rendered_on_the_fly(card):
+    card.json_data = {"word": "café", "definitions": ["edited"]}
+    card.render_version = RENDER_VERSION - 1
+
+    assert json.loads(card_payload(card))["json_data"] == card.json_data
+
+
+def test_empty_cards_payload():
+    assert cards_payload([]) == b"[]"
+
+
+def test_object_payload_matches_json_renderer(card):
+    payload = object_payload({"session_id": "s1"}, {"cards": cards_payload([card])})
+
+    expected = JSONRenderer().render(
+        {"session_id": "s1", "cards": [ShowCardSerializer(card).data]}
+    )
+    assert payload == expected
+
+
+def test_object_payload_without_head():
+    assert object_payload({}, {"cards": b"[]"}) == b'{"cards":[]}'
+    assert object_payload({}, {}) == b"{}"
+
+
+def test_render_card_fields_memoryview_from_database(card):
+    card.rendered = memoryview(render_card_fields(card.word, card.json_data))
+
+    assert json.loads(card_payload(card))["id"] == 7
+
+
+# ---------------------------
+# Card.save Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize(
+    "update_fields, expected",
+    [
+        (["ef", "due_date"], {"ef", "due_date"}),
+        (["json_data"], {"json_data", "rendered", "render_version"}),
+    ],
+)
+def test_save_rerenders_only_when_content_changes(card, update_fields, expected):
+    card.rendered = b""
+    with patch("django.db.models.Model.save") as model_save:
+        card.save(update_fields=update_fields)
+
+    assert set(model_save.call_args.kwargs["update_fields"]) == expected
+    assert bool(card.rendered) == ("json_data" in update_fields)
@@ -0,0 +1,134 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from card_manager.models import ReviewEvent, RollupPeriod
+from card_manager.services.review_stats import ReviewLog, ReviewStats, period_start
+
+WHEN = datetime(2025, 3, 5, 12, 30, tzinfo=timezone.utc)  # a Wednesday
+
+
+def make_event(quality=4, latency_ms=None, deck_id=7, reviewed_at=WHEN):
+    return ReviewEvent(
+        deck_id=deck_id,
+        card_id=1,
+        quality=quality,
+        previous_interval=1.0,
+        interval=3.0,
+        ef=2.5,
+        latency_ms=latency_ms,
+        reviewed_at=reviewed_at,
+    )
+
+
+# ---------------------------
+# period_start Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize(
+    "period, start",
+    [
+        (RollupPeriod.DAY, date(2025, 3, 5)),
+        (RollupPeriod.WEEK, date(2025, 3, 3)),
+        (RollupPeriod.MONTH, date(2025, 3, 1)),
+    ],
+)
+def test_period_start(period, start):
+    assert period_start(date(2025, 3, 5), period) == start
+
+
+# ---------------------------
+# ReviewLog Tests
+# ---------------------------
+
+
+def test_totals_sum_every_period():
+    events = [make_event(quality=5, latency_ms=900), make_event(quality=1)]
+
+    totals = ReviewLog.totals(events, "deck_id")
+
+    assert set(totals) == {
+        (7, "day", date(2025, 3, 5)),
+        (7, "week", date(2025, 3, 3)),
+        (7, "month", date(2025, 3, 1)),
+    }
+    # reviews, correct, quality_sum, ef_sum, timed_reviews, latency_ms_sum
+    assert totals[(7, "day", date(2025, 3, 5))] == [2, 1, 6, 5.0, 1, 900]
+
+
+def test_totals_split_by_owner_and_day():
+    events = [
+        make_event(deck_id=7),
+        make_event(deck_id=8),
+        make_event(deck_id=7, reviewed_at=datetime(2025, 3, 6, tzinfo=timezone.utc)),
+    ]
+
+    totals = ReviewLog.totals(events, "deck_id")
+
+    assert totals[(7, "day", date(2025, 3, 5))][0] == 1
+    assert totals[(7, "week", date(2025, 3, 3))][0] == 2
+    assert totals[(8, "month", date(2025, 3, 1))][0] == 1
+
+
+def test_record_sets_user_and_upserts_both_rollups():
+    events = [make_event()]
+
+    with (
+        patch("card_manager.services.review_stats.transaction"),
+        patch("card_manager.services.review_stats.ReviewEvent.objects") as objects,
+        patch.object(ReviewLog, "_upsert") as upsert,
+    ):
+        ReviewLog().record(SimpleNamespace(id=3), events)
+
+    objects.bulk_create.assert_called_once_with(events, batch_size=500)
+    assert events[0].user_id == 3
+    assert [call.args[1] for call in upsert.call_args_list] == ["user", "deck"]
+    assert (3, "day", date(2025, 3, 5)) in upsert.call_args_list[0].args[2]
+
+
+def test_record_without_events_writes_nothing():
+    with patch("card_manager.services.review_stats.transaction") as transaction:
+        ReviewLog().record(SimpleNamespace(id=3), [])
+
+    transaction.atomic.assert_not_called()
+
+
+# ---------------------------
+# ReviewStats Tests
+# ---------------------------
+
+
+def test_point_averages():
+    row = {
+        "start": date(2025, 3, 5),
+        "reviews": 4,
+        "correct": 3,
+        "quality_sum": 14,
+        "ef_sum": 10.0,
+        "timed_reviews": 2,
+        "latency_ms_sum": 3000,
+    }
+
+    point = ReviewStats.point(row)
+
+    assert point["accuracy"] == 0.75
+    assert point["average_quality"] == 3.5
+    assert point["average_ef"] == 2.5
+    assert point["average_latency_ms"] == 1500
+
+
+def test_point_without_timed_reviews():
+    row = {
+        "start": date(2025, 3, 5),
+        "reviews": 1,
+        "correct": 0,
+        "quality_sum": 1,
+        "ef_sum": 1.3,
+        "timed_reviews": 0,
+        "latency_ms_sum": 0,
+    }
+
+    assert ReviewStats.point(row)["average_latency_ms"] is None
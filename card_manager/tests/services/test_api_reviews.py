@@ -0,0 +1,223 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from card_manager.models import Difficulty
+from card_manager.services.difficulty import DifficultyBuckets
+from card_manager.services.reviews import (
+    CardNotFoundError,
+    CardReviewService,
+    ReviewConflictError,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CURRENT = {"repetitions": 2, "interval": 3.0, "ef": 2.5}
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def card_model():
+    """Patch Card so that `filter()` returns a chainable mock queryset."""
+    with patch("card_manager.services.reviews.Card") as card_model, patch(
+        "card_manager.services.reviews.transaction"
+    ), patch("card_manager.services.difficulty.Deck"), patch(
+        "card_manager.services.reviews.ReviewLog"
+    ):
+        queryset = card_model.objects.filter.return_value
+        queryset.values.return_value.first.side_effect = lambda: dict(
+            CURRENT, deck_id=7, difficulty=Difficulty.MEDIUM
+        )
+        queryset.update.return_value = 1
+        yield card_model
+
+
+# ---------------------------
+# submit_review Tests
+# ---------------------------
+
+
+def test_submit_review_writes_once(card_model):
+    result = CardReviewService().submit_review(1, 4, user="user", now=NOW)
+
+    queryset = card_model.objects.filter.return_value
+    queryset.update.assert_called_once_with(
+        **result, last_reviewed_at=NOW, difficulty=Difficulty.MEDIUM
+    )
+    card_model.objects.filter.assert_any_call(id=1, **CURRENT)
+    assert result["repetitions"] == 3
+    assert result["interval"] == 7.5
+
+
+def test_submit_review_retries_on_conflict(card_model):
+    card_model.objects.filter.return_value.update.side_effect = [0, 1]
+
+    CardReviewService().submit_review(1, 4, user="user", now=NOW)
+
+    assert card_model.objects.filter.return_value.update.call_count == 2
+
+
+def test_submit_review_gives_up_after_max_attempts(card_model):
+    card_model.objects.filter.return_value.update.return_value = 0
+
+    with pytest.raises(ReviewConflictError) as exc:
+        CardReviewService(max_attempts=2).submit_review(1, 4, user="user", now=NOW)
+    assert exc.value.attempts == 2
+
+
+def test_submit_review_card_not_found(card_model):
+    card_model.objects.filter.return_value.values.return_value.first.side_effect = None
+    card_model.objects.filter.return_value.values.return_value.first.return_value = None
+
+    with pytest.raises(CardNotFoundError):
+        CardReviewService().submit_review(1, 4, user="user", now=NOW)
+
+
+# ---------------------------
+# bulk_reschedule Tests
+# ---------------------------
+
+
+def test_bulk_reschedule_single_bulk_update(card_model):
+    cards = [
+        SimpleNamespace(deck_id=7, repetitions=0, interval=1.0, ef=2.5, difficulty=1)
+        for _ in range(3)
+    ]
+    buckets = MagicMock(wraps=DifficultyBuckets())
+
+    CardReviewService(batch_size=100, buckets=buckets).bulk_reschedule(cards, [5, 4, 1], now=NOW)
+
+    card_model.objects.bulk_update.assert_called_once()
+    assert [card.repetitions for card in cards] == [1, 1, 0]
+    assert all(card.due_date > NOW for card in cards)
+    assert [card.difficulty for card in cards] == [1, 1, 0]
+    buckets.apply.assert_called_once_with({(7, 1): -1, (7, 0): 1})
+
+
+def test_submit_review_logs_event(card_model):
+    log = MagicMock()
+
+    result = CardReviewService(log=log).submit_review(1, 4, user="user", now=NOW, latency_ms=1200)
+
+    user, (event,) = log.record.call_args.args
+    assert user == "user"
+    assert (event.card_id, event.deck_id, event.quality) == (1, 7, 4)
+    assert (event.previous_interval, event.interval) == (3.0, result["interval"])
+    assert (event.latency_ms, event.reviewed_at) == (1200, NOW)
+
+
+def test_bulk_reschedule_logs_when_user_given(card_model):
+    cards = [
+        SimpleNamespace(id=i, deck_id=7, repetitions=0, interval=1.0, ef=2.5, difficulty=1)
+        for i in (1, 2)
+    ]
+    log = MagicMock()
+
+    CardReviewService(log=log).bulk_reschedule(
+        cards, [5, 1], now=NOW, user="user", latencies=[800, None]
+    )
+
+    user, events = log.record.call_args.args
+    assert [(e.card_id, e.quality, e.latency_ms) for e in events] == [(1, 5, 800), (2, 1, None)]
+    assert all(e.reviewed_at == NOW for e in events)
+
+
+def test_submit_review_updates_bucket_on_move(card_model):
+    buckets = MagicMock(wraps=DifficultyBuckets())
+
+    CardReviewService(buckets=buckets).submit_review(1, 0, user="user", now=NOW)
+
+    buckets.apply.assert_called_once_with({(7, Difficulty.MEDIUM): -1, (7, Difficulty.HARD): 1})
+
+
+# ---------------------------
+# replay_reviews Tests
+# ---------------------------
+
+
+@pytest.fixture
+def logged_reviews():
+    """`(card_id, reviewed_at)` pairs in the review event log (empty by default)."""
+    logged = []
+    with patch("card_manager.services.reviews.ReviewEvent.objects") as objects:
+        objects.filter.return_value.values_list.return_value = logged
+        yield logged
+
+
+@pytest.fixture
+def stored_cards(card_model, logged_reviews):
+    """Two cards owned by the user, returned by the select_for_update query."""
+    cards = [
+        SimpleNamespace(
+            id=card_id, deck_id=7, repetitions=0, interval=1.0, ef=2.5, difficulty=1,
+            last_reviewed_at=last_reviewed_at,
+        )
+        for card_id, last_reviewed_at in ((1, None), (2, NOW))
+    ]
+    card_model.objects.select_for_update.return_value.filter.return_value = cards
+    return cards
+
+
+def test_replay_applies_in_time_order(card_model, stored_cards):
+    later = NOW + timedelta(days=1)
+    reviews = [(1, 4, later), (1, 4, NOW)]
+
+    with patch("card_manager.services.reviews.timezone.now", return_value=later):
+        outcomes = CardReviewService().replay_reviews("user", reviews)
+
+    assert [outcome["status"] for outcome in outcomes] == ["applied", "applied"]
+    assert stored_cards[0].repetitions == 2
+    assert stored_cards[0].interval == 3
+    assert stored_cards[0].last_reviewed_at == later
+    assert outcomes[0]["due_date"] == later + timedelta(days=3)
+    card_model.objects.bulk_update.assert_called_once()
+
+
+def test_replay_is_idempotent(card_model, stored_cards):
+    reviews = [(2, 4, NOW), (3, 4, NOW), (1, 4, NOW + timedelta(days=30))]
+
+    with patch("card_manager.services.reviews.timezone.now", return_value=NOW):
+        outcomes = CardReviewService().replay_reviews("user", reviews)
+
+    assert [outcome["status"] for outcome in outcomes] == ["duplicate", "not_found", "future"]
+    assert stored_cards[1].repetitions == 0
+
+
+def test_replay_reports_out_of_order_reviews_as_stale(card_model, stored_cards):
+    reviews = [(2, 4, NOW - timedelta(hours=1)), (2, 4, NOW)]
+
+    with patch("card_manager.services.reviews.timezone.now", return_value=NOW):
+        outcomes = CardReviewService().replay_reviews("user", reviews)
+
+    assert [outcome["status"] for outcome in outcomes] == ["stale", "duplicate"]
+    assert stored_cards[1].repetitions == 0
+
+
+def test_replay_retry_reports_logged_reviews_as_duplicates(
+    card_model, stored_cards, logged_reviews
+):
+    earlier = NOW - timedelta(hours=1)
+    logged_reviews.extend([(2, earlier), (2, NOW)])
+    reviews = [(2, 4, NOW - timedelta(hours=2)), (2, 4, earlier), (2, 4, NOW)]
+
+    with patch("card_manager.services.reviews.timezone.now", return_value=NOW):
+        outcomes = CardReviewService().replay_reviews("user", reviews)
+
+    assert [outcome["status"] for outcome in outcomes] == ["stale", "duplicate", "duplicate"]
+    assert stored_cards[1].repetitions == 0
+
+
+def test_replay_logs_applied_reviews_only(card_model, stored_cards):
+    log = MagicMock()
+    later = NOW + timedelta(days=1)
+    reviews = [(2, 4, NOW), (1, 3, later)]
+
+    with patch("card_manager.services.reviews.timezone.now", return_value=later):
+        CardReviewService(log=log).replay_reviews("user", reviews)
+
+    user, events = log.record.call_args.args
+    assert [(e.card_id, e.quality, e.reviewed_at) for e in events] == [(1, 3, later)]
@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from card_manager.services.scheduling import (
+    ColumnLengthError,
+    OutOfRangeError,
+    SM2Config,
+    SM2Scheduler,
+)
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def scheduler():
+    return SM2Scheduler()
+
+
+@pytest.fixture
+def random_columns():
+    rng = random.Random(42)
+    size = 1000
+    return {
+        "repetitions": [rng.randint(0, 10) for _ in range(size)],
+        "interval": [rng.uniform(1, 200) for _ in range(size)],
+        "ef": [rng.uniform(1.3, 4.0) for _ in range(size)],
+        "quality": [rng.randint(0, 5) for _ in range(size)],
+    }
+
+
+# ---------------------------
+# SM2Config Tests
+# ---------------------------
+
+
+def test_config_out_of_range():
+    with pytest.raises(OutOfRangeError):
+        SM2Config(min_ef=3.0)
+
+
+# ---------------------------
+# Scalar scheduling Tests
+# ---------------------------
+
+
+def test_low_quality_resets_progress(scheduler):
+    result = scheduler.calculate_scheduling_data(5, 30.0, 2.5, 2, now=NOW)
+
+    assert result["repetitions"] == 0
+    assert result["interval"] == 1
+    assert result["due_date"] == NOW + timedelta(days=1)
+
+
+@pytest.mark.parametrize(
+    "repetitions,expected_interval",
+    [(0, 1), (1, 3), (2, 10.0 * 2.5)],
+)
+def test_interval_progression(scheduler, repetitions, expected_interval):
+    result = scheduler.calculate_scheduling_data(repetitions, 10.0, 2.5, 4, now=NOW)
+
+    assert result["repetitions"] == repetitions + 1
+    assert result["interval"] == expected_interval
+
+
+def test_ef_never_drops_below_min(scheduler):
+    result = scheduler.calculate_scheduling_data(0, 1, 1.3, 0, now=NOW)
+    assert result["ef"] == scheduler.config.min_ef
+
+
+# ---------------------------
+# Batch scheduling Tests
+# ---------------------------
+
+
+def test_batch_is_bit_identical_to_scalar(scheduler, random_columns):
+    batch = scheduler.calculate_batch_scheduling_data(**random_columns, now=NOW)
+
+    for index, row in enumerate(zip(*random_columns.values())):
+        scalar = scheduler.calculate_scheduling_data(*row, now=NOW)
+        for field, value in scalar.items():
+            assert batch[field][index] == value
+
+
+def test_batch_empty_columns(scheduler):
+    batch = scheduler.calculate_batch_scheduling_data([], [], [], [], now=NOW)
+    assert batch == {"quality": [], "ef": [], "repetitions": [], "interval": [], "due_date": []}
+
+
+def test_batch_rejects_unequal_columns(scheduler):
+    with pytest.raises(ColumnLengthError) as exc:
+        scheduler.calculate_batch_scheduling_data([0, 1], [1.0], [2.5], [3])
+    assert exc.value.lengths["repetitions"] == 2
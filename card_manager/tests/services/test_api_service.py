@@ -1,8 +1,13 @@
 
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+from card_manager.services.fetcher import AsyncWordFetcherService, WordNotFoundError
 from card_manager.services.service import (
+    AsyncDictApiWordService,
+    DictApiConfig,
     DictApiWordService,
     WordDataService,
     DictApiModule,
@@ -10,6 +15,7 @@ from card_manager.services.service import (
     Validator,
     Parser,
 )
+from card_manager.services.validator import ResponseValidationError
 from requests.models import Response
 
 
@@ -53,14 +59,13 @@ def word_service(mock_fetcher, mock_validator, mock_parser):
         fetcher=mock_fetcher,
         validator_factory=mock_validator,
         parser_factory=mock_parser,
-        api_url="https://fake-api.com",
-        max_definitions=2
+        word_cache=None,
     )
 
 
 def test_get_word_data_calls_fetch_validator_parser(word_service, mock_fetcher, mock_validator):
     word = "apple"
-    result = word_service.get_word_data(word)
+    result = word_service.get_clean_word(word)
 
     # Fetcher called
     mock_fetcher.get_fetched_word.assert_called_once_with(word)
@@ -74,6 +79,12 @@ def test_get_word_data_calls_fetch_validator_parser(word_service, mock_fetcher,
     assert result == {"word": "test", "definitions": ["def1", "def2"]}
 
 
+def test_word_cache_is_optional(mock_fetcher, mock_validator, mock_parser):
+    service = DictApiWordService(mock_fetcher, mock_validator, mock_parser)
+
+    assert service.get_clean_word("apple") == {"word": "test", "definitions": ["def1", "def2"]}
+
+
 def test_dict_api_module_returns_service():
     """Test that DictApiModule returns a DictApiWordService instance"""
     service = DictApiModule.get_dict_service()
@@ -83,3 +94,124 @@ def test_dict_api_module_returns_service():
     assert hasattr(service, "_fetcher")
     assert hasattr(service, "_validator_factory")
     assert hasattr(service, "_parser_factory")
+
+
+# ---------------------------
+# Validating pipeline Tests
+# ---------------------------
+
+VALID_RESPONSE = {
+    "status_code": 200,
+    "data": [
+        {
+            "word": "apple",
+            "phonetics": [],
+            "meanings": [{"partOfSpeech": "noun", "definitions": [{"definition": "A fruit."}]}],
+        }
+    ],
+}
+
+
+def test_validating_pipeline_skips_factories(mock_fetcher):
+    mock_fetcher.get_fetched_word.return_value = VALID_RESPONSE
+    validator_factory, parser_factory = MagicMock(), MagicMock()
+    service = DictApiWordService(
+        mock_fetcher, validator_factory, parser_factory, None, DictApiConfig(pipeline="validating")
+    )
+
+    result = service.get_clean_word("apple")
+
+    assert result["definition_by_part_of_speech"] == {
+        "noun": [{"definition": "A fruit.", "example": None}]
+    }
+    validator_factory.assert_not_called()
+    parser_factory.assert_not_called()
+
+
+def test_validating_pipeline_raises_validation_error(mock_fetcher):
+    mock_fetcher.get_fetched_word.return_value = {"status_code": 200, "data": []}
+    service = DictApiWordService(
+        mock_fetcher, None, None, None, DictApiConfig(pipeline="validating")
+    )
+
+    with pytest.raises(ResponseValidationError, match="Response list is empty."):
+        service.get_clean_word("apple")
+
+
+def test_async_validating_pipeline(mock_async_fetcher):
+    mock_async_fetcher.get_fetched_word.return_value = VALID_RESPONSE
+    service = AsyncDictApiWordService(
+        mock_async_fetcher, None, None, None, DictApiConfig(pipeline="validating")
+    )
+
+    assert asyncio.run(service.get_clean_word("apple"))["word"] == "apple"
+
+
+def test_config_pipeline_from_settings(settings):
+    settings.DICTIONARY_API = {"pipeline": "validating", "max_definition": 3}
+
+    assert DictApiConfig.from_settings() == DictApiConfig(pipeline="validating", max_definition=3)
+
+
+def test_config_rejects_unknown_pipeline():
+    with pytest.raises(ValueError):
+        DictApiConfig(pipeline="fast")
+
+
+# ---------------------------
+# AsyncDictApiWordService Tests
+# ---------------------------
+
+
+@pytest.fixture
+def mock_async_fetcher():
+    fetcher = AsyncMock(spec=AsyncWordFetcherService)
+    fetcher.get_fetched_word.return_value = MagicMock(spec=Response)
+    return fetcher
+
+
+@pytest.fixture
+def async_word_service(mock_async_fetcher, mock_validator, mock_parser):
+    return AsyncDictApiWordService(
+        fetcher=mock_async_fetcher,
+        validator_factory=mock_validator,
+        parser_factory=mock_parser,
+        word_cache=None,
+    )
+
+
+def test_async_get_clean_word(async_word_service, mock_async_fetcher):
+    result = asyncio.run(async_word_service.get_clean_word("apple"))
+
+    mock_async_fetcher.get_fetched_word.assert_awaited_once_with("apple")
+    assert result == {"word": "test", "definitions": ["def1", "def2"]}
+
+
+def test_async_get_clean_word_raises_fetch_error(async_word_service, mock_async_fetcher):
+    mock_async_fetcher.get_fetched_word.return_value = WordNotFoundError("Error 404")
+
+    with pytest.raises(WordNotFoundError):
+        asyncio.run(async_word_service.get_clean_word("qwzx"))
+
+
+def test_async_lookups_run_concurrently(mock_validator, mock_parser):
+    in_flight = 0
+    peak = 0
+
+    async def fetch(word):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return MagicMock(spec=Response)
+
+    fetcher = AsyncMock(spec=AsyncWordFetcherService)
+    fetcher.get_fetched_word.side_effect = fetch
+    service = AsyncDictApiWordService(fetcher, mock_validator, mock_parser, None)
+
+    async def lookup_all():
+        return await asyncio.gather(*(service.get_clean_word(f"w{i}") for i in range(50)))
+
+    assert len(asyncio.run(lookup_all())) == 50
+    assert peak == 50
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from card_manager.services.parser import DictApiParser
+from card_manager.services.streaming import (
+    StatusValidator,
+    StreamingDictApiParser,
+    iter_entries,
+)
+from card_manager.services.validator import DictApiValidator, ResponseValidationError
+
+ENTRY = {
+    "word": "set",
+    "phonetic": "/sɛt/",
+    "phonetics": [{"text": "/sɛt/"}, {"text": "/sɛt/", "audio": "https://audio.test/set.mp3"}],
+    "meanings": [
+        {
+            "partOfSpeech": "verb",
+            "definitions": [
+                {"definition": "  "},
+                {"definition": "To put something down.", "example": "Set it here."},
+                {"definition": "To fix.", "example": " "},
+                {"definition": "To harden."},
+            ],
+        },
+        {"partOfSpeech": "noun", "definitions": [{"definition": "A collection."}]},
+        {"definitions": [{"definition": "Unknown part of speech."}]},
+    ],
+}
+
+# ---------------------------
+# Helpers
+# ---------------------------
+
+
+def make_response(data, status_code=200):
+    return {"data": data, "status_code": status_code}
+
+
+def two_stage(data, max_definitions=2):
+    response = make_response(data)
+    DictApiValidator(response).validate_response()
+    return DictApiParser(response, max_definitions).parse_word_data()
+
+
+def streaming(data, max_definitions=2):
+    return StreamingDictApiParser(make_response(data), max_definitions).parse_word_data()
+
+
+# ---------------------------
+# iter_entries Tests
+# ---------------------------
+
+
+def test_iter_entries_decodes_lazily():
+    entries = iter_entries(b' [ {"word": "a"} , {"word": "b"}, not json ')
+
+    assert next(entries) == {"word": "a"}
+    assert next(entries) == {"word": "b"}
+    with pytest.raises(json.JSONDecodeError):
+        next(entries)
+
+
+def test_iter_entries_empty_list():
+    assert list(iter_entries("[ ]")) == []
+
+
+def test_iter_entries_rejects_non_list_root():
+    with pytest.raises(ResponseValidationError) as e:
+        next(iter_entries(b'{"title": "No Definitions Found"}'))
+
+    assert e.value.details == {"actual_type": "dict"}
+
+
+# ---------------------------
+# StreamingDictApiParser Tests
+# ---------------------------
+
+
+@pytest.mark.parametrize("max_definitions", [0, 1, 2, 10])
+def test_same_result_as_two_stage_parsing(max_definitions):
+    body = json.dumps([ENTRY, {"word": "set", "meanings": []}]).encode()
+
+    assert streaming(body, max_definitions) == two_stage([ENTRY], max_definitions)
+
+
+def test_accepts_decoded_data():
+    assert streaming([ENTRY]) == two_stage([ENTRY])
+
+
+def test_only_first_entry_is_decoded():
+    body = json.dumps([ENTRY]).encode()[:-1] + b", {broken"
+
+    assert streaming(body)["word"] == "set"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        ["entry"],
+        [{"word": "set"}],
+        [{"word": " ", "meanings": ENTRY["meanings"]}],
+        [{"word": "set", "meanings": []}],
+        [{"word": "set", "meanings": [{"partOfSpeech": "noun"}]}],
+        [{"word": "set", "meanings": [{"definitions": [{"definition": " "}, {}]}]}],
+    ],
+)
+def test_same_errors_as_validator(data):
+    with pytest.raises(ResponseValidationError) as expected:
+        two_stage(data)
+    with pytest.raises(ResponseValidationError) as actual:
+        streaming(json.dumps(data))
+
+    assert (str(actual.value), actual.value.details) == (
+        str(expected.value),
+        expected.value.details,
+    )
+
+
+def test_invalid_json_body():
+    with pytest.raises(ResponseValidationError, match="not valid JSON"):
+        streaming(b"[{")
+
+
+def test_status_validator():
+    assert StatusValidator(make_response(b"[]")).validate_response()
+    with pytest.raises(ResponseValidationError, match="status code"):
+        StatusValidator(make_response(b"[]", 404)).validate_response()
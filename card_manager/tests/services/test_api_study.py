@@ -0,0 +1,192 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from card_manager.services.reviews import CardReviewService
+from card_manager.services.study import (
+    DueCardSelector,
+    NextCardStrategy,
+    StudySession,
+    StudySessionBusyError,
+    StudySessionNotFoundError,
+    StudySessionService,
+)
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def due_cards():
+    """Patch the due-card queryset returned by DueCardSelector.due_cards."""
+    queryset = MagicMock()
+    with patch.object(DueCardSelector, "due_cards", return_value=queryset):
+        yield queryset
+
+
+# ---------------------------
+# DueCardSelector Tests
+# ---------------------------
+
+
+def test_oldest_strategy_takes_first_row(due_cards):
+    card = DueCardSelector().next_card("animals", "user", NextCardStrategy.OLDEST)
+
+    assert card is due_cards.first.return_value
+    due_cards.__getitem__.assert_not_called()
+
+
+def test_random_strategy_reads_bounded_window(due_cards):
+    due_cards.__getitem__.return_value = ["card_a", "card_b"]
+
+    card = DueCardSelector(random_window=2).next_card("animals", "user")
+
+    due_cards.__getitem__.assert_called_once_with(slice(None, 2))
+    assert card in ("card_a", "card_b")
+
+
+def test_random_strategy_no_due_cards(due_cards):
+    due_cards.__getitem__.return_value = []
+
+    assert DueCardSelector().next_card("animals", "user") is None
+
+
+def test_due_cards_uses_indexed_ordering():
+    queryset = DueCardSelector.due_cards("animals", user=1)
+
+    assert queryset.query.order_by == ("due_date",)
+
+
+# ---------------------------
+# StudySession Tests
+# ---------------------------
+
+
+def test_session_tracks_answers_in_bitmask():
+    session = StudySession(session_id="s", user_id=1, card_ids=(10, 20, 30))
+
+    session.mark_answered(session.position(20))
+
+    assert session.is_answered(1)
+    assert not session.is_answered(0)
+    assert session.remaining == 2
+    assert session.position(99) is None
+
+
+# ---------------------------
+# StudySessionService Tests
+# ---------------------------
+
+
+@pytest.fixture
+def store():
+    return LocMemCache("study-tests", {})
+
+
+@pytest.fixture
+def user():
+    return SimpleNamespace(id=1)
+
+
+@pytest.fixture
+def session_service(store):
+    selector = MagicMock(spec=DueCardSelector)
+    selector.due_batch.return_value = [SimpleNamespace(id=10), SimpleNamespace(id=20)]
+    reviewer = MagicMock(spec=CardReviewService)
+    reviewer.bulk_reschedule.side_effect = lambda cards, qualities, **kwargs: [
+        SimpleNamespace(id=card.id, due_date=f"due-{card.id}") for card in cards
+    ]
+    with patch("card_manager.services.study.increment_daily_learning") as increment:
+        yield StudySessionService(selector=selector, reviewer=reviewer, store=store), increment
+
+
+def test_start_session_counts_whole_batch(session_service, user):
+    service, increment = session_service
+
+    session, cards = service.start("animals", user, size=2)
+
+    increment.assert_called_once_with(user, amount=2)
+    assert service.get(session.session_id, user).card_ids == (10, 20)
+    assert len(cards) == 2
+
+
+def test_answer_reports_per_item_outcomes(session_service, user):
+    service, _ = session_service
+    session, _ = service.start("animals", user, size=2)
+
+    with patch("card_manager.services.study.Card") as card_model:
+        card_model.objects.filter.return_value = [SimpleNamespace(id=10)]
+        session, results = service.answer(session.session_id, user, [(10, 4), (10, 3), (99, 4)])
+
+    assert [result["status"] for result in results] == [
+        "reviewed",
+        "already_answered",
+        "not_in_session",
+    ]
+    assert results[0]["due_date"] == "due-10"
+    assert session.remaining == 1
+
+
+def test_session_closed_when_all_answered(session_service, user):
+    service, _ = session_service
+    session, _ = service.start("animals", user, size=2)
+
+    with patch("card_manager.services.study.Card") as card_model:
+        card_model.objects.filter.return_value = [SimpleNamespace(id=10), SimpleNamespace(id=20)]
+        service.answer(session.session_id, user, [(10, 4), (20, 5)])
+
+    with pytest.raises(StudySessionNotFoundError):
+        service.get(session.session_id, user)
+
+
+def test_session_of_other_user_not_found(session_service, user):
+    service, _ = session_service
+    session, _ = service.start("animals", user, size=2)
+
+    with pytest.raises(StudySessionNotFoundError):
+        service.get(session.session_id, SimpleNamespace(id=2))
+
+
+def test_concurrent_batches_review_a_card_once(session_service, user):
+    service, _ = session_service
+    session, _ = service.start("animals", user, size=2)
+    reschedule = service._reviewer.bulk_reschedule.side_effect
+
+    def slow_reschedule(cards, qualities, **kwargs):
+        time.sleep(0.05)
+        return reschedule(cards, qualities, **kwargs)
+
+    service._reviewer.bulk_reschedule.side_effect = slow_reschedule
+    results = []
+
+    def answer():
+        results.extend(service.answer(session.session_id, user, [(10, 4)])[1])
+
+    with patch("card_manager.services.study.Card") as card_model:
+        card_model.objects.filter.side_effect = lambda id__in, **kwargs: [
+            SimpleNamespace(id=card_id) for card_id in id__in
+        ]
+        threads = [threading.Thread(target=answer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(result["status"] for result in results) == ["already_answered", "reviewed"]
+    assert service.get(session.session_id, user).remaining == 1
+
+
+def test_answer_fails_when_session_stays_locked(store, session_service, user):
+    service, _ = session_service
+    session, _ = service.start("animals", user, size=2)
+    store.add(f"study_session_lock:{session.session_id}", "other", 60)
+    service._lock_ttl, service._poll_interval = 0.1, 0.01
+
+    with pytest.raises(StudySessionBusyError):
+        service.answer(session.session_id, user, [(10, 4)])
+
@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from card_manager.services.worker import RedisHealth, WorkerConfig, WorkerProcess
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+
+@pytest.fixture
+def clock():
+    with patch("card_manager.services.worker.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        yield monotonic
+
+
+@pytest.fixture
+def process_deps():
+    """Patch the connections WorkerProcess sets up."""
+    default = SimpleNamespace(settings_dict={"CONN_MAX_AGE": 0})
+    with (
+        patch("card_manager.services.worker.connections", {"default": default}),
+        patch("card_manager.services.worker.get_channel_layer") as get_channel_layer,
+        patch("card_manager.services.worker.NotificationAggregator") as aggregator,
+        patch("card_manager.services.worker.redis.Redis.from_url") as from_url,
+    ):
+        yield SimpleNamespace(
+            database=default,
+            channel_layer=get_channel_layer.return_value,
+            notifications=aggregator.default.return_value,
+            client=from_url.return_value,
+        )
+    WorkerProcess._current = None
+
+
+# ---------------------------
+# RedisHealth Tests
+# ---------------------------
+
+
+def test_health_is_cached_within_ttl(clock):
+    client = MagicMock()
+    health = RedisHealth(client, ttl=30)
+
+    assert health.healthy
+    clock.return_value = 120.0
+    assert health.healthy
+    client.ping.assert_called_once()
+
+    clock.return_value = 131.0
+    assert health.healthy
+    assert client.ping.call_count == 2
+
+
+def test_health_records_failure(clock):
+    client = MagicMock()
+    client.ping.side_effect = redis.ConnectionError("connection refused")
+    health = RedisHealth(client, ttl=30)
+
+    assert not health.healthy
+    assert health.snapshot() == {"healthy": False, "error": "connection refused", "age": 0.0}
+
+
+def test_health_recovers(clock):
+    client = MagicMock()
+    client.ping.side_effect = [redis.ConnectionError("down"), True]
+    health = RedisHealth(client, ttl=30)
+
+    assert not health.check()
+    assert health.check()
+    assert health.error is None
+
+
+# ---------------------------
+# WorkerProcess Tests
+# ---------------------------
+
+
+def test_init_sets_up_connections_once(process_deps):
+    process = WorkerProcess.init(WorkerConfig(db_conn_max_age=60))
+
+    assert process.channel_layer is process_deps.channel_layer
+    assert process.notifications is process_deps.notifications
+    assert process.health.healthy
+    process_deps.client.ping.assert_called_once()
+    assert process_deps.database.settings_dict == {"CONN_MAX_AGE": 0}
+    assert WorkerProcess.current() is process
+
+
+def test_configure_database_keeps_connections_open(process_deps):
+    WorkerProcess.configure_database(WorkerConfig(db_conn_max_age=60))
+
+    assert process_deps.database.settings_dict["CONN_MAX_AGE"] == 60
+    assert process_deps.database.settings_dict["CONN_HEALTH_CHECKS"] is True
+
+
+def test_configure_database_keeps_settings_when_disabled(process_deps):
+    WorkerProcess.configure_database(WorkerConfig(db_conn_max_age=None))
+
+    assert process_deps.database.settings_dict == {"CONN_MAX_AGE": 0}
+
+
+def test_current_keeps_database_settings(process_deps):
+    WorkerProcess.current()
+
+    assert process_deps.database.settings_dict == {"CONN_MAX_AGE": 0}
+
+
+def test_current_sets_up_forked_process(process_deps):
+    process = WorkerProcess.init(WorkerConfig())
+    process.pid = -1  # inherited from the parent
+
+    assert WorkerProcess.current() is not process
@@ -0,0 +1,40 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from card_manager.consumers import CardProgressConsumer
+from card_manager.services.notifications import FrameCoalescer, NotificationConfig
+
+CREATED = {"status": "success", "type": "card_created", "message": "Card for 'dog' created."}
+
+
+@pytest.fixture
+def consumer():
+    consumer = CardProgressConsumer()
+    consumer.send = AsyncMock()
+    consumer.frames = FrameCoalescer(consumer.send_frame, NotificationConfig(window=0.01))
+    return consumer
+
+
+def test_card_status_event_is_sent_unchanged(consumer):
+    async def run():
+        await consumer.card_status({"type": "card_status", "content": CREATED})
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    consumer.send.assert_called_once_with(text_data=json.dumps(CREATED))
+
+
+def test_events_of_one_window_share_a_frame(consumer):
+    async def run():
+        await consumer.card_status({"type": "card_status", "content": CREATED})
+        await consumer.card_status_batch({"type": "card_status_batch", "contents": [CREATED]})
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    frame = json.loads(consumer.send.call_args.kwargs["text_data"])
+    assert frame == {"type": "batch", "events": [CREATED, CREATED]}
@@ -3,7 +3,7 @@ from card_manager.models import Card
 
 
 class QuizCardSerializer(serializers.ModelSerializer):
-    difficulty = serializers.CharField()
+    difficulty = serializers.CharField(source="quiz_difficulty")
 
     class Meta:
         model = Card
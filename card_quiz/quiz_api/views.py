@@ -3,9 +3,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from card_manager.models import Deck
-from card_quiz.quiz_services.quiz_hermit import get_quiz_cards
-
-from .serializers import QuizCardSerializer
+from card_manager.services.rendering import PAYLOAD_FIELDS, json_bytes_response, rows_payload
+from card_quiz.quiz_services.quiz_hermit import get_quiz_rows
 
 
 class QuizCardsAPIView(APIView):
@@ -30,6 +29,8 @@ class QuizCardsAPIView(APIView):
         if not user_decks:
             return Response({"error": "No valid decks found for user."}, status=404)
 
-        cards = get_quiz_cards(user, list(user_decks))
-        serializer = QuizCardSerializer(cards, many=True)
-        return Response(serializer.data)
+        rows = get_quiz_rows(user, list(user_decks), PAYLOAD_FIELDS)
+        # same body as QuizCardSerializer(cards, many=True).data, from pre-rendered payloads
+        return json_bytes_response(
+            rows_payload(rows, lambda row: {"difficulty": row["quiz_difficulty"]})
+        )
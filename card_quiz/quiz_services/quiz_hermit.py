@@ -1,48 +1,205 @@
-"""Rewrite the module. Use OOP. Use SRP and SOLID in general."""
-from card_manager.models import Card
-
-
-def get_quiz_cards(user, deck_ids):  # type hinting
-    # add docstring
-    def fetch_cards(queryset, count):
-        return list(
-            queryset.order_by("?")[
-                :count
-            ]
-        )  # returns rows in random order (SQL =>ORDER BY RANDOM())
-
-    base_qs = Card.objects.filter(deck__user=user, deck_id__in=deck_ids)
-    # + .select_related("deck")?
-
-    hard_qs = base_qs.filter(ef__gte=1.3, ef__lt=2.0)
-    medium_qs = base_qs.filter(ef__gte=2.0, ef__lt=3.5)
-    easy_qs = base_qs.filter(ef__gte=3.5)
-
-    hard_cards = fetch_cards(hard_qs, 6)
-    medium_cards = fetch_cards(medium_qs, 8)
-    easy_cards = fetch_cards(easy_qs, 6)
-
-    for card in hard_cards:
-        card.difficulty = "hard"
-    for card in medium_cards:
-        card.difficulty = "medium"
-    for card in easy_cards:
-        card.difficulty = "easy"
-
-    combined = hard_cards + medium_cards + easy_cards
-
-    # this section handles a case where it is not enough cards of specific category in the deck(s) scope
-    total_needed = 20
-    if len(combined) < total_needed:
-        already_ids = [card.id for card in combined]
-        remaining = total_needed - len(combined)
-
-        fallback_qs = base_qs.exclude(id__in=already_ids)
-        fallback_cards = fetch_cards(fallback_qs, remaining)
-        for card in fallback_cards:
-            card.difficulty = "fallback"
-
-        combined += fallback_cards
-
-    print(combined)  # logger
-    return combined
+"""
+Quiz module that samples cards of mixed difficulty for a quiz.
+
+It provides:
+- `DifficultyBucket`: a card difficulty bucket and how many of its cards a quiz needs.
+- `QuizSampler`: draws the hard/medium/easy mix (plus fallback) without ORDER BY RANDOM().
+
+Sampling takes three queries regardless of how many cards the user has:
+1. one SUM over the user's deck rows returning the size of every difficulty bucket,
+   maintained by `card_manager.services.difficulty`;
+2. one MIN/MAX of the card ids, answered from both ends of the primary key index;
+3. one UNION ALL that, for every bucket, seeks the `(deck, difficulty, id)` index
+   to a random id pivot and reads a bounded run of rows from there, wrapping
+   around to the start of the bucket when the pivot is near its end.
+The final cards are drawn at random from those runs in Python. Seeking instead
+of OFFSET keeps the cost of a run independent of the bucket size.
+
+Read-only callers can pass `fields` to get `values()` rows (dicts) instead of
+Card instances; "id" is always among the fields.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import Max, Min, QuerySet, Value
+
+from card_manager.models import Card, Difficulty
+from card_manager.services.difficulty import DifficultyBuckets
+
+logger = logging.getLogger(__name__)
+
+FALLBACK = "fallback"
+
+# a Card, or a `values()` row of one
+QuizCard = Card | dict[str, Any]
+
+
+@dataclass(frozen=True)
+class DifficultyBucket:
+    """Cards of `difficulty`; a quiz takes `quota` of them."""
+
+    difficulty: Difficulty
+    quota: int
+
+    @property
+    def label(self) -> str:
+        return self.difficulty.label
+
+
+DEFAULT_BUCKETS = (
+    DifficultyBucket(Difficulty.HARD, 6),
+    DifficultyBucket(Difficulty.MEDIUM, 8),
+    DifficultyBucket(Difficulty.EASY, 6),
+)
+
+
+class QuizSampler:
+    """Samples quiz cards from the user's decks.
+
+    Each bucket contributes up to its quota. If a bucket is short, the quiz is
+    topped up with "fallback" cards taken from the surplus of the other buckets,
+    so the quiz has `sum(quota)` cards whenever the decks hold that many.
+
+    Args:
+        buckets: Difficulty buckets and their quotas (default: 6 hard, 8 medium, 6 easy).
+        oversample: Rows read per needed card, so the random draw is not a plain id run.
+    """
+
+    def __init__(
+        self, buckets: tuple[DifficultyBucket, ...] = DEFAULT_BUCKETS, oversample: int = 3
+    ) -> None:
+        self._buckets = buckets
+        self._oversample = oversample
+
+    @property
+    def total_needed(self) -> int:
+        return sum(bucket.quota for bucket in self._buckets)
+
+    def sample(
+        self, user, deck_ids: list[int], fields: tuple[str, ...] | None = None
+    ) -> list[QuizCard]:
+        """Return quiz cards, each with a `quiz_difficulty` attribute set to its bucket label.
+
+        Args:
+            user: Owner of the decks.
+            deck_ids: Ids of decks owned by `user`.
+            fields: Return `values(*fields)` rows with a "quiz_difficulty" key instead of Cards.
+        """
+        counts = DifficultyBuckets.counts(deck_ids)
+        plan = self.plan({bucket.label: counts[bucket.difficulty] for bucket in self._buckets})
+
+        base_qs = Card.objects.filter(deck__user=user, deck_id__in=deck_ids)
+        runs = self._fetch_runs(base_qs, plan, fields)
+
+        return self.assemble(runs)
+
+    def plan(self, counts: dict[str, int]) -> dict[str, int]:
+        """Return how many cards to draw from every bucket, fallback included.
+
+        Args:
+            counts: Number of cards available in every bucket.
+        """
+        shortfall = sum(max(bucket.quota - counts[bucket.label], 0) for bucket in self._buckets)
+        return {
+            bucket.label: min(counts[bucket.label], bucket.quota + shortfall)
+            for bucket in self._buckets
+        }
+
+    def assemble(self, runs: dict[str, list[QuizCard]]) -> list[QuizCard]:
+        """Draw the final quiz from the rows read for every bucket.
+
+        Args:
+            runs: Candidate rows per bucket label.
+        """
+        chosen: list[QuizCard] = []
+        surplus: list[QuizCard] = []
+
+        for bucket in self._buckets:
+            candidates = list(runs.get(bucket.label, []))
+            random.shuffle(candidates)
+            for card in candidates[: bucket.quota]:
+                self._label(card, bucket.label)
+                chosen.append(card)
+            surplus.extend(candidates[bucket.quota :])
+
+        shortfall = self.total_needed - len(chosen)
+        for card in random.sample(surplus, min(shortfall, len(surplus))):
+            self._label(card, FALLBACK)
+            chosen.append(card)
+
+        return chosen
+
+    def _fetch_runs(
+        self,
+        base_qs: QuerySet[Card],
+        plan: dict[str, int],
+        fields: tuple[str, ...] | None = None,
+    ) -> dict[str, list[QuizCard]]:
+        """Read, in one UNION ALL query, a run of rows after a random id pivot in every bucket.
+
+        Every bucket gets two index seeks: up to `window` rows from the pivot on,
+        and up to `window` rows from the start of the bucket for the wrap-around.
+        """
+        needed = [bucket for bucket in self._buckets if plan[bucket.label]]
+        runs: dict[str, list[QuizCard]] = {bucket.label: [] for bucket in self._buckets}
+        if not needed:
+            return runs
+
+        ids = Card.objects.aggregate(low=Min("id"), high=Max("id"))
+        if ids["low"] is None:
+            return runs
+
+        parts = []
+        pivots: dict[str, int] = {}
+        windows: dict[str, int] = {}
+        for bucket in needed:
+            windows[bucket.label] = plan[bucket.label] * self._oversample
+            pivots[bucket.label] = random.randint(ids["low"], ids["high"])
+            part = base_qs.filter(difficulty=bucket.difficulty).annotate(
+                quiz_difficulty=Value(bucket.label)
+            )
+            if fields is not None:
+                part = part.values(*dict.fromkeys(("id", *fields)), "quiz_difficulty")
+            window, pivot = windows[bucket.label], pivots[bucket.label]
+            parts.append(part.filter(id__gte=pivot).order_by("id")[:window])
+            parts.append(part.filter(id__lt=pivot).order_by("id")[:window])
+
+        for card in parts[0].union(*parts[1:], all=True):
+            label = card["quiz_difficulty"] if fields is not None else card.quiz_difficulty
+            runs[label].append(card)
+
+        for label, rows in runs.items():
+            if label in pivots:
+                rows.sort(key=lambda card: self._wrapped_id(card, pivots[label]))
+                del rows[windows[label] :]
+
+        logger.debug("Quiz candidate rows per bucket: %s", {k: len(v) for k, v in runs.items()})
+        return runs
+
+    @staticmethod
+    def _wrapped_id(card: QuizCard, pivot: int) -> tuple[bool, int]:
+        """Sort key putting rows from the pivot on before the wrapped-around ones."""
+        card_id = card["id"] if isinstance(card, dict) else card.id
+        return card_id < pivot, card_id
+
+    @staticmethod
+    def _label(card: QuizCard, label: str) -> None:
+        if isinstance(card, dict):
+            card["quiz_difficulty"] = label
+        else:
+            card.quiz_difficulty = label
+
+
+def get_quiz_cards(user, deck_ids: list[int]) -> list[Card]:
+    """Return a quiz mix of the user's cards from `deck_ids`. See `QuizSampler`."""
+    return QuizSampler().sample(user, deck_ids)
+
+
+def get_quiz_rows(user, deck_ids: list[int], fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    """`get_quiz_cards` returning `values(*fields)` rows with a "quiz_difficulty" key."""
+    return QuizSampler().sample(user, deck_ids, fields)
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import pytest
+
+from card_quiz.quiz_services.quiz_hermit import FALLBACK, QuizSampler
+
+# ---------------------------
+# Helpers
+# ---------------------------
+
+
+def make_cards(prefix, count):
+    return [SimpleNamespace(id=f"{prefix}{index}") for index in range(count)]
+
+
+@pytest.fixture
+def sampler():
+    return QuizSampler()
+
+
+# ---------------------------
+# QuizSampler.plan Tests
+# ---------------------------
+
+
+def test_plan_enough_cards_in_every_bucket(sampler):
+    plan = sampler.plan({"hard": 100, "medium": 100, "easy": 100})
+    assert plan == {"hard": 6, "medium": 8, "easy": 6}
+
+
+def test_plan_overfetches_to_cover_shortfall(sampler):
+    plan = sampler.plan({"hard": 2, "medium": 100, "easy": 0})
+    assert plan == {"hard": 2, "medium": 18, "easy": 0}
+
+
+# ---------------------------
+# QuizSampler.assemble Tests
+# ---------------------------
+
+
+def test_assemble_fills_quotas(sampler):
+    runs = {
+        "hard": make_cards("h", 18),
+        "medium": make_cards("m", 24),
+        "easy": make_cards("e", 18),
+    }
+
+    cards = sampler.assemble(runs)
+
+    labels = [card.quiz_difficulty for card in cards]
+    assert (labels.count("hard"), labels.count("medium"), labels.count("easy")) == (6, 8, 6)
+    assert len({card.id for card in cards}) == 20
+
+
+def test_assemble_tops_up_with_fallback(sampler):
+    runs = {"hard": make_cards("h", 2), "medium": make_cards("m", 30), "easy": []}
+
+    cards = sampler.assemble(runs)
+
+    labels = [card.quiz_difficulty for card in cards]
+    assert len(cards) == 20
+    assert labels.count(FALLBACK) == 10
+    assert len({card.id for card in cards}) == 20
+
+
+def test_assemble_not_enough_cards_at_all(sampler):
+    runs = {"hard": make_cards("h", 1), "medium": make_cards("m", 3), "easy": []}
+
+    assert len(sampler.assemble(runs)) == 4
+
+
+def test_assemble_labels_values_rows(sampler):
+    runs = {"hard": [{"id": f"h{index}"} for index in range(8)], "medium": [], "easy": []}
+
+    rows = sampler.assemble(runs)
+
+    labels = [row["quiz_difficulty"] for row in rows]
+    assert (labels.count("hard"), labels.count(FALLBACK)) == (6, 2)
+
+
+# ---------------------------
+# QuizSampler._fetch_runs Tests
+# ---------------------------
+
+
+def test_wrapped_id_orders_rows_from_pivot_then_wrap_around():
+    rows = [{"id": card_id} for card_id in (2, 9, 5, 1, 7)]
+
+    rows.sort(key=lambda row: QuizSampler._wrapped_id(row, pivot=5))
+
+    assert [row["id"] for row in rows] == [5, 7, 9, 1, 2]
+
@@ -23,24 +23,29 @@ export function NotificationProvider({ children }) {
     const socket = new WebSocket(wsUrl, [`access-token.${accessToken}`]);
 
     socket.onopen = () => console.log('✅ WebSocket connected');
-    socket.onmessage = (event) => {
-      try {
-        const data = JSON.parse(event.data);
-        const content = data.content || data; // <- 👈 Fix here
+    const handleEvent = (content) => {
+      if (content && content.message && content.type) {
+        console.log('WebSocket message content:', content);
 
-        if (content && content.message && content.type) {
-          console.log('WebSocket message content:', content);
+        const { message, type } = content;
 
-          const { message, type } = content;
+        let notifType = 'info';
+        if (type === 'card_created' || type === 'import_finished') notifType = 'success';
+        else if (type === 'word_not_found' || type === 'exception' || type === 'import_failed')
+          notifType = 'error';
 
-          let notifType = 'info';
-          if (type === 'card_created') notifType = 'success';
-          else if (type === 'word_not_found' || type === 'exception') notifType = 'error';
+        addNotification({ message, type: notifType });
+      } else {
+        console.log('WebSocket message missing expected keys:', content);
+      }
+    };
 
-          addNotification({ message, type: notifType });
-        } else {
-          console.log('WebSocket message missing expected keys:', data);
-        }
+    socket.onmessage = (event) => {
+      try {
+        const data = JSON.parse(event.data);
+        // events coalesced by the backend arrive as {type: 'batch', events: [...]}
+        const events = data.type === 'batch' ? data.events : [data.content || data];
+        events.forEach(handleEvent);
       } catch (e) {
         console.error('WebSocket message parse error', e);
       }
@@ -185,11 +185,91 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Card difficulty buckets (used by quizzes): ef < medium_min_ef is hard,
+# medium_min_ef <= ef < easy_min_ef is medium, the rest is easy.
+# Run `manage.py rebuild_difficulty_buckets` after changing these values.
+CARD_DIFFICULTY = {
+    "medium_min_ef": 2.0,
+    "easy_min_ef": 3.5,
+}
+
+# Keep-alive connection pool used for dictionary lookups (see HttpPoolConfig)
+DICTIONARY_HTTP_POOL = {
+    "pool_size": 10,
+    "connect_timeout": 3.05,
+    "read_timeout": 10,
+    "retries": 3,
+    "backoff_factor": 0.3,
+}
+
+# Client-side token bucket for dictionary lookups (see RateLimitConfig).
+# `shared` keeps one bucket for all Celery workers in Redis.
+DICTIONARY_RATE_LIMIT = {
+    "rate": 1.5,  # requests per second
+    "burst": 10,
+    "max_wait": 30,  # seconds a lookup may queue before failing
+    "shared": True,
+}
+
+# Hedged lookups over several dictionary sources (see HedgingConfig).
+# Only used once a second upstream is registered in HedgedDictApiModule.
+DICTIONARY_HEDGING = {
+    "percentile": 95,  # hedge when a source is slower than its p95
+    "initial_delay": 1.0,  # hedge delay until a source has enough samples
+    "timeout": 30,
+}
+
+# Dictionary lookup settings (see DictApiConfig). The "validating" pipeline checks and
+# parses a response in one pass with one shared parser instead of the bound
+# validator/parser factories.
+DICTIONARY_API = {
+    "max_definition": 2,
+    "pipeline": "two_stage",
+}
+
+# Parse dictionary responses from the raw body, decoding only the first entry and
+# validating it while parsing (see card_manager.services.streaming).
+DICTIONARY_STREAMING_PARSE = True
+
+# Offline dictionary dump, imported with `manage.py import_dictionary`.
+# Lookups go to the network only for words missing from it (or if the file is absent).
+OFFLINE_DICTIONARY_PATH = BASE_DIR / "data" / "dictionary.sqlite3"
+
+# Redis server shared by Celery, channels and the cache
+REDIS_URL = "redis://127.0.0.1:6379"
+
+# Shared cache (study sessions and other cross-process state)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"{REDIS_URL}/1",
+    }
+}
+
 # Celery settings
 CELERY_BROKER_URL = "redis://localhost:6379/0"  # default Redis URL
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
+# Per worker process connection setup (see card_manager.services.worker): Redis
+# health is checked once and cached for health_ttl seconds, database connections
+# of worker processes are kept open for db_conn_max_age seconds.
+CELERY_WORKER_PROCESS = {"health_ttl": 30, "db_conn_max_age": 60}
+
+# "Cards shown today" counters are buffered in Redis and upserted in batches
+# (see card_manager.services.daily_stats); beat flushes them every flush_interval.
+DAILY_STATS_BUFFER = {"shared": True, "flush_interval": 10}
+CELERY_BEAT_SCHEDULE = {
+    "flush-daily-stats": {
+        "task": "card_manager.tasks.flush_daily_stats_task",
+        "schedule": DAILY_STATS_BUFFER["flush_interval"],
+    },
+}
+
+# Card status events are coalesced per user for `window` seconds into one
+# channel layer message and one WebSocket frame (see card_manager.services.notifications).
+NOTIFICATION_BATCHING = {"window": 0.1, "max_batch": 100}
+
 # Redis channel for WebSocket
 CHANNEL_LAYERS = {
     "default": {